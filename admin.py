@@ -18,23 +18,33 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from skale import Skale, SkaleIma
 from filelock import FileLock
 
 from core.node_config import NodeConfig
-from core.schains.process_manager import run_process_manager
+from core.schains.config.upgrade import run_config_upgrade
+from core.schains.process_manager import fetch_schains_to_monitor, run_process_manager
+from core.schains.zygote import get_shared_locks
 from core.schains.cleaner import run_cleaner
 from core.updates import soft_updates
-from core.monitoring import update_monitoring_services
+from core.monitoring import ensure_monitoring_services
+from core.startup import run_steps_concurrently, startup_profiler
 
 from tools.configs import BACKUP_RUN, INIT_LOCK_PATH, PULL_CONFIG_FOR_SCHAIN
 from tools.configs.web3 import (
     ENDPOINT, ABI_FILEPATH, STATE_FILEPATH)
 from tools.configs.ima import MAINNET_IMA_ABI_FILEPATH
+from tools.configs.schains import MONITOR_ZYGOTE
 from tools.logger import init_admin_logger
-from tools.notifications.messages import cleanup_notification_state
+from tools.notifications.messages import (
+    cleanup_notification_state,
+    start_notification_dispatcher
+)
+from tools.rpc_router import route_web3
 from tools.sgx_utils import generate_sgx_key
 from tools.wallet_utils import init_wallet
 
@@ -71,6 +81,13 @@ def monitor(skale, skale_ima, node_config):
         time.sleep(SLEEP_INTERVAL)
 
 
+def run_monitoring_update(node_ip, node_id, skale):
+    try:
+        ensure_monitoring_services(node_ip, node_id, skale)
+    except Exception:
+        logger.exception('Monitoring services update failed')
+
+
 def worker():
     node_config = NodeConfig()
     while node_config.id is None:
@@ -78,35 +95,70 @@ def worker():
         time.sleep(SLEEP_INTERVAL)
 
     wallet = init_wallet(node_config=node_config)
-    skale = Skale(ENDPOINT, ABI_FILEPATH, wallet, state_path=STATE_FILEPATH)
-    skale_ima = SkaleIma(ENDPOINT, MAINNET_IMA_ABI_FILEPATH, wallet)
+    with startup_profiler.step('contracts'), ThreadPoolExecutor(max_workers=2) as executor:
+        skale_future = executor.submit(
+            Skale, ENDPOINT, ABI_FILEPATH, wallet, state_path=STATE_FILEPATH
+        )
+        skale_ima_future = executor.submit(SkaleIma, ENDPOINT, MAINNET_IMA_ABI_FILEPATH, wallet)
+        skale, skale_ima = skale_future.result(), skale_ima_future.result()
+    route_web3(skale.web3)
+    route_web3(skale_ima.web3)
     if BACKUP_RUN:
         logger.info('Running sChains in snapshot download mode')
-    update_monitoring_services(node_config.ip, node_config.id, skale)
+    # Monitoring containers don't affect chains, no need to wait for them
+    threading.Thread(
+        target=run_monitoring_update,
+        args=(node_config.ip, node_config.id, skale),
+        name='monitoring-update',
+        daemon=True
+    ).start()
+    run_startup_config_upgrade(skale, node_config)
     monitor(skale, skale_ima, node_config)
 
 
-def init():
+def run_startup_config_upgrade(skale, node_config):
+    with startup_profiler.step('config_upgrade'):
+        try:
+            schains = fetch_schains_to_monitor(skale, node_config.id)
+            run_config_upgrade(skale, node_config, schains)
+        except Exception:
+            logger.exception('Config upgrade failed, chains will regenerate configs separately')
+
+
+def update_node_config(node_config):
+    generate_sgx_key(node_config)
     skale = Skale(ENDPOINT, ABI_FILEPATH, state_path=STATE_FILEPATH)
+    soft_updates(skale, node_config)
+
+
+def prepare_db():
+    create_tables()
+    migrate()
+    set_schains_first_run()
+    set_schains_monitor_id()
+    if BACKUP_RUN:
+        set_schains_backup_run()
+    if PULL_CONFIG_FOR_SCHAIN:
+        set_schains_sync_config_run(PULL_CONFIG_FOR_SCHAIN)
+
+
+def init():
     node_config = NodeConfig()
     init_lock = FileLock(INIT_LOCK_PATH)
     with init_lock:
-        generate_sgx_key(node_config)
-        soft_updates(skale, node_config)
-        create_tables()
-        migrate()
-        set_schains_first_run()
-        set_schains_monitor_id()
-        if BACKUP_RUN:
-            set_schains_backup_run()
-        if PULL_CONFIG_FOR_SCHAIN:
-            set_schains_sync_config_run(PULL_CONFIG_FOR_SCHAIN)
-        cleanup_notification_state()
+        run_steps_concurrently({
+            'node_config': lambda: update_node_config(node_config),
+            'db': prepare_db,
+            'notifications': cleanup_notification_state
+        })
 
 
 def main():
     try:
+        if MONITOR_ZYGOTE:
+            get_shared_locks()
         init()
+        start_notification_dispatcher()
         while True:
             worker()
             time.sleep(WORKER_RESTART_SLEEP_INTERVAL)
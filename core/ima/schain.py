@@ -20,31 +20,123 @@
 import os
 import json
 import shutil
+import hashlib
 import logging
+from importlib.metadata import version, PackageNotFoundError
+from typing import Optional
+
 from ima_predeployed.generator import generate_abi
 from core.schains.config.directory import schain_config_dir
 
-from tools.configs.ima import SCHAIN_IMA_ABI_FILEPATH, SCHAIN_IMA_ABI_FILENAME
+from tools.configs.ima import (
+    SCHAIN_IMA_ABI_FILEPATH,
+    SCHAIN_IMA_ABI_FILENAME,
+    SCHAIN_IMA_ABI_META_FILEPATH
+)
+from tools.helper import read_json, write_json_atomic
+from tools.resources import get_statsd_client
 
 
 logger = logging.getLogger(__name__)
 
+IMA_PREDEPLOYED_PACKAGE = 'ima-predeployed'
+
+
+def get_ima_predeployed_version() -> Optional[str]:
+    try:
+        return version(IMA_PREDEPLOYED_PACKAGE)
+    except PackageNotFoundError:
+        return None
+
+
+def get_file_hash(filepath: str) -> Optional[str]:
+    try:
+        with open(filepath, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def get_schain_ima_abi_meta() -> dict:
+    try:
+        return read_json(SCHAIN_IMA_ABI_META_FILEPATH)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_schain_ima_abi_current(ima_version: Optional[str]) -> bool:
+    meta = get_schain_ima_abi_meta()
+    return ima_version is not None and \
+        meta.get('version') == ima_version and \
+        meta.get('hash') == get_file_hash(SCHAIN_IMA_ABI_FILEPATH)
+
 
 def update_predeployed_ima():
     """
     Generates a new ABI for predeployed IMA using ima_predeployed library, saves the results
-    in contracts_info folder.
+    in contracts_info folder. Generation is skipped if the file was already generated
+    by the installed ima_predeployed version and was not changed since.
     """
-    logger.info(f'Going to generate a new ABI file for sChain IMA ({SCHAIN_IMA_ABI_FILEPATH})')
-    with open(SCHAIN_IMA_ABI_FILEPATH, 'w') as outfile:
-        json.dump(generate_abi(), outfile, indent=4)
+    statsd_client = get_statsd_client()
+    ima_version = get_ima_predeployed_version()
+    with statsd_client.timer('admin.ima.abi.update'):
+        if is_schain_ima_abi_current(ima_version):
+            logger.info(f'sChain IMA ABI is up to date for ima_predeployed {ima_version}')
+            statsd_client.incr('admin.ima.abi.update.skipped')
+            return
+        logger.info(f'Going to generate a new ABI file for sChain IMA ({SCHAIN_IMA_ABI_FILEPATH})')
+        # New inode, so hardlinked chain copies are never changed in place
+        write_json_atomic(SCHAIN_IMA_ABI_FILEPATH, generate_abi())
+        write_json_atomic(SCHAIN_IMA_ABI_META_FILEPATH, {
+            'version': ima_version,
+            'hash': get_file_hash(SCHAIN_IMA_ABI_FILEPATH)
+        })
+        statsd_client.incr('admin.ima.abi.update.generated')
     logger.info(f'New ABI file for sChain IMA saved: {SCHAIN_IMA_ABI_FILEPATH}')
 
 
+def get_schain_ima_abi_hash() -> Optional[str]:
+    return get_schain_ima_abi_meta().get('hash') or get_file_hash(SCHAIN_IMA_ABI_FILEPATH)
+
+
+def link_schain_ima_abi(abi_file_dest: str) -> bool:
+    tmp_dest = f'{abi_file_dest}.tmp'
+    if os.path.lexists(tmp_dest):
+        os.remove(tmp_dest)
+    try:
+        os.link(SCHAIN_IMA_ABI_FILEPATH, tmp_dest)
+    except OSError as err:
+        logger.debug(f'Hardlink to {abi_file_dest} failed: {err}')
+        return False
+    os.replace(tmp_dest, abi_file_dest)
+    return True
+
+
 def copy_schain_ima_abi(name):
+    """
+    Places sChain IMA ABI into the chain dir as a hardlink, so unchanged files cost
+    a single stat. Copies with the same content are relinked, plain copies are
+    only made when hardlinks are not possible (e.g. different filesystems).
+    """
+    statsd_client = get_statsd_client()
     abi_file_dest = get_schain_ima_abi_filepath(name)
-    logger.info(f'Copying {SCHAIN_IMA_ABI_FILEPATH} -> {abi_file_dest}')
-    shutil.copyfile(SCHAIN_IMA_ABI_FILEPATH, abi_file_dest)
+    with statsd_client.timer('admin.ima.abi.copy'):
+        if os.path.isfile(abi_file_dest):
+            if os.path.samefile(SCHAIN_IMA_ABI_FILEPATH, abi_file_dest):
+                statsd_client.incr('admin.ima.abi.copy.skipped')
+                return
+            if get_file_hash(abi_file_dest) == get_schain_ima_abi_hash():
+                link_schain_ima_abi(abi_file_dest)
+                statsd_client.incr('admin.ima.abi.copy.skipped')
+                return
+        if link_schain_ima_abi(abi_file_dest):
+            logger.info(f'Linked {SCHAIN_IMA_ABI_FILEPATH} -> {abi_file_dest}')
+        else:
+            logger.info(f'Copying {SCHAIN_IMA_ABI_FILEPATH} -> {abi_file_dest}')
+            tmp_dest = f'{abi_file_dest}.tmp'
+            shutil.copyfile(SCHAIN_IMA_ABI_FILEPATH, tmp_dest)
+            os.replace(tmp_dest, abi_file_dest)
+        statsd_client.incr('admin.ima.abi.copy.updated')
 
 
 def get_schain_ima_abi_filepath(schain_name):
@@ -18,8 +18,10 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import os
 from typing import Optional
 
+from core.startup import get_inputs_hash, run_cached_step
 from tools.helper import process_template
 from tools.docker_utils import DockerUtils, get_docker_group_id
 
@@ -120,3 +122,35 @@ def update_monitoring_services(node_ip, node_id, skale, dutils: Optional[DockerU
     update_filebeat_service(node_ip, node_id, skale, dutils=dutils)
     if TELEGRAF:
         update_telegraf_service(node_ip, node_id, dutils=dutils)
+
+
+def get_monitoring_inputs_hash(node_ip, node_id, skale) -> str:
+    templates = []
+    for path in (FILEBEAT_TEMPLATE_PATH, TELEGRAF_TEMPLATE_PATH):
+        if os.path.isfile(path):
+            with open(path) as template_file:
+                templates.append(template_file.read())
+    return get_inputs_hash(
+        node_ip, node_id, skale.manager.address, TELEGRAF, INFLUX_URL, templates
+    )
+
+
+def monitoring_services_configured(dutils: Optional[DockerUtils] = None) -> bool:
+    dutils = dutils or DockerUtils()
+    if not os.path.isfile(FILEBEAT_CONFIG_PATH) or not filebeat_config_processed():
+        return False
+    if TELEGRAF:
+        return os.path.isfile(TELEGRAF_CONFIG_PATH) and \
+            dutils.is_container_exists(TELEGRAF_CONTAINER_NAME)
+    return True
+
+
+def ensure_monitoring_services(node_ip, node_id, skale, dutils: Optional[DockerUtils] = None):
+    """ Reconfigures and restarts monitoring containers only if their inputs changed """
+    dutils = dutils or DockerUtils()
+    return run_cached_step(
+        'monitoring',
+        get_monitoring_inputs_hash(node_ip, node_id, skale),
+        lambda: update_monitoring_services(node_ip, node_id, skale, dutils=dutils),
+        outputs_present=lambda: monitoring_services_configured(dutils)
+    )
@@ -17,16 +17,18 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import json
 import hashlib
 import logging
 import os
 import platform
 import psutil
-import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 import requests
 
@@ -38,7 +40,18 @@ from skale.utils.helper import ip_from_bytes
 from skale.utils.web3_utils import public_key_to_address, to_checksum_address
 
 from core.monitoring import update_monitoring_services
-from tools.configs import WATCHDOG_PORT, CHANGE_IP_DELAY, CHECK_REPORT_PATH, META_FILEPATH
+from core.schains.leaving_history import get_leaving_entries
+from tools.configs import (
+    CHANGE_IP_DELAY,
+    CHECK_REPORT_PATH,
+    META_FILEPATH,
+    VALIDATOR_NODES_CACHE_TTL,
+    VALIDATOR_NODES_CONNECT_TIMEOUT,
+    VALIDATOR_NODES_READ_WORKERS,
+    VALIDATOR_NODES_SCAN_CONCURRENCY,
+    VALIDATOR_NODES_SCAN_DEADLINE,
+    WATCHDOG_PORT
+)
 from tools.helper import read_json
 from tools.str_formatters import arguments_list_string
 from tools.wallet_utils import check_required_balance
@@ -199,17 +212,14 @@ class Node:
             }
             for schain in active_schains
         ]
-        rotated_schains = self.skale.node_rotation.get_leaving_history(
-            self.config.id)
+        leaving_entries = get_leaving_entries(self.skale, self.config.id)
         current_time = time.time()
-        for schain in rotated_schains:
-            if current_time > schain['finished_rotation']:
+        for entry in leaving_entries:
+            if current_time > entry.finished_rotation:
                 status = SchainExitStatus.LEFT
             else:
                 status = SchainExitStatus.LEAVING
-            schain_name = self.skale.schains.get(schain['schain_id']).name
-            if not schain_name:
-                schain_name = '[REMOVED]'
+            schain_name = entry.name or '[REMOVED]'
             schain_statuses.append(
                 {'name': schain_name, 'status': status.name}
             )
@@ -375,19 +385,62 @@ class ManagerNodeInfo(TypedDict):
     domain_name: str
 
 
-class ExtendedManagerNodeInfo(ManagerNodeInfo):
-    ip_change_ts: int
+class ExtendedManagerNodeInfo:
+    """
+    Fields of ManagerNodeInfo used by sChain monitors plus ip_change_ts.
+    Kept in slots instead of the full node dict, item access is preserved.
+    """
+    __slots__ = ('id', 'name', 'ip', 'publicIP', 'port', 'ip_change_ts')
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        ip: str,
+        publicIP: str,
+        port: int,
+        ip_change_ts: int
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.ip = ip
+        self.publicIP = publicIP
+        self.port = port
+        self.ip_change_ts = ip_change_ts
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ExtendedManagerNodeInfo):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'ExtendedManagerNodeInfo({self.to_dict()})'
 
 
 def get_current_nodes(skale: Skale, name: str) -> List[ExtendedManagerNodeInfo]:
     if not skale.schains_internal.is_schain_exist(name):
         return []
-    current_nodes: ManagerNodeInfo = get_nodes_for_schain(skale, name)
-    for node in current_nodes:
-        node['ip_change_ts'] = skale.nodes.get_last_change_ip_time(node['id'])
-        node['ip'] = ip_from_bytes(node['ip'])
-        node['publicIP'] = ip_from_bytes(node['publicIP'])
-    return current_nodes
+    nodes: List[ManagerNodeInfo] = get_nodes_for_schain(skale, name)
+    return [
+        ExtendedManagerNodeInfo(
+            id=node['id'],
+            name=node['name'],
+            ip=ip_from_bytes(node['ip']),
+            publicIP=ip_from_bytes(node['publicIP']),
+            port=node['port'],
+            ip_change_ts=skale.nodes.get_last_change_ip_time(node['id'])
+        )
+        for node in nodes
+    ]
 
 
 def get_current_ips(current_nodes: List[ExtendedManagerNodeInfo]) -> list[str]:
@@ -423,35 +476,113 @@ def get_node_index_in_group(skale: Skale, schain_name: str, node_id: int) -> Opt
         return None
 
 
-def is_port_open(ip, port):
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(1)
+def fetch_active_node_ips(
+    skale: Skale,
+    node_ids: List[int],
+    workers: int = VALIDATOR_NODES_READ_WORKERS
+) -> List[Tuple[int, str]]:
+    """ Reads status and IP of all nodes concurrently at the same block """
+    if not node_ids:
+        return []
+    block = skale.web3.eth.block_number
+    functions = skale.nodes.contract.functions
+
+    def fetch(node_id: int) -> Optional[Tuple[int, str]]:
+        status = functions.getNodeStatus(node_id).call(block_identifier=block)
+        if str(status) != str(NodeStatus.ACTIVE.value):
+            return None
+        ip_bytes = functions.getNodeIP(node_id).call(block_identifier=block)
+        return node_id, ip_from_bytes(ip_bytes)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(node_ids))) as executor:
+        return [node for node in executor.map(fetch, node_ids) if node is not None]
+
+
+async def measure_connect_latency(
+    ip: str,
+    port: int,
+    timeout: float = VALIDATOR_NODES_CONNECT_TIMEOUT
+) -> Optional[float]:
+    """ Returns TCP connect time in ms or None if port is not reachable """
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    latency = (time.perf_counter() - start) * 1000
+    writer.close()
     try:
-        s.connect((ip, int(port)))
-        s.shutdown(1)
-        return True
-    except Exception:
-        return False
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return round(latency, 2)
+
+
+async def scan_ports(
+    ips: List[str],
+    port: int,
+    timeout: float = VALIDATOR_NODES_CONNECT_TIMEOUT,
+    deadline: float = VALIDATOR_NODES_SCAN_DEADLINE,
+    concurrency: int = VALIDATOR_NODES_SCAN_CONCURRENCY
+) -> Dict[str, Optional[float]]:
+    """ Connects to all ips at once, ones not finished before the deadline are unreachable """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def measure(ip: str) -> Optional[float]:
+        async with semaphore:
+            return await measure_connect_latency(ip, port, timeout)
+
+    tasks = {ip: asyncio.ensure_future(measure(ip)) for ip in set(ips)}
+    if not tasks:
+        return {}
+    _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+    return {
+        ip: task.result() if task.done() and not task.cancelled() else None
+        for ip, task in tasks.items()
+    }
 
 
-def check_validator_nodes(skale, node_id):
+def scan_validator_nodes(skale: Skale, node_id: int) -> List[List]:
+    node = skale.nodes.get(node_id)
+    node_ids = skale.nodes.get_validator_node_indices(node['validator_id'])
     try:
-        node = skale.nodes.get(node_id)
-        node_ids = skale.nodes.get_validator_node_indices(node['validator_id'])
+        node_ids.remove(node_id)
+    except ValueError:
+        logger.warning(
+            f'node_id: {node_id} was not found in validator nodes: {node_ids}')
+    nodes = fetch_active_node_ips(skale, node_ids)
+    latencies = asyncio.run(scan_ports([ip for _, ip in nodes], WATCHDOG_PORT))
+    return [
+        [peer_id, ip, latencies[ip] is not None, latencies[ip]]
+        for peer_id, ip in nodes
+    ]
 
-        try:
-            node_ids.remove(node_id)
-        except ValueError:
-            logger.warning(
-                f'node_id: {node_id} was not found in validator nodes: {node_ids}')
-
-        res = []
-        for node_id in node_ids:
-            if str(skale.nodes.get_node_status(node_id)) == str(NodeStatus.ACTIVE.value):
-                ip_bytes = skale.nodes.contract.functions.getNodeIP(
-                    node_id).call()
-                ip = ip_from_bytes(ip_bytes)
-                res.append([node_id, ip, is_port_open(ip, WATCHDOG_PORT)])
+
+class ValidatorNodesCache:
+    def __init__(self, ttl: float = VALIDATOR_NODES_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.results: Dict[int, Tuple[float, List[List]]] = {}
+
+    def get(self, skale: Skale, node_id: int) -> List[List]:
+        with self.lock:
+            cached = self.results.get(node_id)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+            res = scan_validator_nodes(skale, node_id)
+            self.results[node_id] = (time.monotonic(), res)
+            return res
+
+
+validator_nodes_cache = ValidatorNodesCache()
+
+
+def check_validator_nodes(skale, node_id):
+    """ Returns [node_id, ip, is_watchdog_reachable, connect_latency_ms] of validator nodes """
+    try:
+        res = validator_nodes_cache.get(skale, node_id)
         logger.info(f'validator_nodes check - node_id: {node_id}, res: {res}')
     except Exception as err:
         return {'status': 1, 'errors': [err]}
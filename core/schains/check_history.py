@@ -0,0 +1,226 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import fcntl
+import logging
+import os
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+from core.schains.config.directory import schain_config_dir
+from tools.configs.schains import (
+    CHECK_HISTORY_CAPACITY,
+    CHECK_HISTORY_FILENAME,
+    CHECK_HISTORY_WINDOW
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'SKCH'
+VERSION = 1
+MAX_CHECKS = 32
+NAME_SIZE = 32
+# magic, version, max checks, capacity, next record position, records count
+HEADER = struct.Struct('<4sHHIII')
+HEADER_SIZE = 32 + MAX_CHECKS * NAME_SIZE
+# ts, known checks bitset, passed checks bitset, duration of each check in ms
+RECORD = struct.Struct(f'<dII{MAX_CHECKS}H')
+MAX_DURATION_MS = 2 ** 16 - 1
+
+
+@dataclass
+class CheckRecord:
+    ts: float
+    checks: Dict[str, bool]
+    durations: Dict[str, float]
+
+
+@dataclass
+class CheckSummary:
+    status: Optional[bool]
+    since: Optional[float]
+    flaps: int = 0
+    time_ok: float = 0
+    time_failed: float = 0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class CheckHistory:
+    """
+    Ring buffer of check results in a fixed-size binary file.
+    Check names are kept in the header and map to bits of the record bitsets,
+    so appending a record is a single pwrite of the record plus the header.
+    """
+
+    def __init__(self, path: str, capacity: int = CHECK_HISTORY_CAPACITY) -> None:
+        self.path = path
+        self.capacity = capacity
+
+    @contextmanager
+    def _open(self, exclusive: bool) -> Iterator[int]:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield fd
+        finally:
+            os.close(fd)
+
+    def _init_file(self, fd: int) -> None:
+        os.ftruncate(fd, 0)
+        os.ftruncate(fd, HEADER_SIZE + self.capacity * RECORD.size)
+        os.pwrite(fd, HEADER.pack(MAGIC, VERSION, MAX_CHECKS, self.capacity, 0, 0), 0)
+
+    def _read_header(self, fd: int) -> Optional[tuple]:
+        data = os.pread(fd, HEADER_SIZE, 0)
+        if len(data) < HEADER_SIZE:
+            return None
+        magic, version, max_checks, capacity, head, count = HEADER.unpack_from(data)
+        if (magic, version, max_checks, capacity) != (MAGIC, VERSION, MAX_CHECKS, self.capacity):
+            return None
+        names = [
+            data[32 + i * NAME_SIZE:32 + (i + 1) * NAME_SIZE].rstrip(b'\0').decode()
+            for i in range(MAX_CHECKS)
+        ]
+        return head, count, names
+
+    def append(
+        self,
+        checks: Dict[str, bool],
+        durations: Optional[Dict[str, float]] = None,
+        ts: Optional[float] = None
+    ) -> None:
+        durations = durations or {}
+        with self._open(exclusive=True) as fd:
+            header = self._read_header(fd)
+            if header is None:
+                self._init_file(fd)
+                header = self._read_header(fd)
+            head, count, names = header
+            known, passed = 0, 0
+            durations_ms = [0] * MAX_CHECKS
+            for name, status in checks.items():
+                if name not in names:
+                    if '' not in names or len(name.encode()) > NAME_SIZE:
+                        logger.warning('No space for check %s in history', name)
+                        continue
+                    slot = names.index('')
+                    names[slot] = name
+                    os.pwrite(fd, name.encode().ljust(NAME_SIZE, b'\0'), 32 + slot * NAME_SIZE)
+                bit = names.index(name)
+                known |= 1 << bit
+                if status:
+                    passed |= 1 << bit
+                durations_ms[bit] = min(int(durations.get(name, 0) * 1000), MAX_DURATION_MS)
+            record = RECORD.pack(ts or time.time(), known, passed, *durations_ms)
+            os.pwrite(fd, record, HEADER_SIZE + head * RECORD.size)
+            head = (head + 1) % self.capacity
+            count = min(count + 1, self.capacity)
+            os.pwrite(
+                fd,
+                HEADER.pack(MAGIC, VERSION, MAX_CHECKS, self.capacity, head, count),
+                0
+            )
+
+    def read(self, since: Optional[float] = None) -> List[CheckRecord]:
+        """ Returns records ordered by time, optionally only ones newer than since """
+        if not os.path.isfile(self.path):
+            return []
+        with self._open(exclusive=False) as fd:
+            header = self._read_header(fd)
+            if header is None:
+                return []
+            head, count, names = header
+            start = (head - count) % self.capacity
+            first_count = min(count, self.capacity - start)
+            data = os.pread(fd, first_count * RECORD.size, HEADER_SIZE + start * RECORD.size)
+            if count > first_count:
+                data += os.pread(fd, (count - first_count) * RECORD.size, HEADER_SIZE)
+        records = []
+        for ts, known, passed, *durations_ms in RECORD.iter_unpack(data):
+            if since is not None and ts < since:
+                continue
+            checks, durations = {}, {}
+            for bit, name in enumerate(names):
+                if known >> bit & 1:
+                    checks[name] = bool(passed >> bit & 1)
+                    durations[name] = durations_ms[bit] / 1000
+            records.append(CheckRecord(ts, checks, durations))
+        return records
+
+    def summary(
+        self,
+        window: float = CHECK_HISTORY_WINDOW,
+        now: Optional[float] = None
+    ) -> Dict[str, CheckSummary]:
+        """
+        Returns current status of each check, when it was entered, number of
+        status changes and time spent in each status during the window
+        """
+        now = now or time.time()
+        records = self.read(since=now - window)
+        summaries: Dict[str, CheckSummary] = {}
+        for index, record in enumerate(records):
+            end = records[index + 1].ts if index + 1 < len(records) else now
+            for name, status in record.checks.items():
+                summary = summaries.get(name)
+                if summary is None:
+                    summary = summaries[name] = CheckSummary(status=status, since=record.ts)
+                elif summary.status != status:
+                    summary.flaps += 1
+                    summary.status, summary.since = status, record.ts
+                if status:
+                    summary.time_ok += end - record.ts
+                else:
+                    summary.time_failed += end - record.ts
+        return summaries
+
+
+def get_check_history_path(schain_name: str) -> str:
+    return os.path.join(schain_config_dir(schain_name), CHECK_HISTORY_FILENAME)
+
+
+def get_check_history(schain_name: str) -> CheckHistory:
+    return CheckHistory(get_check_history_path(schain_name))
+
+
+def record_check_history(
+    schain_name: str,
+    checks: Dict[str, bool],
+    durations: Optional[Dict[str, float]] = None
+) -> None:
+    try:
+        get_check_history(schain_name).append(checks, durations)
+    except Exception:
+        logger.exception('Failed to record check history for %s', schain_name)
+
+
+def get_check_history_summary(
+    schain_name: str,
+    window: float = CHECK_HISTORY_WINDOW
+) -> Dict[str, CheckSummary]:
+    try:
+        return get_check_history(schain_name).summary(window)
+    except Exception:
+        logger.exception('Failed to read check history for %s', schain_name)
+        return {}
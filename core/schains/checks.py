@@ -19,13 +19,17 @@
 
 import os
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Iterator, List, Mapping, Optional
 
 import statsd
 
 from core.node import ExtendedManagerNodeInfo, get_current_ips
+from core.schains.check_history import record_check_history
 from core.schains.config.directory import get_schain_check_filepath
 from core.schains.config.file_manager import ConfigFileManager
 from core.schains.config.helper import (
@@ -94,10 +98,16 @@ TG_ALLOWED_CHECKS = [
 ]
 
 
+EMPTY_CHECK_DATA: Mapping = MappingProxyType({})
+
+
 class CheckRes:
+    """ Check result, results without data share a single read-only mapping """
+    __slots__ = ('status', 'data')
+
     def __init__(self, status: bool, data: dict = None):
         self.status = status
-        self.data = data if data else {}
+        self.data = data if data else EMPTY_CHECK_DATA
 
     def __bool__(self) -> bool:
         return self.status
@@ -106,6 +116,72 @@ class CheckRes:
         return f'CheckRes<{self.status}>'
 
 
+class CheckStatus(MutableMapping):
+    """
+    Check name -> status map stored as two bitsets (checks present and checks
+    passed) over a name index shared by all instances in the process.
+    Behaves like the plain dict it replaces, use to_dict for serialization.
+    """
+    __slots__ = ('known', 'passed')
+
+    _index: ClassVar[Dict[str, int]] = {}
+    _names: ClassVar[List[str]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, statuses: Optional[Mapping[str, bool]] = None) -> None:
+        self.known, self.passed = 0, 0
+        if statuses:
+            self.update(statuses)
+
+    @classmethod
+    def _bit(cls, name: str) -> int:
+        bit = cls._index.get(name)
+        if bit is None:
+            with cls._lock:
+                bit = cls._index.get(name)
+                if bit is None:
+                    bit = cls._index[name] = len(cls._names)
+                    cls._names.append(name)
+        return bit
+
+    def __getitem__(self, name: str) -> bool:
+        bit = self._index.get(name)
+        if bit is None or not self.known >> bit & 1:
+            raise KeyError(name)
+        return bool(self.passed >> bit & 1)
+
+    def __setitem__(self, name: str, status: bool) -> None:
+        mask = 1 << self._bit(name)
+        self.known |= mask
+        if status:
+            self.passed |= mask
+        else:
+            self.passed &= ~mask
+
+    def __delitem__(self, name: str) -> None:
+        bit = self._index.get(name)
+        if bit is None or not self.known >> bit & 1:
+            raise KeyError(name)
+        mask = ~(1 << bit)
+        self.known &= mask
+        self.passed &= mask
+
+    def __iter__(self) -> Iterator[str]:
+        known = self.known
+        for bit, name in enumerate(self._names[:known.bit_length()]):
+            if known >> bit & 1:
+                yield name
+
+    def __len__(self) -> int:
+        return self.known.bit_count()
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> Dict[str, bool]:
+        return dict(self.items())
+
+
 class IChecks(ABC):
     @abstractmethod
     def get_name(self) -> str:
@@ -117,17 +193,24 @@ class IChecks(ABC):
         save: bool = False,
         expose: bool = False,
         needed: Optional[List[str]] = None,
-    ) -> Dict:
+        history: bool = False,
+    ) -> CheckStatus:
         if needed:
             names = needed
         else:
             names = self.get_check_names()
 
-        checks_status = {}
+        checks_status = CheckStatus()
+        durations: Optional[Dict[str, float]] = {} if history else None
         for name in names:
             if hasattr(self, name):
                 logger.debug('Running check %s', name)
+                start = time.perf_counter()
                 checks_status[name] = getattr(self, name).status
+                if durations is not None:
+                    durations[name] = time.perf_counter() - start
+        if history:
+            record_check_history(self.get_name(), checks_status, durations)
         if expose:
             send_to_statsd(self.statsd_client, self.get_name(), checks_status)
         if log:
@@ -201,7 +284,7 @@ class ConfigChecks(IChecks):
         """Checks that IP list on the skale-manager is the same as in the skaled config"""
         res = False
         if self.cfm.skaled_config_exists():
-            conf = self.cfm.skaled_config
+            conf = self.cfm.skaled_config_view
             node_ips = get_node_ips_from_config(conf)
             current_ips = get_current_ips(self.current_nodes)
             res = set(node_ips) == set(current_ips)
@@ -303,7 +386,7 @@ class SkaledChecks(IChecks):
     def firewall_rules(self) -> CheckRes:
         """Checks that firewall rules are set correctly"""
         if self.config:
-            conf = self.cfm.skaled_config
+            conf = self.cfm.skaled_config_view
             base_port = get_base_port_from_config(conf)
             node_ips = get_node_ips_from_config(conf)
             own_ip = get_own_ip_from_config(conf)
@@ -375,7 +458,7 @@ class SkaledChecks(IChecks):
         """Checks that local skaled RPC is accessible"""
         res = False
         if self.config:
-            config = self.cfm.skaled_config
+            config = self.cfm.skaled_config_view
             http_endpoint = get_local_schain_http_endpoint_from_config(config)
             timeout = get_endpoint_alive_check_timeout(self.schain_record.failed_rpc_count)
             res = check_endpoint_alive(http_endpoint, timeout=timeout)
@@ -385,7 +468,7 @@ class SkaledChecks(IChecks):
     def blocks(self) -> CheckRes:
         """Checks that local skaled is mining blocks"""
         if self.config:
-            config = self.cfm.skaled_config
+            config = self.cfm.skaled_config_view
             http_endpoint = get_local_schain_http_endpoint_from_config(config)
             return CheckRes(check_endpoint_blocks(http_endpoint))
         return CheckRes(False)
@@ -480,7 +563,7 @@ def save_checks_dict(schain_name, checks_dict):
     schain_check_path = get_schain_check_filepath(schain_name)
     logger.info(f'Saving checks for the chain {schain_name}: {schain_check_path}')
     try:
-        write_json(schain_check_path, {'time': time.time(), 'checks': checks_dict})
+        write_json(schain_check_path, {'time': time.time(), 'checks': dict(checks_dict)})
     except Exception:
         logger.exception(f'Failed to save checks: {schain_check_path}')
 
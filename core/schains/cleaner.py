@@ -20,8 +20,12 @@
 import logging
 import os
 import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from multiprocessing import Process
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
 from sgx import SgxClient
 from skale import Skale
@@ -44,10 +48,12 @@ from core.schains.types import ContainerType
 from core.schains.firewall.utils import get_sync_agent_ranges
 
 from tools.configs import SGX_CERTIFICATES_FOLDER, SYNC_NODE
-from tools.configs.schains import SCHAINS_DIR_PATH
+from tools.configs.schains import CLEANER_WORKERS, SCHAINS_DIR_PATH
 from tools.configs.containers import SCHAIN_CONTAINER, IMA_CONTAINER, SCHAIN_STOP_TIMEOUT
 from tools.docker_utils import DockerUtils
-from tools.helper import merged_unique, read_json, is_node_part_of_chain
+from tools.helper import merged_unique, no_hyphens, read_json
+from tools.logger import child_listener
+from tools.resources import get_statsd_client
 from tools.sgx_utils import SGX_SERVER_URL
 from tools.str_formatters import arguments_list_string
 from web.models.schain import get_schains_names, mark_schain_deleted, upsert_schain_record
@@ -99,26 +105,124 @@ def remove_config_dir(schain_name: str) -> None:
     shutil.rmtree(schain_dir_path)
 
 
-def monitor(skale, node_config, dutils=None):
+@dataclass
+class SChainMembership:
+    name: str
+    exists: bool
+    rotation_active: bool
+    node_in_group: bool
+
+
+@contextmanager
+def cleaner_phase(phase: str, schain_name: Optional[str] = None) -> Iterator[None]:
+    start = time.time()
+    try:
+        yield
+    finally:
+        duration = time.time() - start
+        if schain_name is None:
+            logger.info('Cleaner phase %s took %.2fs', phase, duration)
+            get_statsd_client().timing(f'admin.cleaner.{phase}', duration * 1000)
+        else:
+            logger.info('%s cleaner phase %s took %.2fs', schain_name, phase, duration)
+            get_statsd_client().timing(
+                f'admin.cleaner.{phase}.{no_hyphens(schain_name)}',
+                duration * 1000
+            )
+
+
+def fetch_schain_membership(skale: Skale, schain_name: str, node_id: int) -> SChainMembership:
+    exists = skale.schains_internal.is_schain_exist(schain_name)
+    if not exists:
+        return SChainMembership(schain_name, False, False, False)
+    rotation_active = skale.node_rotation.is_rotation_active(schain_name)
+    node_ids = skale.schains_internal.get_node_ids_for_schain(schain_name)
+    return SChainMembership(schain_name, True, rotation_active, node_id in node_ids)
+
+
+def fetch_membership_batch(
+    skale: Skale,
+    schain_names: List[str],
+    node_id: int,
+    workers: int = CLEANER_WORKERS
+) -> Dict[str, SChainMembership]:
+    """ Fetches on-chain membership for all removal candidates in one phase """
+    if not schain_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='M') as executor:
+        results = executor.map(
+            lambda name: fetch_schain_membership(skale, name, node_id),
+            schain_names
+        )
+        return {membership.name: membership for membership in results}
+
+
+@child_listener()
+def monitor(skale, node_config, dutils=None, workers=CLEANER_WORKERS):
     dutils = dutils or DockerUtils()
     logger.info('Cleaner procedure started.')
-    schains_on_node = get_schains_on_node(dutils=dutils)
-    schain_names_on_contracts = get_schain_names_from_contract(skale, node_config.id)
+    with cleaner_phase('discovery'):
+        schains_on_node = get_schains_on_node(dutils=dutils)
+        schain_names_on_contracts = get_schain_names_from_contract(skale, node_config.id)
     logger.info(f'\nsChains on contracts: {schain_names_on_contracts}\n\
 sChains on node: {schains_on_node}')
 
-    for schain_name in schains_on_node:
-        if schain_name not in schain_names_on_contracts:
-            logger.warning(
-                '%s was found on node, but not on contracts: %s, trying to cleanup',
-                schain_name,
-                schain_names_on_contracts,
-            )
+    candidates = [name for name in schains_on_node if name not in schain_names_on_contracts]
+    if not candidates:
+        logger.info('Cleanup procedure finished')
+        return
+    logger.warning(
+        '%s were found on node, but not on contracts: %s, trying to cleanup',
+        candidates,
+        schain_names_on_contracts,
+    )
+    with cleaner_phase('membership'):
+        memberships = fetch_membership_batch(skale, candidates, node_config.id, workers=workers)
+        sync_agent_ranges = get_sync_agent_ranges(skale)
+
+    with cleaner_phase('removal'):
+        run_removal(
+            skale,
+            node_config.id,
+            memberships,
+            sync_agent_ranges=sync_agent_ranges,
+            dutils=dutils,
+            workers=workers
+        )
+    logger.info('Cleanup procedure finished')
+
+
+def run_removal(
+    skale: Skale,
+    node_id: int,
+    memberships: Dict[str, SChainMembership],
+    sync_agent_ranges: list,
+    dutils: DockerUtils,
+    workers: int = CLEANER_WORKERS
+) -> None:
+    total, done = len(memberships), 0
+    # Hanging removals are bounded by JOIN_TIMEOUT of the cleaner process
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='C') as executor:
+        futures: Dict[Future, str] = {
+            executor.submit(
+                ensure_schain_removed,
+                skale,
+                name,
+                node_id,
+                dutils=dutils,
+                membership=membership,
+                sync_agent_ranges=sync_agent_ranges
+            ): name
+            for name, membership in memberships.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            done += 1
             try:
-                ensure_schain_removed(skale, schain_name, node_config.id, dutils=dutils)
+                future.result()
             except Exception:
-                logger.exception('%s removal failed', schain_name)
-    logger.info('Cleanup procedure finished')
+                logger.exception('%s removal failed', name)
+            logger.info('Cleaner progress: %d/%d, %s processed', done, total, name)
 
 
 def get_schain_names_from_contract(skale, node_id):
@@ -149,18 +253,28 @@ def schain_names_to_ids(skale, schain_names):
     return ids
 
 
-def ensure_schain_removed(skale, schain_name, node_id, dutils=None):
+def ensure_schain_removed(
+    skale,
+    schain_name,
+    node_id,
+    dutils=None,
+    membership: Optional[SChainMembership] = None,
+    sync_agent_ranges: Optional[list] = None
+):
     dutils = dutils or DockerUtils()
-    is_schain_exist = skale.schains_internal.is_schain_exist(schain_name)
+    membership = membership or fetch_schain_membership(skale, schain_name, node_id)
 
-    if not is_schain_exist:
+    if not membership.exists:
         msg = arguments_list_string(
             {'sChain name': schain_name},
             'Going to remove this sChain because it was removed from contracts',
         )
-        return remove_schain(skale, node_id, schain_name, msg, dutils=dutils)
+        return remove_schain(
+            skale, node_id, schain_name, msg,
+            dutils=dutils, sync_agent_ranges=sync_agent_ranges
+        )
 
-    if skale.node_rotation.is_rotation_active(schain_name):
+    if membership.rotation_active:
         msg = arguments_list_string(
             {'sChain name': schain_name},
             'Rotation is in progress (new group created), skipping cleaner',
@@ -168,12 +282,15 @@ def ensure_schain_removed(skale, schain_name, node_id, dutils=None):
         logger.info(msg)
         return
 
-    if not is_node_part_of_chain(skale, schain_name, node_id):
+    if not membership.node_in_group:
         msg = arguments_list_string(
             {'sChain name': schain_name},
             'Going to remove this sChain because this node is not in the group',
         )
-        return remove_schain(skale, node_id, schain_name, msg, dutils=dutils)
+        return remove_schain(
+            skale, node_id, schain_name, msg,
+            dutils=dutils, sync_agent_ranges=sync_agent_ranges
+        )
 
     msg = arguments_list_string(
         {'sChain name': schain_name}, 'sChain do not satisfy removal condidions'
@@ -187,20 +304,25 @@ def remove_schain(
     schain_name: str,
     msg: str,
     dutils: Optional[DockerUtils] = None,
+    sync_agent_ranges: Optional[list] = None
 ) -> None:
     logger.warning(msg)
-    report = ProcessReport(name=schain_name)
-    if report.is_exist():
-        terminate_process(report.pid)
-
-    delete_bls_keys(skale, schain_name)
-    sync_agent_ranges = get_sync_agent_ranges(skale)
-    rotation_data = skale.node_rotation.get_rotation(schain_name)
-    rotation_id = rotation_data['rotation_id']
-    estate = ExternalConfig(name=schain_name).get()
-    current_nodes = get_current_nodes(skale, schain_name)
-    group_index = skale.schains.name_to_group_id(schain_name)
-    last_dkg_successful = skale.dkg.is_last_dkg_successful(group_index)
+    with cleaner_phase('terminate', schain_name):
+        report = ProcessReport(name=schain_name)
+        if report.is_exist():
+            terminate_process(report.pid)
+
+    with cleaner_phase('bls_keys', schain_name):
+        delete_bls_keys(skale, schain_name)
+    with cleaner_phase('contract_data', schain_name):
+        if sync_agent_ranges is None:
+            sync_agent_ranges = get_sync_agent_ranges(skale)
+        rotation_data = skale.node_rotation.get_rotation(schain_name)
+        rotation_id = rotation_data['rotation_id']
+        estate = ExternalConfig(name=schain_name).get()
+        current_nodes = get_current_nodes(skale, schain_name)
+        group_index = skale.schains.name_to_group_id(schain_name)
+        last_dkg_successful = skale.dkg.is_last_dkg_successful(group_index)
 
     cleanup_schain(
         node_id,
@@ -243,22 +365,30 @@ def cleanup_schain(
         sync_node=SYNC_NODE,
     )
     check_status = checks.get_all()
-    if check_status['skaled_container'] or is_exited(
-        schain_name, container_type=ContainerType.schain, dutils=dutils
-    ):
-        remove_schain_container(schain_name, dutils=dutils)
-    if check_status['volume']:
-        remove_schain_volume(schain_name, dutils=dutils)
-    if check_status['firewall_rules']:
-        conf = ConfigFileManager(schain_name).skaled_config
-        base_port = get_base_port_from_config(conf)
-        own_ip = get_own_ip_from_config(conf)
-        node_ips = get_node_ips_from_config(conf)
-        ranges = []
-        if estate is not None:
-            ranges = estate.ranges
-        rc.configure(base_port=base_port, own_ip=own_ip, node_ips=node_ips, sync_ip_ranges=ranges)
-        rc.cleanup()
+    with cleaner_phase('containers', schain_name):
+        if check_status['skaled_container'] or is_exited(
+            schain_name, container_type=ContainerType.schain, dutils=dutils
+        ):
+            remove_schain_container(schain_name, dutils=dutils)
+    with cleaner_phase('volume', schain_name):
+        if check_status['volume']:
+            remove_schain_volume(schain_name, dutils=dutils)
+    with cleaner_phase('firewall', schain_name):
+        if check_status['firewall_rules']:
+            conf = ConfigFileManager(schain_name).skaled_config_view
+            base_port = get_base_port_from_config(conf)
+            own_ip = get_own_ip_from_config(conf)
+            node_ips = get_node_ips_from_config(conf)
+            ranges = []
+            if estate is not None:
+                ranges = estate.ranges
+            rc.configure(
+                base_port=base_port,
+                own_ip=own_ip,
+                node_ips=node_ips,
+                sync_ip_ranges=ranges
+            )
+            rc.cleanup()
     if estate is not None and estate.ima_linked:
         if check_status.get('ima_container', False) or is_exited(
             schain_name, container_type=ContainerType.ima, dutils=dutils
@@ -271,6 +401,7 @@ def cleanup_schain(
 
 def delete_bls_keys(skale, schain_name):
     last_rotation_id = skale.schains.get_last_rotation_id(schain_name)
+    sgx = None
     for i in range(last_rotation_id + 1):
         try:
             secret_key_share_filepath = get_secret_key_share_filepath(schain_name, i)
@@ -278,7 +409,7 @@ def delete_bls_keys(skale, schain_name):
                 secret_key_share_config = read_json(secret_key_share_filepath) or {}
                 bls_key_name = secret_key_share_config.get('key_share_name')
                 if bls_key_name:
-                    sgx = SgxClient(SGX_SERVER_URL, path_to_cert=SGX_CERTIFICATES_FOLDER)
+                    sgx = sgx or SgxClient(SGX_SERVER_URL, path_to_cert=SGX_CERTIFICATES_FOLDER)
                     sgx.delete_bls_key(bls_key_name)
         except Exception:
             logger.exception(f'Removing secret_key for rotation {i} failed')
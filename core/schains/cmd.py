@@ -64,7 +64,7 @@ def get_schain_container_base_opts(
 ) -> list:
     config_filepath = get_skaled_container_config_path(schain_name)
     ssl_key, ssl_cert = get_ssl_filepath()
-    config = ConfigFileManager(schain_name=schain_name).skaled_config
+    config = ConfigFileManager(schain_name=schain_name).skaled_config_view
     ports = get_schain_ports_from_config(config)
     static_schain_cmd = get_static_schain_cmd()
 
@@ -0,0 +1,200 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from skale import Skale
+from skale.contracts.manager.schains import SchainStructure
+from skale.schain_config.rotation_history import get_previous_schain_groups
+
+from core.schains.config.skale_manager_opts import SkaleManagerOpts, init_skale_manager_opts
+from core.schains.dkg.utils import get_common_bls_public_key
+from tools.configs.schains import (
+    CONFIG_CACHE_BLOCK_TIME,
+    CONFIG_CACHE_DIR_PATH,
+    CONFIG_CACHE_MAX_BLOCK_AGE
+)
+from tools.resources import get_statsd_client
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigDataCache:
+    """
+    Contract data used for sChain config generation shared between monitors.
+    Entries are stored on disk and are valid while the head is at most
+    max_block_age blocks ahead of the block they were fetched at. Mainnet
+    produces at most one block per block_time, so the age is checked by the
+    fetch time and no head block request is needed. Chains regenerating
+    configs in the same cycle (e.g. after a rotation wave) fetch each node
+    and node schains once. Stale entries are refetched one by one on access,
+    expired ones are removed when the cache is opened.
+
+    Group data is also bound to the sChain rotation id and node structs to
+    the node IP change timestamp, both read from contracts on each access,
+    so a rotation or an IP change never serves data of the previous state.
+    """
+
+    def __init__(
+        self,
+        skale: Skale,
+        cache_dir: str = CONFIG_CACHE_DIR_PATH,
+        max_block_age: int = CONFIG_CACHE_MAX_BLOCK_AGE,
+        block_time: int = CONFIG_CACHE_BLOCK_TIME
+    ) -> None:
+        self.skale = skale
+        self.cache_dir = cache_dir
+        self.max_age = max_block_age * block_time
+        self.hits, self.misses = 0, 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """ Removes entries and leftover tmp files that can't be used anymore """
+        evicted = 0
+        now = time.time()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if now - entry.stat().st_mtime > self.max_age:
+                        os.remove(entry.path)
+                        evicted += 1
+                except FileNotFoundError:
+                    # Removed or replaced by another monitor
+                    continue
+        return evicted
+
+    def _entry_path(self, kind: str, key: Any) -> str:
+        return os.path.join(self.cache_dir, f'{kind}-{key}.pkl')
+
+    def _load(self, path: str) -> Optional[Dict]:
+        try:
+            with open(path, 'rb') as entry_file:
+                return pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning('Config cache entry %s is broken, refetching', path)
+            return None
+
+    def _store(self, path: str, entry: Dict) -> None:
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as entry_file:
+            pickle.dump(entry, entry_file)
+        os.replace(tmp_path, path)
+
+    def _is_valid(self, entry: Optional[Dict], version: Any) -> bool:
+        return entry is not None and \
+            entry.get('version') == version and \
+            0 <= time.time() - entry.get('ts', 0) <= self.max_age
+
+    def get(self, kind: str, key: Any, fetch: Callable[[], Any], version: Any = None) -> Any:
+        path = self._entry_path(kind, key)
+        entry = self._load(path)
+        if self._is_valid(entry, version):
+            self.hits += 1
+            get_statsd_client().incr(f'admin.config.cache.hit.{kind}')
+            return entry['value']
+        self.misses += 1
+        get_statsd_client().incr(f'admin.config.cache.miss.{kind}')
+        # Fetched data is at least as fresh as the head at this moment
+        ts = time.time()
+        value = fetch()
+        self._store(path, {'ts': ts, 'version': version, 'value': value})
+        return value
+
+    def get_rotation_id(self, schain_name: str) -> int:
+        return self.skale.node_rotation.get_rotation(schain_name)['rotation_id']
+
+    def get_node(self, node_id: int) -> Dict:
+        ip_change_ts = self.skale.nodes.get_last_change_ip_time(node_id)
+        return self.get(
+            'node',
+            node_id,
+            lambda: self.skale.nodes.get(node_id),
+            version=ip_change_ts
+        )
+
+    def get_schains_for_node(self, node_id: int) -> List[SchainStructure]:
+        return self.get(
+            'node_schains',
+            node_id,
+            lambda: self.skale.schains.get_schains_for_node(node_id)
+        )
+
+    def get_node_ids_for_schain(
+        self,
+        schain_name: str,
+        rotation_id: Optional[int] = None
+    ) -> List[int]:
+        if rotation_id is None:
+            rotation_id = self.get_rotation_id(schain_name)
+        return self.get(
+            'schain_node_ids',
+            schain_name,
+            lambda: self.skale.schains_internal.get_node_ids_for_schain(schain_name),
+            version=rotation_id
+        )
+
+    def get_schain(self, schain_name: str) -> SchainStructure:
+        return self.get('schain', schain_name, lambda: self.skale.schains.get_by_name(schain_name))
+
+    def get_schain_nodes_with_schains(
+        self,
+        schain_name: str,
+        rotation_id: Optional[int] = None
+    ) -> List[Dict]:
+        """ Same as skale.schain_config.generator.get_schain_nodes_with_schains """
+        nodes = []
+        for node_id in self.get_node_ids_for_schain(schain_name, rotation_id=rotation_id):
+            node = self.get_node(node_id)
+            node['id'] = node_id
+            node['schains'] = self.get_schains_for_node(node_id)
+            nodes.append(node)
+        return nodes
+
+    def get_previous_schain_groups(
+        self,
+        schain_name: str,
+        rotation_id: Optional[int] = None
+    ) -> Dict:
+        if rotation_id is None:
+            rotation_id = self.get_rotation_id(schain_name)
+        return self.get(
+            'node_groups',
+            schain_name,
+            lambda: get_previous_schain_groups(self.skale, schain_name),
+            version=rotation_id
+        )
+
+    def get_skale_manager_opts(self) -> SkaleManagerOpts:
+        return self.get('skale_manager_opts', 'all', lambda: init_skale_manager_opts(self.skale))
+
+    def get_common_bls_public_key(self, group_index: str, rotation_id: int) -> List[str]:
+        return self.get(
+            'common_bls_public_key',
+            group_index,
+            lambda: get_common_bls_public_key(self.skale, group_index),
+            version=rotation_id
+        )
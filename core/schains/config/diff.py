@@ -0,0 +1,111 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from tools.helper import no_hyphens
+from tools.resources import get_statsd_client
+
+logger = logging.getLogger(__name__)
+
+Path = Tuple[Any, ...]
+
+IP_FIELDS = {'ip', 'publicIP', 'bindIP'}
+
+# Sections read by skaled only when the chain state is created at genesis,
+# running skaled does not need a restart to pick them up
+GENESIS_ONLY_CATEGORIES = {'accounts', 'genesis'}
+
+
+class ConfigDiff:
+    """ Changed config paths grouped by the kind of change """
+
+    def __init__(self, changes: Dict[str, List[Path]]) -> None:
+        self.changes = changes
+
+    @property
+    def categories(self) -> Set[str]:
+        return set(self.changes)
+
+    @property
+    def empty(self) -> bool:
+        return not self.changes
+
+    @property
+    def restart_needed(self) -> bool:
+        return bool(self.categories - GENESIS_ONLY_CATEGORIES)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {
+            category: ['.'.join(map(str, path)) for path in paths]
+            for category, paths in self.changes.items()
+        }
+
+    def __repr__(self) -> str:
+        return f'ConfigDiff({sorted(self.categories)})'
+
+
+def iter_changed_paths(old: Any, new: Any, path: Path = ()) -> Iterator[Path]:
+    """ Yields deepest paths where configs differ, equal subtrees are skipped at once """
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in sorted(set(old) | set(new), key=str):
+            if key not in old or key not in new:
+                yield path + (key,)
+            else:
+                yield from iter_changed_paths(old[key], new[key], path + (key,))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from iter_changed_paths(old_item, new_item, path + (index,))
+    else:
+        yield path
+
+
+def classify_path(path: Path) -> str:
+    if not path:
+        return 'other'
+    if path[0] in ('accounts', 'genesis', 'params'):
+        return path[0]
+    if path[:3] == ('skaleConfig', 'sChain', 'nodeGroups'):
+        return 'node_groups'
+    if path == ('skaleConfig', 'sChain', 'nodes'):
+        # Nodes added or removed
+        return 'node_groups'
+    field = path[-1] if isinstance(path[-1], str) else ''
+    if field in IP_FIELDS:
+        return 'ips'
+    if field.endswith('Port'):
+        return 'ports'
+    return 'other'
+
+
+def diff_configs(old: Optional[Dict], new: Optional[Dict]) -> ConfigDiff:
+    changes: Dict[str, List[Path]] = {}
+    for path in iter_changed_paths(old or {}, new or {}):
+        changes.setdefault(classify_path(path), []).append(path)
+    return ConfigDiff(changes)
+
+
+def report_config_diff(schain_name: str, diff: ConfigDiff, source: str) -> None:
+    logger.info('Config diff (%s): %s', source, diff.to_dict())
+    statsd_client = get_statsd_client()
+    for category in diff.categories:
+        statsd_client.incr(f'admin.config_diff.{source}.{category}.{no_hyphens(schain_name)}')
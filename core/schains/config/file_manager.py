@@ -27,7 +27,9 @@ from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import ClassVar, Dict, List, Optional, TypeVar
 
+from core.schains.config.diff import ConfigDiff, diff_configs
 from core.schains.config.directory import get_files_with_prefix
+from core.schains.config.view import get_skaled_config_view, SkaledConfigView
 from tools.configs.schains import SCHAINS_DIR_PATH
 from tools.helper import read_json, write_json
 
@@ -156,6 +158,12 @@ class ConfigFileManager:
                 return None
             return read_json(self.skaled_config_path)
 
+    @property
+    def skaled_config_view(self) -> Optional[SkaledConfigView]:
+        """ Lazily parsed skaled config, use it if accounts are not needed """
+        with ConfigFileManager.CFM_LOCK:
+            return get_skaled_config_view(self.skaled_config_path)
+
     def skaled_config_synced_with_upstream(self) -> bool:
         with ConfigFileManager.CFM_LOCK:
             if not self.skaled_config_exists():
@@ -164,6 +172,11 @@ class ConfigFileManager:
                 return True
             return self.latest_upstream_config == self.skaled_config
 
+    def get_skaled_config_diff(self) -> ConfigDiff:
+        """ Changes that syncing skaled config with upstream would bring """
+        with ConfigFileManager.CFM_LOCK:
+            return diff_configs(self.skaled_config, self.latest_upstream_config)
+
     def get_new_upstream_filepath(self, rotation_id: int) -> str:
         ts = int(time.time())
         filename = UpstreamConfigFilename(
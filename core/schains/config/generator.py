@@ -19,25 +19,24 @@
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from skale import Skale
 from skale.contracts.manager.schains import SchainStructure
-from skale.schain_config.generator import get_schain_nodes_with_schains
 from skale.schain_config.ports_allocation import get_schain_base_port_on_node
-from skale.schain_config.rotation_history import get_previous_schain_groups
 
 from etherbase_predeployed import ETHERBASE_ADDRESS
 from marionette_predeployed import MARIONETTE_ADDRESS
 
 from core.node_config import NodeConfig
-from core.schains.config.skale_manager_opts import SkaleManagerOpts, init_skale_manager_opts
+from core.schains.config.cache import ConfigDataCache
+from core.schains.config.skale_manager_opts import SkaleManagerOpts
 from core.schains.config.skale_section import SkaleConfig, generate_skale_section
 from core.schains.config.predeployed import generate_predeployed_accounts
 from core.schains.config.precompiled import generate_precompiled_accounts
 from core.schains.config.generation import Gen
 from core.schains.config.legacy_data import is_static_accounts, static_accounts, static_groups
 from core.schains.config.helper import get_chain_id, get_schain_id
-from core.schains.dkg.utils import get_common_bls_public_key
 from core.schains.limits import get_schain_type
 
 from tools.helper import read_json
@@ -235,19 +234,27 @@ def generate_schain_config_with_skale(
     rotation_data: dict,
     ecdsa_key_name: str,
     sync_node: bool = False,
-    node_options: NodeOptions = NodeOptions()
+    node_options: NodeOptions = NodeOptions(),
+    cache: Optional[ConfigDataCache] = None
 ) -> SChainConfig:
-    schain_nodes_with_schains = get_schain_nodes_with_schains(skale, schain_name)
-    schains_on_node = skale.schains.get_schains_for_node(node_config.id)
-    schain = skale.schains.get_by_name(schain_name)
-    node = skale.nodes.get(node_config.id)
-    node_groups = get_previous_schain_groups(skale, schain_name)
+    cache = cache or ConfigDataCache(skale)
+    rotation_id = rotation_data['rotation_id']
+    schain_nodes_with_schains = cache.get_schain_nodes_with_schains(
+        schain_name,
+        rotation_id=rotation_id
+    )
+    schains_on_node = cache.get_schains_for_node(node_config.id)
+    schain = cache.get_schain(schain_name)
+    node = cache.get_node(node_config.id)
+    node_groups = cache.get_previous_schain_groups(schain_name, rotation_id=rotation_id)
 
     is_owner_contract = is_address_contract(skale.web3, schain.mainnet_owner)
 
-    skale_manager_opts = init_skale_manager_opts(skale)
+    skale_manager_opts = cache.get_skale_manager_opts()
     group_index = skale.schains.name_to_id(schain_name)
-    common_bls_public_keys = get_common_bls_public_key(skale, group_index)
+    common_bls_public_keys = cache.get_common_bls_public_key(group_index, rotation_id)
+    logger.info('Config data cache for %s: %d hits, %d misses',
+                schain_name, cache.hits, cache.misses)
 
     if sync_node:
         schain_base_port = node_config.schain_base_port
@@ -263,7 +270,7 @@ def generate_schain_config_with_skale(
         node=node,
         node_id=node_config.id,
         ecdsa_key_name=ecdsa_key_name,
-        rotation_id=rotation_data['rotation_id'],
+        rotation_id=rotation_id,
         schain_nodes_with_schains=schain_nodes_with_schains,
         node_groups=node_groups,
         generation=generation,
@@ -24,6 +24,7 @@ from skale import Skale
 
 from core.node import get_skale_node_version
 from core.node_config import NodeConfig
+from core.schains.config.cache import ConfigDataCache
 from core.schains.config.directory import get_files_with_prefix, schain_config_dir
 from core.schains.config.file_manager import ConfigFileManager, SkaledConfigFilename
 from core.schains.config.generator import generate_schain_config_with_skale
@@ -46,7 +47,8 @@ def create_new_upstream_config(
     ecdsa_sgx_key_name: str,
     rotation_data: dict,
     sync_node: bool,
-    node_options: NodeOptions
+    node_options: NodeOptions,
+    cache: Optional[ConfigDataCache] = None
 ) -> Dict:
     logger.warning(arguments_list_string({
         'sChain name': schain_name,
@@ -62,7 +64,8 @@ def create_new_upstream_config(
         rotation_data=rotation_data,
         ecdsa_key_name=ecdsa_sgx_key_name,
         sync_node=sync_node,
-        node_options=node_options
+        node_options=node_options,
+        cache=cache
     )
     return schain_config.to_dict()
 
@@ -103,7 +106,7 @@ def get_upstream_config_rotation_ids(file_manager: ConfigFileManager) -> List[in
 
 def get_skaled_config_rotations_ids(file_manager: ConfigFileManager) -> List[int]:
     logger.debug('Retrieving rotation_ids')
-    config = file_manager.skaled_config
+    config = file_manager.skaled_config_view
     return get_rotation_ids_from_config(config)
 
 
@@ -129,7 +132,7 @@ def get_finish_ts_from_latest_upstream(file_manager: ConfigFileManager) -> Optio
 
 
 def get_finish_ts_from_skaled_config(file_manager: ConfigFileManager) -> Optional[int]:
-    config = file_manager.skaled_config
+    config = file_manager.skaled_config_view
     return get_latest_finish_ts(config)
 
 
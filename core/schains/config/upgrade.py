@@ -0,0 +1,204 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from skale import Skale
+from skale.contracts.manager.schains import SchainStructure
+
+from core.node import get_skale_node_version
+from core.node_config import NodeConfig
+from core.schains.config.cache import ConfigDataCache
+from core.schains.config.file_manager import ConfigFileManager
+from core.schains.config.helper import get_node_ips_from_config
+from core.schains.config.main import (
+    create_new_upstream_config,
+    get_rotation_ids_from_config,
+    update_schain_config_version
+)
+from tools.configs.schains import CONFIG_UPGRADE_REPORT_FILEPATH, CONFIG_UPGRADE_WORKERS
+from tools.helper import no_hyphens, write_json
+from tools.node_options import NodeOptions
+from tools.resources import get_statsd_client
+from web.models.schain import SChainRecord
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigUpgradeError(Exception):
+    pass
+
+
+@dataclass
+class RegenerationResult:
+    name: str
+    status: str
+    duration: float = 0
+    changed: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def needs_config_upgrade(schain_name: str, stream_version: str) -> bool:
+    """
+    Chain was configured by the previous node version. Chains without upstream
+    config are new and go through the regular config pipeline (DKG first).
+    """
+    record = SChainRecord.get_or_none(SChainRecord.name == schain_name)
+    return record is not None and record.config_version != stream_version and \
+        ConfigFileManager(schain_name).upstream_config_exists()
+
+
+def get_config_invariants(config: Dict) -> Dict:
+    skale_config = config['skaleConfig']
+    return {
+        'schainName': skale_config['sChain']['schainName'],
+        'schainID': skale_config['sChain']['schainID'],
+        'nodeID': skale_config['nodeInfo']['nodeID'],
+        'nodeIps': sorted(get_node_ips_from_config(config)),
+        'rotationIds': get_rotation_ids_from_config(config)
+    }
+
+
+def verify_config_diff(old_config: Dict, new_config: Dict) -> List[str]:
+    """
+    Returns config sections changed by the upgrade. Stream upgrade must not change
+    chain identity, own node or node group, such configs are rejected.
+    """
+    old_invariants = get_config_invariants(old_config)
+    new_invariants = get_config_invariants(new_config)
+    broken = [key for key in old_invariants if old_invariants[key] != new_invariants[key]]
+    if broken:
+        raise ConfigUpgradeError(f'Unexpected changes in {", ".join(broken)}')
+    changed = []
+    for key in sorted(set(old_config) | set(new_config)):
+        old_section, new_section = old_config.get(key), new_config.get(key)
+        if key == 'skaleConfig' and old_section and new_section:
+            changed.extend(
+                f'skaleConfig.{sub}'
+                for sub in sorted(set(old_section) | set(new_section))
+                if old_section.get(sub) != new_section.get(sub)
+            )
+        elif old_section != new_section:
+            changed.append(key)
+    return changed
+
+
+def prefetch_config_data(
+    cache: ConfigDataCache,
+    schain_names: List[str],
+    node_id: int,
+    executor: ThreadPoolExecutor
+) -> None:
+    """ Fetches contract data shared between chains once, group nodes first """
+    groups = list(executor.map(cache.get_node_ids_for_schain, schain_names))
+    node_ids = sorted({node_id}.union(*groups))
+    list(executor.map(cache.get_node, node_ids))
+    list(executor.map(cache.get_schains_for_node, node_ids))
+    list(executor.map(cache.get_schain, schain_names))
+    cache.get_skale_manager_opts()
+
+
+def regenerate_chain_config(
+    skale: Skale,
+    node_config: NodeConfig,
+    schain: SchainStructure,
+    cache: ConfigDataCache,
+    node_options: Optional[NodeOptions] = None
+) -> RegenerationResult:
+    """ Generates config of the new stream version and switches chain to it if it is sane """
+    name = schain.name
+    start = time.monotonic()
+    cfm = ConfigFileManager(name)
+    try:
+        old_config = cfm.latest_upstream_config
+        rotation_data = skale.node_rotation.get_rotation(name)
+        new_config = create_new_upstream_config(
+            skale=skale,
+            node_config=node_config,
+            schain_name=name,
+            generation=schain.generation,
+            ecdsa_sgx_key_name=node_config.sgx_key_name,
+            rotation_data=rotation_data,
+            sync_node=False,
+            node_options=node_options or NodeOptions(),
+            cache=cache
+        )
+        changed = verify_config_diff(old_config, new_config)
+    except ConfigUpgradeError as err:
+        logger.warning('sChain %s - new config rejected: %s', name, err)
+        return RegenerationResult(name, 'rejected', time.monotonic() - start, error=str(err))
+    except Exception as err:
+        logger.exception('sChain %s - config regeneration failed', name)
+        return RegenerationResult(name, 'failed', time.monotonic() - start, error=str(err))
+
+    if changed:
+        cfm.save_new_upstream(rotation_data['rotation_id'], new_config)
+        # Skaled config is rebuilt from the new upstream by the skaled pipeline
+        cfm.remove_skaled_config()
+    update_schain_config_version(name)
+    duration = time.monotonic() - start
+    get_statsd_client().timing(f'admin.config.upgrade.{no_hyphens(name)}', duration * 1000)
+    logger.info('sChain %s - config upgraded in %.2fs, changed: %s', name, duration, changed)
+    return RegenerationResult(
+        name, 'switched' if changed else 'unchanged', duration, changed=changed
+    )
+
+
+def run_config_upgrade(
+    skale: Skale,
+    node_config: NodeConfig,
+    schains: Iterable[SchainStructure],
+    workers: int = CONFIG_UPGRADE_WORKERS,
+    report_filepath: str = CONFIG_UPGRADE_REPORT_FILEPATH
+) -> List[RegenerationResult]:
+    """
+    Regenerates configs of all chains left on the previous stream version before
+    their monitors start, with shared contract data and a bounded worker pool.
+    Chains whose configs could not be regenerated are left to their monitors.
+    """
+    stream_version = get_skale_node_version()
+    schains = [s for s in schains if needs_config_upgrade(s.name, stream_version)]
+    if not schains:
+        return []
+    logger.info('Upgrading configs to %s for %d chains', stream_version, len(schains))
+    start = time.monotonic()
+    cache = ConfigDataCache(skale)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        prefetch_config_data(cache, [s.name for s in schains], node_config.id, executor)
+        results = list(executor.map(
+            lambda schain: regenerate_chain_config(skale, node_config, schain, cache),
+            schains
+        ))
+    duration = time.monotonic() - start
+    logger.info(
+        'Config upgrade finished in %.2fs, cache: %d hits, %d misses',
+        duration, cache.hits, cache.misses
+    )
+    get_statsd_client().timing('admin.config.upgrade.duration', duration * 1000)
+    write_json(report_filepath, {
+        'stream_version': stream_version,
+        'ts': int(time.time()),
+        'duration': duration,
+        'chains': [asdict(result) for result in results]
+    })
+    return results
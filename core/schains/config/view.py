@@ -0,0 +1,219 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FileIdentity = Tuple[int, int, int, int]
+
+VIEW_CACHE_SIZE = 128
+
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb'[^,}\]\s]*')
+_WHITESPACE = re.compile(rb'\s*')
+_OPENING = frozenset(b'{[')
+_CLOSING = frozenset(b'}]')
+
+
+class ConfigViewError(ValueError):
+    pass
+
+
+def get_file_identity(path: str) -> FileIdentity:
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def skip_whitespace(data: bytes, pos: int) -> int:
+    return _WHITESPACE.match(data, pos).end()
+
+
+def count_depth(chunk: bytes) -> int:
+    return chunk.count(b'{') + chunk.count(b'[') - chunk.count(b'}') - chunk.count(b']')
+
+
+def find_closing(data: bytes, start: int, end: int, depth: int) -> int:
+    """ Returns position after the bracket in data[start:end] that brings depth to zero """
+    for pos in range(start, end):
+        char = data[pos]
+        if char in _OPENING:
+            depth += 1
+        elif char in _CLOSING:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+    raise ConfigViewError(f'Unbalanced config value at {start}')
+
+
+def skip_value(data: bytes, pos: int) -> int:
+    """ Returns position after JSON value that starts at pos without decoding it """
+    char = data[pos:pos + 1]
+    if char == b'"':
+        return _STRING.match(data, pos).end()
+    if char not in (b'{', b'['):
+        return _SCALAR.match(data, pos).end()
+    # Brackets are counted with bytes.count in the gaps between strings,
+    # so the python loop runs once per string instead of once per token
+    depth, prev = 0, pos
+    for match in _STRING.finditer(data, pos):
+        gap_depth = count_depth(data[prev:match.start()])
+        if depth + gap_depth <= 0:
+            return find_closing(data, prev, match.start(), depth)
+        depth += gap_depth
+        prev = match.end()
+    return find_closing(data, prev, len(data), depth)
+
+
+def scan_sections(data: bytes) -> Dict[str, Tuple[int, int]]:
+    """ Returns byte offsets of values of the top level keys """
+    sections = {}
+    pos = skip_whitespace(data, 0)
+    if data[pos:pos + 1] != b'{':
+        raise ConfigViewError('Config is not a JSON object')
+    pos = skip_whitespace(data, pos + 1)
+    while data[pos:pos + 1] != b'}':
+        key_match = _STRING.match(data, pos)
+        if key_match is None:
+            raise ConfigViewError(f'Malformed config key at {pos}')
+        key = json.loads(key_match.group())
+        pos = skip_whitespace(data, key_match.end())
+        if data[pos:pos + 1] != b':':
+            raise ConfigViewError(f'Malformed config at {pos}')
+        start = skip_whitespace(data, pos + 1)
+        end = skip_value(data, start)
+        sections[key] = (start, end)
+        pos = skip_whitespace(data, end)
+        if data[pos:pos + 1] == b',':
+            pos = skip_whitespace(data, pos + 1)
+    return sections
+
+
+class SkaledConfigView(Mapping):
+    """
+    Read-only view of the skaled config file. Only top-level sections that are
+    accessed are decoded, so huge sections like accounts are never parsed
+    by the readers that need skaleConfig only.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self._sections: Dict[str, Any] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        with open(self.path, 'rb') as config_file:
+            identity = get_file_identity(self.path)
+            self.offsets = scan_sections(config_file.read())
+        self.identity = identity
+        self._sections.clear()
+
+    def _read_section(self, key: str) -> Any:
+        if get_file_identity(self.path) != self.identity:
+            self._scan()
+        start, end = self.offsets[key]
+        with open(self.path, 'rb') as config_file:
+            config_file.seek(start)
+            raw = config_file.read(end - start)
+        return json.loads(raw)
+
+    def __getitem__(self, key: str) -> Any:
+        with self.lock:
+            if key not in self._sections:
+                if key not in self.offsets:
+                    raise KeyError(key)
+                self._sections[key] = self._read_section(key)
+            return self._sections[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def skale_config(self) -> Dict:
+        return self['skaleConfig']
+
+    @property
+    def node_info(self) -> Dict:
+        return self.skale_config['nodeInfo']
+
+    @property
+    def schain_info(self) -> Dict:
+        return self.skale_config['sChain']
+
+    @property
+    def nodes(self) -> List[Dict]:
+        return self.schain_info['nodes']
+
+    @property
+    def node_id(self) -> int:
+        return self.node_info['nodeID']
+
+    @property
+    def base_port(self) -> int:
+        return self.node_info['basePort']
+
+    @property
+    def node_ips(self) -> List[str]:
+        return [node['ip'] for node in self.nodes]
+
+    @property
+    def own_ip(self) -> Optional[str]:
+        for node in self.nodes:
+            if node['nodeID'] == self.node_id:
+                return node['ip']
+        return None
+
+    @property
+    def node_groups(self) -> Dict:
+        return self.schain_info['nodeGroups']
+
+
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_skaled_config_view(path: str) -> Optional[SkaledConfigView]:
+    """ Returns cached view, config is rescanned only if file identity changed """
+    try:
+        identity = get_file_identity(path)
+    except FileNotFoundError:
+        return None
+    with _cache_lock:
+        view = _cache.get(path)
+        if view is not None and view.identity == identity:
+            _cache.move_to_end(path)
+            return view
+    view = SkaledConfigView(path)
+    with _cache_lock:
+        _cache[path] = view
+        _cache.move_to_end(path)
+        while len(_cache) > VIEW_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return view
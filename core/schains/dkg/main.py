@@ -18,6 +18,7 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import time
 from dataclasses import dataclass
 from time import sleep
 
@@ -29,7 +30,9 @@ from core.schains.dkg.utils import (
     DKGKeyGenerationError, generate_bls_keys, check_response, check_no_complaints,
     check_failed_dkg, wait_for_fail, broadcast_and_check_data
 )
-from tools.helper import write_json
+from tools.helper import no_hyphens, write_json
+from tools.resources import get_statsd_client
+from tools.rpc_router import pinned_block
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +53,18 @@ def get_dkg_client(node_id, schain_name, skale, sgx_key_name, rotation_id):
     return dkg_client
 
 
+def send_step_duration(schain_name: str, step: str, start_ts: float) -> float:
+    end_ts = time.time()
+    get_statsd_client().timing(
+        f'admin.dkg.{step}.{no_hyphens(schain_name)}',
+        (end_ts - start_ts) * 1000
+    )
+    return end_ts
+
+
 def init_bls(dkg_client, node_id, sgx_key_name, rotation_id=0):
     skale, schain_name = dkg_client.skale, dkg_client.schain_name
+    step_ts = time.time()
     n = dkg_client.n
 
     channel_started_time = skale.dkg.get_channel_started_time(dkg_client.group_index)
@@ -69,6 +82,7 @@ def init_bls(dkg_client, node_id, sgx_key_name, rotation_id=0):
         wait_for_fail(skale, schain_name, channel_started_time, "broadcast")
 
     check_failed_dkg(skale, schain_name)
+    step_ts = send_step_duration(schain_name, 'broadcast', step_ts)
 
     is_alright_sent_list = [False for _ in range(n)]
     if check_no_complaints(dkg_client):
@@ -105,6 +119,7 @@ def init_bls(dkg_client, node_id, sgx_key_name, rotation_id=0):
 
     if not dkg_client.is_everyone_sent_algright() and check_no_complaints(dkg_client):
         wait_for_fail(skale, schain_name, channel_started_time, "alright")
+    step_ts = send_step_duration(schain_name, 'alright', step_ts)
 
     if not check_no_complaints(dkg_client):
         check_response(dkg_client)
@@ -120,6 +135,7 @@ def init_bls(dkg_client, node_id, sgx_key_name, rotation_id=0):
                         'Accused node has not sent response. Sending complaint...')
             send_complaint(dkg_client, complainted_node_index, reason=ComplaintReason.NO_RESPONSE)
             wait_for_fail(skale, schain_name, channel_started_time, "response")
+        send_step_duration(schain_name, 'complaint', step_ts)
 
     if False in is_alright_sent_list:
         logger.info(f'sChain: {schain_name}: Not everyone sent alright')
@@ -157,10 +173,16 @@ def run_dkg(
 ) -> DKGResult:
     keys_data, status = None, None
     try:
-        if is_last_dkg_finished(skale, schain_name):
-            logger.info(f'Dkg for {schain_name} is completed. Fetching data')
-            dkg_client.fetch_all_broadcasted_data()
-        elif skale.dkg.is_channel_opened(
+        # Completion check and broadcasted data are read at the same block
+        with pinned_block(skale.web3) as block:
+            dkg_finished = is_last_dkg_finished(skale, schain_name)
+            if dkg_finished:
+                logger.info(f'Dkg for {schain_name} is completed. Fetching data, block {block}')
+                with get_statsd_client().timer(
+                    f'admin.dkg.fetch_data.{no_hyphens(schain_name)}'
+                ):
+                    dkg_client.fetch_all_broadcasted_data()
+        if not dkg_finished and skale.dkg.is_channel_opened(
             skale.schains.name_to_group_id(schain_name)
         ):
             logger.info(f'Starting dkg procedure for {schain_name}')
@@ -168,7 +190,9 @@ def run_dkg(
                 skale.schains.name_to_group_id(schain_name)
             ):
                 status = DKGStatus.IN_PROGRESS
-                init_bls(dkg_client, node_id, sgx_key_name, rotation_id)
+                # Procedure waits for new blocks, so only the endpoint is pinned
+                with pinned_block(skale.web3, block=False):
+                    init_bls(dkg_client, node_id, sgx_key_name, rotation_id)
             else:
                 status = DKGStatus.FAILED
     except DkgError as e:
@@ -180,7 +204,10 @@ def run_dkg(
 
     if status != DKGStatus.FAILED:
         try:
-            keys_data = generate_bls_keys(dkg_client)
+            with get_statsd_client().timer(
+                f'admin.dkg.key_generation.{no_hyphens(schain_name)}'
+            ):
+                keys_data = generate_bls_keys(dkg_client)
         except DKGKeyGenerationError as e:
             logger.info(
                 f'sChain {schain_name} DKG failed during key generation, err {e}')
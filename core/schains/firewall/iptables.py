@@ -32,6 +32,7 @@ logger = logging.getLogger(__name__)
 TABLE = 'filter'
 CHAIN = 'INPUT'
 
+# Replaced with a forkserver lock by core.schains.zygote in zygote mode
 plock = multiprocessing.Lock()
 
 
@@ -64,14 +65,14 @@ class IptablesController(IHostFirewallController):
         with plock:
             self.iptc.Table(self.table).refresh()
 
-    def add_rule(self, rule: SChainRule) -> None:
-        if not self.has_rule(rule):
+    def add_rule(self, rule: SChainRule, check: bool = True) -> None:
+        if not check or not self.has_rule(rule):
             rule_d = self.schain_rule_to_rule_d(rule)
             with plock:
                 self.iptc.easy.insert_rule(self.table, self.chain, rule_d)  # type: ignore  # noqa
 
-    def remove_rule(self, rule: SChainRule) -> None:
-        if self.has_rule(rule):
+    def remove_rule(self, rule: SChainRule, check: bool = True) -> None:
+        if not check or self.has_rule(rule):
             rule_d = self.schain_rule_to_rule_d(rule)
             with plock:
                 self.iptc.easy.delete_rule(self.table, self.chain, rule_d)  # type: ignore  # noqa
@@ -0,0 +1,224 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from core.schains.config.file_manager import ConfigFileManager
+from core.schains.config.helper import (
+    get_base_port_from_config,
+    get_node_ips_from_config,
+    get_own_ip_from_config
+)
+from core.schains.external_config import ExternalConfig
+from core.schains.firewall.iptables import IptablesController
+from core.schains.firewall.rule_controller import (
+    IptablesSChainRuleController,
+    SChainRuleController
+)
+from core.schains.firewall.types import IHostFirewallController, SChainRule
+from tools.configs.schains import FIREWALL_REPORT_FILEPATH, FIREWALL_REPORT_MAX_AGE
+from tools.helper import read_json, write_json_atomic
+from tools.resources import get_statsd_client
+
+
+logger = logging.getLogger(__name__)
+
+
+def rules_digest(rules: Iterable[SChainRule]) -> str:
+    plain = [list(rule) for rule in sorted(rules)]
+    return hashlib.sha256(json.dumps(plain).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class FirewallReport:
+    """Result of the node-wide firewall reconciliation"""
+    ts: int = 0
+    duration: float = 0
+    added: int = 0
+    removed: int = 0
+    chains: Dict[str, Dict] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'ts': self.ts,
+            'duration': self.duration,
+            'added': self.added,
+            'removed': self.removed,
+            'chains': self.chains
+        }
+
+    def is_fresh(self, max_age: int = FIREWALL_REPORT_MAX_AGE) -> bool:
+        return time.time() - self.ts <= max_age
+
+    def is_synced(self, name: str, digest: str) -> bool:
+        chain = self.chains.get(name)
+        if chain is None:
+            return False
+        return chain['synced'] and chain['digest'] == digest
+
+    def save(self, path: str = FIREWALL_REPORT_FILEPATH) -> None:
+        write_json_atomic(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path: str = FIREWALL_REPORT_FILEPATH) -> Optional['FirewallReport']:
+        if not os.path.isfile(path):
+            return None
+        try:
+            return cls(**read_json(path))
+        except (ValueError, TypeError):
+            logger.warning('Firewall report %s is broken', path)
+            return None
+
+
+class FirewallReconciler:
+    """
+    Computes expected rules for all sChains on the node, reads the host
+    table once and applies the combined difference.
+    """
+
+    def __init__(
+        self,
+        host_controller: IHostFirewallController,
+        report_path: str = FIREWALL_REPORT_FILEPATH
+    ) -> None:
+        self.host_controller = host_controller
+        self.report_path = report_path
+        self.statsd_client = get_statsd_client()
+
+    @classmethod
+    def managed_rules(
+        cls,
+        rules: Iterable[SChainRule],
+        rc: SChainRuleController
+    ) -> Set[SChainRule]:
+        first_port = rc.base_port
+        last_port = rc.base_port + rc.ports_per_schain - 1
+        return set(filter(lambda r: first_port <= r.port <= last_port, rules))
+
+    def reconcile(self, controllers: Iterable[SChainRuleController]) -> FirewallReport:
+        start = time.time()
+        report = FirewallReport(ts=int(start))
+        actual = list(self.host_controller.rules)
+        for rc in controllers:
+            expected = set(rc.expected_rules())
+            current = self.managed_rules(actual, rc)
+            to_add, to_remove = expected - current, current - expected
+            synced = True
+            try:
+                # The difference is computed from a single table read,
+                # so per rule existence checks are skipped
+                for rule in sorted(to_add):
+                    self.host_controller.add_rule(rule, check=False)
+                for rule in sorted(to_remove):
+                    self.host_controller.remove_rule(rule, check=False)
+            except Exception:
+                logger.exception('Firewall reconciliation failed for %s', rc.name)
+                synced = False
+            report.added += len(to_add)
+            report.removed += len(to_remove)
+            report.chains[rc.name] = {
+                'synced': synced,
+                'digest': rules_digest(expected),
+                'added': len(to_add),
+                'removed': len(to_remove)
+            }
+        report.duration = round(time.time() - start, 3)
+        logger.info(
+            'Firewall reconciled for %d chains in %.3fs, added: %d, removed: %d',
+            len(report.chains), report.duration, report.added, report.removed
+        )
+        self.send_metrics(report)
+        report.save(self.report_path)
+        return report
+
+    def send_metrics(self, report: FirewallReport) -> None:
+        self.statsd_client.timing('admin.firewall.reconcile.duration', report.duration * 1000)
+        self.statsd_client.gauge('admin.firewall.reconcile.chains', len(report.chains))
+        self.statsd_client.incr('admin.firewall.reconcile.rules_added', report.added)
+        self.statsd_client.incr('admin.firewall.reconcile.rules_removed', report.removed)
+
+
+def get_configured_rule_controller(name: str) -> Optional[IptablesSChainRuleController]:
+    econfig = ExternalConfig(name)
+    cfm = ConfigFileManager(name)
+    # While ip change reload is pending the monitor installs rules
+    # from the upstream config, use the same source here
+    conf = None
+    if econfig.reload_ts is not None:
+        conf = cfm.latest_upstream_config
+    conf = conf or cfm.skaled_config_view
+    if conf is None:
+        return None
+    return IptablesSChainRuleController(
+        name=name,
+        base_port=get_base_port_from_config(conf),
+        own_ip=get_own_ip_from_config(conf),
+        node_ips=get_node_ips_from_config(conf),
+        sync_ip_ranges=econfig.ranges
+    )
+
+
+def reconcile_node_firewall(
+    schain_names: List[str],
+    host_controller: Optional[IHostFirewallController] = None
+) -> FirewallReport:
+    controllers = []
+    for name in schain_names:
+        rc = get_configured_rule_controller(name)
+        if rc is None:
+            logger.info('No skaled config for %s, skipping firewall reconciliation', name)
+        else:
+            controllers.append(rc)
+    host_controller = host_controller or IptablesController()
+    return FirewallReconciler(host_controller).reconcile(controllers)
+
+
+def is_synced_by_report(
+    name: str,
+    expected_rules: Iterable[SChainRule],
+    path: str = FIREWALL_REPORT_FILEPATH
+) -> bool:
+    report = FirewallReport.load(path)
+    if report is None or not report.is_fresh():
+        return False
+    return report.is_synced(name, rules_digest(expected_rules))
+
+
+class ReconciledSChainRuleController(IptablesSChainRuleController):
+    """
+    Trusts a fresh node-wide reconciliation result for the same expected rules
+    and falls back to scanning the host table otherwise.
+    """
+
+    def is_rules_synced(self) -> bool:
+        if is_synced_by_report(self.name, self.expected_rules()):
+            logger.info('Firewall rules for %s are synced according to the report', self.name)
+            return True
+        return super().is_rules_synced()
+
+
+def get_reconciled_rule_controller(name: str) -> ReconciledSChainRuleController:
+    logger.info('Creating reconciled rule controller for %s', name)
+    return ReconciledSChainRuleController(name=name)
@@ -28,6 +28,9 @@ from skale.schain_config import PORTS_PER_SCHAIN  # noqa
 
 @total_ordering
 class SChainRule(namedtuple('SChainRule', ['port', 'first_ip', 'last_ip'])):
+    # No per-rule __dict__, rule is just the tuple
+    __slots__ = ()
+
     def __new__(
         cls,
         port: int,
@@ -72,11 +75,11 @@ IpRange = namedtuple('IpRange', ['start_ip', 'end_ip'])
 
 class IHostFirewallController(ABC):
     @abstractmethod
-    def add_rule(self, rule: SChainRule) -> None:  # pragma: no cover
+    def add_rule(self, rule: SChainRule, check: bool = True) -> None:  # pragma: no cover
         pass
 
     @abstractmethod
-    def remove_rule(self, rule: SChainRule) -> None:  # pragma: no cover
+    def remove_rule(self, rule: SChainRule, check: bool = True) -> None:  # pragma: no cover
         pass
 
     @property
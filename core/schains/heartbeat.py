@@ -0,0 +1,232 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+from tools.configs.schains import HEARTBEAT_TABLE_FILEPATH, HEARTBEAT_TABLE_SLOTS
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'SKHB'
+VERSION = 1
+NAME_SIZE = 128
+TASK_SIZE = 16
+READ_ATTEMPTS = 100
+
+# magic, version, number of slots
+HEADER = struct.Struct('<4sII')
+# seq, name, pid, start ts, heartbeat ts, current task, task start ts
+SLOT = struct.Struct(f'<Q{NAME_SIZE}sqqq{TASK_SIZE}sq')
+SEQ = struct.Struct('<Q')
+
+
+class HeartbeatTableError(Exception):
+    pass
+
+
+@dataclass
+class Heartbeat:
+    name: str
+    pid: int
+    start_ts: int
+    ts: int
+    task: str
+    task_ts: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class HeartbeatTable:
+    """
+    Fixed-layout memory-mapped table with one slot per sChain monitor process.
+    Each slot is written only by the monitor process that owns it (threads of
+    that process are serialized by the table lock), readers use the slot
+    sequence number to skip torn records. File lock is taken only to claim
+    or release the slot, regular updates touch nothing but the mapping.
+    """
+
+    def __init__(
+        self,
+        path: str = HEARTBEAT_TABLE_FILEPATH,
+        slots: int = HEARTBEAT_TABLE_SLOTS
+    ) -> None:
+        self.path = path
+        self.slots = slots
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked():
+            size = os.fstat(self._fd).st_size
+            if size == 0:
+                os.ftruncate(self._fd, self.size)
+                os.pwrite(self._fd, HEADER.pack(MAGIC, VERSION, self.slots), 0)
+            else:
+                magic, version, self.slots = HEADER.unpack(os.pread(self._fd, HEADER.size, 0))
+                if magic != MAGIC or version != VERSION or size != self.size:
+                    raise HeartbeatTableError(f'Heartbeat table {path} has unknown layout')
+        self._mm = mmap.mmap(self._fd, self.size)
+        self._indexes: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return HEADER.size + SLOT.size * self.slots
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * SLOT.size
+
+    def _read_slot(self, index: int) -> Optional[Heartbeat]:
+        offset = self._offset(index)
+        for _ in range(READ_ATTEMPTS):
+            seq, name, pid, start_ts, ts, task, task_ts = SLOT.unpack_from(self._mm, offset)
+            if seq % 2 == 0 and SEQ.unpack_from(self._mm, offset)[0] == seq:
+                break
+        else:
+            logger.warning('Heartbeat slot %d is constantly updating', index)
+        name = name.rstrip(b'\0').decode()
+        if not name:
+            return None
+        return Heartbeat(
+            name=name,
+            pid=pid,
+            start_ts=start_ts,
+            ts=ts,
+            task=task.rstrip(b'\0').decode(),
+            task_ts=task_ts
+        )
+
+    def _write_slot(self, index: int, hb: Heartbeat) -> None:
+        offset = self._offset(index)
+        seq = SEQ.unpack_from(self._mm, offset)[0]
+        SEQ.pack_into(self._mm, offset, seq + 1)
+        SLOT.pack_into(
+            self._mm,
+            offset,
+            seq + 1,
+            hb.name.encode(),
+            hb.pid,
+            hb.start_ts,
+            hb.ts,
+            hb.task.encode()[:TASK_SIZE],
+            hb.task_ts
+        )
+        SEQ.pack_into(self._mm, offset, seq + 2)
+
+    def _find(self, name: str) -> Optional[int]:
+        index = self._indexes.get(name)
+        if index is not None:
+            hb = self._read_slot(index)
+            if hb is not None and hb.name == name:
+                return index
+            self._indexes.pop(name, None)
+        for index in range(self.slots):
+            hb = self._read_slot(index)
+            if hb is not None and hb.name == name:
+                self._indexes[name] = index
+                return index
+        return None
+
+    def _owns(self, index: int, name: str) -> bool:
+        """ Slot is written only by its owner, so the name can be read without seq checks """
+        offset = self._offset(index) + SEQ.size
+        return self._mm[offset:offset + NAME_SIZE].rstrip(b'\0') == name.encode()
+
+    def _claim(self, name: str) -> int:
+        index = self._indexes.get(name)
+        if index is not None and self._owns(index, name):
+            return index
+        if len(name.encode()) > NAME_SIZE:
+            raise HeartbeatTableError(f'sChain name {name} is too long for heartbeat table')
+        with self._locked():
+            index = self._find(name)
+            if index is not None:
+                return index
+            for index in range(self.slots):
+                if self._read_slot(index) is None:
+                    self._write_slot(index, Heartbeat(name, 0, 0, 0, '', 0))
+                    self._indexes[name] = index
+                    return index
+        raise HeartbeatTableError(f'No free slots left in heartbeat table {self.path}')
+
+    def get(self, name: str) -> Optional[Heartbeat]:
+        index = self._find(name)
+        if index is None:
+            return None
+        return self._read_slot(index)
+
+    def all(self) -> List[Heartbeat]:
+        return list(filter(None, map(self._read_slot, range(self.slots))))
+
+    def register(self, name: str, pid: int, ts: int) -> None:
+        with self._write_lock:
+            index = self._claim(name)
+            self._write_slot(index, Heartbeat(name, pid, ts, ts, '', 0))
+
+    def update(self, name: str, **fields) -> None:
+        with self._write_lock:
+            index = self._claim(name)
+            hb = self._read_slot(index)
+            for field_name, value in fields.items():
+                setattr(hb, field_name, value)
+            self._write_slot(index, hb)
+
+    def release(self, name: str) -> None:
+        with self._write_lock, self._locked():
+            index = self._find(name)
+            if index is not None:
+                self._write_slot(index, Heartbeat('', 0, 0, 0, '', 0))
+                del self._indexes[name]
+
+
+_tables: Dict[int, HeartbeatTable] = {}
+
+
+def get_heartbeat_table() -> HeartbeatTable:
+    """ Returns table opened by the current process (file locks are not shared after fork) """
+    pid = os.getpid()
+    if pid not in _tables:
+        for inherited in _tables.values():
+            inherited.close()
+        _tables.clear()
+        _tables[pid] = HeartbeatTable(path=HEARTBEAT_TABLE_FILEPATH)
+    return _tables[pid]
+
+
+def get_heartbeats() -> List[Dict]:
+    return [hb.to_dict() for hb in get_heartbeat_table().all()]
@@ -17,14 +17,18 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import json
 import logging
 import os
+import threading
+import time
 from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from flask import g
 from skale.dataclasses.skaled_ports import SkaledPorts
-from websocket import create_connection
+import websockets
 
 from core.schains.config.directory import schain_config_dir
 from core.schains.config.file_manager import ConfigFileManager
@@ -37,6 +41,9 @@ from tools.configs.ima import (
     MAINNET_IMA_ABI_FILEPATH,
     IMA_STATE_CONTAINER_PATH,
     IMA_NETWORK_BROWSER_FILEPATH,
+    IMA_HEALTH_CACHE_TTL,
+    IMA_HEALTHCHECK_DEADLINE,
+    IMA_HEALTHCHECK_TIMEOUT,
     DEFAULT_TIME_FRAME
 )
 from tools.configs.schains import SCHAINS_DIR_PATH
@@ -124,19 +131,19 @@ def get_current_node_from_nodes(node_id, schain_nodes):
 
 
 def get_localhost_http_endpoint(schain_name):
-    config = ConfigFileManager(schain_name).skaled_config
+    config = ConfigFileManager(schain_name).skaled_config_view
     ports = get_schain_ports_from_config(config)
     return f'http://127.0.0.1:{ports["http"]}'
 
 
 def get_public_http_endpoint(public_node_info, schain_name):
-    config = ConfigFileManager(schain_name).skaled_config
+    config = ConfigFileManager(schain_name).skaled_config_view
     ports = get_schain_ports_from_config(config)
     return f'http://{public_node_info["ip"]}:{ports["http"]}'
 
 
 def get_local_http_endpoint(node_info, schain_name):
-    config = ConfigFileManager(schain_name).skaled_config
+    config = ConfigFileManager(schain_name).skaled_config_view
     ports = get_schain_ports_from_config(config)
     return f'http://{node_info["bindIP"]}:{ports["http"]}'
 
@@ -146,7 +153,7 @@ def schain_index_to_node_number(node):
 
 
 def get_ima_env(schain_name: str, mainnet_chain_id: int, time_frame: int) -> ImaEnv:
-    schain_config = ConfigFileManager(schain_name).skaled_config
+    schain_config = ConfigFileManager(schain_name).skaled_config_view
     node_info = schain_config["skaleConfig"]["nodeInfo"]
     bls_key_name = node_info['wallets']['ima']['keyShareName']
     schain_nodes = schain_config["skaleConfig"]["sChain"]
@@ -190,7 +197,7 @@ def get_ima_version_after_migration() -> str:
 
 
 def get_ima_monitoring_port(schain_name):
-    schain_config = ConfigFileManager(schain_name).skaled_config
+    schain_config = ConfigFileManager(schain_name).skaled_config_view
     if schain_config:
         node_info = schain_config["skaleConfig"]["nodeInfo"]
         return int(node_info["imaMonitoringPort"])
@@ -199,87 +206,170 @@ def get_ima_monitoring_port(schain_name):
 
 
 def get_ima_rpc_port(schain_name):
-    config = ConfigFileManager(schain_name).skaled_config
+    config = ConfigFileManager(schain_name).skaled_config_view
     base_port = config['skaleConfig']['nodeInfo']['basePort']
     return base_port + SkaledPorts.IMA_RPC.value
 
 
-def get_ima_container_statuses():
-    containers_list = g.docker_utils.get_all_ima_containers(
-        all=True, format=True)
-    ima_containers = [{'name': container['name'], 'state': container['state']['Status']}
-                      for container in containers_list]
-    return ima_containers
+def get_ima_container_statuses(docker_utils=None) -> Dict[str, str]:
+    """ Returns IMA container states indexed by container name """
+    docker_utils = docker_utils or g.docker_utils
+    return {
+        container.name: container.status
+        for container in docker_utils.get_all_ima_containers(all=True)
+    }
 
 
-def request_ima_healthcheck(endpoint):
-    result, ws = None, None
+def parse_ima_healthcheck(result) -> Optional[Dict]:
+    logger.debug('Received %s', result)
+    if not result:
+        return None
+    data_json = json.loads(result)
+    return {'errors': data_json['last_transfer_errors'],
+            'categories': data_json['last_error_categories']}
+
+
+async def request_ima_healthcheck(
+    endpoint: str,
+    timeout: float = IMA_HEALTHCHECK_TIMEOUT
+) -> Optional[Dict]:
+    async with websockets.connect(
+        endpoint,
+        open_timeout=timeout,
+        close_timeout=timeout
+    ) as ws:
+        await ws.send('{ "id": 1, "method": "get_last_transfer_errors"}')
+        result = await asyncio.wait_for(ws.recv(), timeout=timeout)
+    return parse_ima_healthcheck(result)
+
+
+def ima_health_result(error: Optional[str] = None, errors=None, categories=None) -> Dict:
+    return {'error': error,
+            'last_ima_errors': errors or [],
+            'error_categories': categories or []}
+
+
+async def collect_ima_healthcheck(schain_name: str, ima_port: int, deadline: float) -> Dict:
+    endpoint = f'ws://localhost:{ima_port}'
     try:
-        ws = create_connection(endpoint, timeout=5)
-        ws.send('{ "id": 1, "method": "get_last_transfer_errors"}')
-        result = ws.recv()
-    finally:
-        if ws and ws.connected:
-            ws.close()
-    logger.debug(f'Received {result}')
-    if result:
-        data_json = json.loads(result)
-        data = {'errors': data_json['last_transfer_errors'],
-                'categories': data_json['last_error_categories']}
-    else:
-        data = None
-    return data
+        ima_healthcheck = await asyncio.wait_for(
+            request_ima_healthcheck(endpoint),
+            timeout=deadline
+        )
+    except asyncio.TimeoutError:
+        logger.info('IMA healthcheck for %s timed out after %ds', schain_name, deadline)
+        return ima_health_result(error=f'Request timed out after {deadline}s')
+    except Exception as err:
+        logger.info('Error occurred while checking IMA state on %s: %s', endpoint, err)
+        return ima_health_result(error=repr(err))
+    if ima_healthcheck is None:
+        return ima_health_result(error='Request failed')
+    return ima_health_result(
+        errors=ima_healthcheck['errors'],
+        categories=ima_healthcheck['categories']
+    )
+
+
+async def collect_ima_healthchecks(ports: Dict[str, int], deadline: float) -> Dict[str, Dict]:
+    results = await asyncio.gather(*(
+        collect_ima_healthcheck(name, port, deadline)
+        for name, port in ports.items()
+    ))
+    return dict(zip(ports, results))
 
 
-def get_ima_log_checks():
-    ima_containers = get_ima_container_statuses()
-    all_ima_healthchecks = []
+def get_ima_log_checks(docker_utils=None, deadline: float = IMA_HEALTHCHECK_DEADLINE) -> List:
+    """
+    Collects IMA agent healthchecks for all chains concurrently,
+    each agent request is bounded by deadline
+    """
+    ima_containers = get_ima_container_statuses(docker_utils)
+    results, ports = {}, {}
     for schain_name in os.listdir(SCHAINS_DIR_PATH):
-        error_text = None
-        errors = []
-        categories = []
-        container_name = f'skale_ima_{schain_name}'
-        cont_data = next(
-            (item for item in ima_containers if item["name"] == container_name), None)
-        if cont_data is None:
+        state = ima_containers.get(f'skale_ima_{schain_name}')
+        if state is None:
+            continue
+        if state != 'running':
+            results[schain_name] = ima_health_result(error='IMA docker container is not running')
+            continue
+        try:
+            ima_port = get_ima_monitoring_port(schain_name)
+        except KeyError as err:
+            logger.exception(err)
+            results[schain_name] = ima_health_result(error=repr(err))
             continue
-        elif cont_data['state'] != 'running':
-            error_text = 'IMA docker container is not running'
-        else:
-            try:
-                ima_port = get_ima_monitoring_port(schain_name)
-            except KeyError as err:
-                logger.exception(err)
-                error_text = repr(err)
-            else:
-                if ima_port is None:
-                    continue
-                endpoint = f'ws://localhost:{ima_port}'
-                try:
-                    ima_healthcheck = request_ima_healthcheck(endpoint)
-                except Exception as err:
-                    logger.info(
-                        f'Error occurred while checking IMA state on {endpoint}')
-                    logger.exception(err)
-                    error_text = repr(err)
-                else:
-                    if ima_healthcheck is None:
-                        error_text = 'Request failed'
-                    else:
-                        errors = ima_healthcheck['errors']
-                        categories = ima_healthcheck['categories']
-        all_ima_healthchecks.append({schain_name: {'error': error_text,
-                                                   'last_ima_errors': errors,
-                                                   'error_categories': categories}})
-    return all_ima_healthchecks
+        if ima_port is not None:
+            results[schain_name] = None
+            ports[schain_name] = ima_port
+
+    if ports:
+        results.update(asyncio.run(collect_ima_healthchecks(ports, deadline)))
+    return [{schain_name: result} for schain_name, result in results.items()]
+
+
+class ImaHealthCache:
+    """
+    Keeps the latest IMA healthchecks. Stale result is returned immediately
+    while the new one is collected in the background thread.
+    """
+
+    def __init__(self, ttl: float = IMA_HEALTH_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.checks: Optional[List] = None
+        self.ts = 0.0
+
+    def is_fresh(self) -> bool:
+        return self.checks is not None and time.monotonic() - self.ts < self.ttl
+
+    def refresh(self, docker_utils=None) -> List:
+        checks = get_ima_log_checks(docker_utils)
+        with self.lock:
+            self.checks, self.ts = checks, time.monotonic()
+        return checks
+
+    def _background_refresh(self, docker_utils) -> None:
+        try:
+            self.refresh(docker_utils)
+        except Exception:
+            logger.exception('Background IMA healthchecks refresh failed')
+
+    def get(self, docker_utils=None) -> List:
+        docker_utils = docker_utils or g.docker_utils
+        with self.lock:
+            checks = self.checks
+            if self.is_fresh():
+                return checks
+            if checks is not None:
+                if self.refresh_thread is None or not self.refresh_thread.is_alive():
+                    self.refresh_thread = threading.Thread(
+                        target=self._background_refresh,
+                        args=(docker_utils,),
+                        name='ima-health-refresh',
+                        daemon=True
+                    )
+                    self.refresh_thread.start()
+                return checks
+        return self.refresh(docker_utils)
+
+
+ima_health_cache = ImaHealthCache()
+
+
+def get_cached_ima_log_checks(docker_utils=None) -> List:
+    return ima_health_cache.get(docker_utils)
+
+
+def get_migration_schedule(path: str = IMA_MIGRATION_PATH, env_type: str = ENV_TYPE) -> Dict:
+    if os.path.isfile(path):
+        return safe_load_yml(path)[env_type] or {}
+    else:
+        return {}
 
 
 def get_migration_ts(name: str, path: str = IMA_MIGRATION_PATH, env_type: str = ENV_TYPE) -> int:
-    if os.path.isfile(path):
-        schedule = safe_load_yml(IMA_MIGRATION_PATH)[env_type]
-        return schedule.get(name, 0)
-    else:
-        return 0
+    return get_migration_schedule(path, env_type).get(name, 0)
 
 
 def get_ima_time_frame(name: str, after: bool = False) -> int:
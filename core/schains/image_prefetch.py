@@ -0,0 +1,166 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from core.schains.ima import get_migration_schedule
+from core.schains.runner import get_image_name
+from tools.configs.containers import (
+    CONTAINERS_INFO,
+    IMA_CONTAINER,
+    IMAGE_PREFETCH_RETRY_INTERVAL,
+    IMAGE_PREFETCH_STATE_PATH,
+    IMAGE_PREFETCH_WORKERS,
+    SCHAIN_CONTAINER
+)
+from tools.docker_utils import DockerUtils
+from tools.helper import read_json, write_json
+from tools.resources import get_statsd_client
+from tools.str_formatters import arguments_list_string
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImagePull:
+    status: str  # present, pulled or failed
+    ts: int
+    duration: float = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class PrefetchTarget:
+    image: str
+    deadline: int  # ts when image is needed, 0 for images needed right away
+
+
+def get_prefetch_targets(containers_info: Dict = CONTAINERS_INFO) -> List[PrefetchTarget]:
+    """ Returns images monitors will need, the most urgent first """
+    targets = [
+        PrefetchTarget(get_image_name(SCHAIN_CONTAINER), 0),
+        PrefetchTarget(get_image_name(IMA_CONTAINER), 0)
+    ]
+    if containers_info[IMA_CONTAINER].get('new_version'):
+        schedule = get_migration_schedule()
+        deadline = min(schedule.values()) if schedule else 0
+        targets.append(PrefetchTarget(get_image_name(IMA_CONTAINER, new=True), deadline))
+    unique: Dict[str, PrefetchTarget] = {}
+    for target in targets:
+        unique.setdefault(target.image, target)
+    return sorted(unique.values(), key=lambda target: target.deadline)
+
+
+def read_prefetch_state(path: str = IMAGE_PREFETCH_STATE_PATH) -> Dict[str, ImagePull]:
+    try:
+        return {image: ImagePull(**pull) for image, pull in read_json(path).items()}
+    except (FileNotFoundError, ValueError, TypeError):
+        return {}
+
+
+class ImagePrefetcher:
+    """
+    Pulls images before monitors need them. Pulls run in a small bounded pool
+    without holding docker_lock, so monitor image checks are not blocked while
+    a big image is downloading.
+    """
+
+    def __init__(
+        self,
+        dutils: DockerUtils,
+        workers: int = IMAGE_PREFETCH_WORKERS,
+        state_path: str = IMAGE_PREFETCH_STATE_PATH,
+        retry_interval: int = IMAGE_PREFETCH_RETRY_INTERVAL
+    ) -> None:
+        self.dutils = dutils
+        self.workers = workers
+        self.state_path = state_path
+        self.retry_interval = retry_interval
+        self.state = read_prefetch_state(state_path)
+        self.state_lock = threading.Lock()
+
+    def should_retry(self, image: str) -> bool:
+        pull = self.state.get(image)
+        return pull is None or pull.status != 'failed' or \
+            time.time() - pull.ts > self.retry_interval
+
+    def save_state(self) -> None:
+        with self.state_lock:
+            write_json(self.state_path, {image: asdict(pull) for image, pull in self.state.items()})
+
+    def pull(self, image: str) -> ImagePull:
+        logger.info('Prefetching image %s', image)
+        start = time.monotonic()
+        try:
+            self.dutils.pull(image, lock=False)
+        except Exception as err:
+            logger.exception('Prefetching image %s failed', image)
+            result = ImagePull('failed', int(time.time()), error=repr(err))
+        else:
+            result = ImagePull('pulled', int(time.time()), time.monotonic() - start)
+            get_statsd_client().timing('admin.images.prefetch', result.duration * 1000)
+        with self.state_lock:
+            self.state[image] = result
+        self.save_state()
+        return result
+
+    def run(self, targets: Optional[List[PrefetchTarget]] = None) -> Dict[str, ImagePull]:
+        targets = targets if targets is not None else get_prefetch_targets()
+        missing = []
+        for target in targets:
+            if self.dutils.pulled(target.image):
+                if target.image not in self.state or self.state[target.image].status == 'failed':
+                    self.state[target.image] = ImagePull('present', int(time.time()))
+            elif self.should_retry(target.image):
+                missing.append(target.image)
+        if missing:
+            logger.info(arguments_list_string({'Images': missing}, 'Prefetching images'))
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(self.pull, missing))
+        self.save_state()
+        return dict(self.state)
+
+
+_prefetch_thread: Optional[threading.Thread] = None
+
+
+def run_image_prefetch(dutils: Optional[DockerUtils] = None) -> None:
+    try:
+        ImagePrefetcher(dutils or DockerUtils()).run()
+    except Exception:
+        logger.exception('Image prefetch failed')
+
+
+def start_image_prefetch(dutils: Optional[DockerUtils] = None) -> threading.Thread:
+    """ Starts prefetch in the background, returns already running one if any """
+    global _prefetch_thread
+    if _prefetch_thread is None or not _prefetch_thread.is_alive():
+        _prefetch_thread = threading.Thread(
+            target=run_image_prefetch,
+            args=(dutils,),
+            name='image-prefetch',
+            daemon=True
+        )
+        _prefetch_thread.start()
+    return _prefetch_thread
@@ -0,0 +1,147 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Union
+
+from filelock import FileLock
+from skale import Skale
+from skale.contracts.manager.schains import SchainStructure
+
+from tools.configs.schains import (
+    LEAVING_HISTORY_DIR_PATH,
+    LEAVING_HISTORY_FINISH_MARGIN,
+    LEAVING_HISTORY_WORKERS
+)
+from tools.helper import read_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LeavingEntry:
+    schain_id: str
+    finished_rotation: int
+    name: str  # empty for removed chains
+
+    def is_finished(self, now: float, margin: int = LEAVING_HISTORY_FINISH_MARGIN) -> bool:
+        """ Finished entries never change, rotation of the node is over """
+        return now > self.finished_rotation + margin
+
+
+def schain_id_to_hex(schain_id: Union[bytes, str]) -> str:
+    if isinstance(schain_id, bytes):
+        return '0x' + schain_id.hex()
+    return schain_id.lower() if schain_id.startswith('0x') else '0x' + schain_id.lower()
+
+
+class LeavingHistoryIndex:
+    """
+    Local copy of the node leaving history. The history on contracts only
+    grows, so names are resolved once for the new entries and kept on disk.
+    """
+
+    def __init__(
+        self,
+        skale: Skale,
+        node_id: int,
+        dir_path: str = LEAVING_HISTORY_DIR_PATH,
+        workers: int = LEAVING_HISTORY_WORKERS
+    ) -> None:
+        self.skale = skale
+        self.node_id = node_id
+        self.workers = workers
+        self.path = os.path.join(dir_path, f'{node_id}.json')
+        self.lock = FileLock(self.path + '.lock')
+        os.makedirs(dir_path, exist_ok=True)
+
+    def read(self) -> List[LeavingEntry]:
+        try:
+            return [LeavingEntry(**entry) for entry in read_json(self.path)['entries']]
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return []
+
+    def _write(self, entries: List[LeavingEntry]) -> None:
+        write_json_atomic(self.path, {
+            'node_id': self.node_id,
+            'entries': [asdict(entry) for entry in entries]
+        })
+
+    def _resolve_names(self, schain_ids: List[str]) -> List[str]:
+        if not schain_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(schain_ids))) as executor:
+            return list(executor.map(lambda sid: self.skale.schains.get(sid).name, schain_ids))
+
+    def refresh(self) -> List[LeavingEntry]:
+        history = [
+            (schain_id_to_hex(entry['schain_id']), entry['finished_rotation'])
+            for entry in self.skale.node_rotation.get_leaving_history(self.node_id)
+        ]
+        with self.lock:
+            entries = self.read()
+            known = [(e.schain_id, e.finished_rotation) for e in entries]
+            if history[:len(known)] != known:
+                logger.warning('Leaving history of node %d changed, rebuilding index',
+                               self.node_id)
+                entries = []
+            new = history[len(entries):]
+            if not new:
+                return entries
+            names = self._resolve_names([schain_id for schain_id, _ in new])
+            entries.extend(
+                LeavingEntry(schain_id, finished_rotation, name)
+                for (schain_id, finished_rotation), name in zip(new, names)
+            )
+            logger.info('Added %d entries to leaving history index of node %d',
+                        len(new), self.node_id)
+            self._write(entries)
+            return entries
+
+
+def fetch_leaving_schain(skale: Skale, entry: LeavingEntry) -> Optional[SchainStructure]:
+    schain = skale.schains.get(entry.schain_id)
+    if schain.name and skale.node_rotation.is_rotation_active(schain.name):
+        schain.active = True
+        return schain
+    return None
+
+
+def get_rotating_schains(
+    skale: Skale,
+    entries: List[LeavingEntry],
+    now: Optional[float] = None,
+    workers: int = LEAVING_HISTORY_WORKERS
+) -> List[SchainStructure]:
+    """ Checks only unfinished entries, all of them in one concurrent pass """
+    now = now if now is not None else time.time()
+    unfinished = [e for e in entries if e.name and not e.is_finished(now)]
+    if not unfinished:
+        return []
+    with ThreadPoolExecutor(max_workers=min(workers, len(unfinished))) as executor:
+        schains = executor.map(lambda entry: fetch_leaving_schain(skale, entry), unfinished)
+        return [schain for schain in schains if schain is not None]
+
+
+def get_leaving_entries(skale: Skale, node_id: int) -> List[LeavingEntry]:
+    return LeavingHistoryIndex(skale, node_id).refresh()
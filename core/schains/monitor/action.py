@@ -62,6 +62,7 @@ from core.schains.config.main import (
 )
 from core.schains.config import init_schain_config_dir
 from core.schains.config.main import update_schain_config_version
+from core.schains.config.diff import diff_configs, report_config_diff
 from core.schains.config.file_manager import ConfigFileManager
 from core.schains.config.helper import (
     get_base_port_from_config,
@@ -102,6 +103,10 @@ class BaseActionManager:
             ts = time.time()
             initial_status = f(self, *args, **kwargs)
             te = time.time()
+            get_statsd_client().timing(
+                f'admin.action.duration.{f.__name__}.{no_hyphens(self.name)}',
+                (te - ts) * 1000
+            )
             self.executed_blocks[f.__name__] = {
                 'ts': ts,
                 'te': te,
@@ -215,20 +220,25 @@ class ConfigActionManager(BaseActionManager):
                 'Generating new upstream_config rotation_id: %s, stream: %s',
                 self.rotation_data.get('rotation_id'), self.stream_version
             )
-            new_config = create_new_upstream_config(
-                skale=self.skale,
-                node_config=self.node_config,
-                schain_name=self.name,
-                generation=self.generation,
-                ecdsa_sgx_key_name=self.node_config.sgx_key_name,
-                rotation_data=self.rotation_data,
-                sync_node=SYNC_NODE,
-                node_options=self.node_options
-            )
+            with self.statsd_client.timer(f'admin.config.generation.{no_hyphens(self.name)}'):
+                new_config = create_new_upstream_config(
+                    skale=self.skale,
+                    node_config=self.node_config,
+                    schain_name=self.name,
+                    generation=self.generation,
+                    ecdsa_sgx_key_name=self.node_config.sgx_key_name,
+                    rotation_data=self.rotation_data,
+                    sync_node=SYNC_NODE,
+                    node_options=self.node_options
+                )
 
             result = False
-            if not self.cfm.upstream_config_exists() or \
-                    new_config != self.cfm.latest_upstream_config:
+            latest_config = self.cfm.latest_upstream_config
+            if latest_config is None or new_config != latest_config:
+                if latest_config is not None:
+                    report_config_diff(
+                        self.name, diff_configs(latest_config, new_config), source='upstream'
+                    )
                 logger.info('Saving new config')
                 rotation_id = self.rotation_data['rotation_id']
                 logger.info(
@@ -340,7 +350,7 @@ class SkaledActionManager(BaseActionManager):
         if not initial_status:
             logger.info('Configuring firewall rules')
 
-            conf = self.cfm.latest_upstream_config if upstream else self.cfm.skaled_config
+            conf = self.cfm.latest_upstream_config if upstream else self.cfm.skaled_config_view
             base_port = get_base_port_from_config(conf)
             node_ips = get_node_ips_from_config(conf)
             own_ip = get_own_ip_from_config(conf)
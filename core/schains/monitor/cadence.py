@@ -0,0 +1,217 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import fcntl
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from core.schains.check_history import CheckSummary
+from tools.configs.schains import (
+    MONITOR_CADENCE_BACKOFF_STEP,
+    MONITOR_CADENCE_EXIT_WINDOW,
+    MONITOR_CADENCE_JITTER,
+    MONITOR_CADENCE_MAX,
+    MONITOR_CADENCE_MIN,
+    MONITOR_START_JITTER
+)
+
+logger = logging.getLogger(__name__)
+
+# Urgent reasons in priority order, any of them keeps the minimal interval
+URGENT_REASONS = ('dkg', 'rotation', 'exit', 'repair')
+# Pipelines that can't wait for a free slot, only healthy chains are limited
+SLOT_EXEMPT_REASONS = URGENT_REASONS + ('failing',)
+
+
+@dataclass
+class Cadence:
+    interval: float
+    reason: str
+
+
+def get_backoff_interval(
+    stable_for: float,
+    min_interval: float = MONITOR_CADENCE_MIN,
+    max_interval: float = MONITOR_CADENCE_MAX,
+    step: float = MONITOR_CADENCE_BACKOFF_STEP
+) -> float:
+    if stable_for < step:
+        return min_interval
+    return min(max_interval, min_interval * 2 ** int(stable_for // step))
+
+
+class ChainCadence:
+    """
+    Picks how often pipelines of the chain should run. Pipelines report
+    what they found, the task loop asks for the delay before the next run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_interval: float = MONITOR_CADENCE_MIN,
+        max_interval: float = MONITOR_CADENCE_MAX,
+        step: float = MONITOR_CADENCE_BACKOFF_STEP,
+        jitter: float = MONITOR_CADENCE_JITTER,
+        start_jitter: float = MONITOR_START_JITTER,
+        rand: Optional[random.Random] = None
+    ) -> None:
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.step = step
+        self.jitter = jitter
+        self.start_jitter = start_jitter
+        self.rand = rand or random.Random()
+        self.urgent: Dict[str, float] = {}  # reason -> ts until it is active
+        self.healthy: Dict[str, bool] = {}  # pipeline -> last result
+        self.stable_since: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def bootstrap(self, summary: Dict[str, CheckSummary]) -> None:
+        """ Restores stability period from the check history after restart """
+        since = [s.since for s in summary.values() if s.status and s.since is not None]
+        if summary and len(since) == len(summary):
+            with self._lock:
+                self.stable_since = max(since)
+
+    def mark_urgent(self, reason: str, until: float) -> None:
+        with self._lock:
+            self.urgent[reason] = max(self.urgent.get(reason, 0), until)
+
+    def clear_urgent(self, reason: str) -> None:
+        with self._lock:
+            self.urgent.pop(reason, None)
+
+    def record(self, pipeline: str, healthy: bool, now: Optional[float] = None) -> None:
+        now = now if now is not None else time.time()
+        with self._lock:
+            self.healthy[pipeline] = healthy
+            if not healthy:
+                self.stable_since = None
+            elif self.stable_since is None and all(self.healthy.values()):
+                self.stable_since = now
+
+    def current(self, now: Optional[float] = None) -> Cadence:
+        now = now if now is not None else time.time()
+        with self._lock:
+            for reason in URGENT_REASONS:
+                if self.urgent.get(reason, 0) > now:
+                    return Cadence(self.min_interval, reason)
+            if not all(self.healthy.values()):
+                return Cadence(self.min_interval, 'failing')
+            if self.stable_since is None:
+                return Cadence(self.min_interval, 'unknown')
+            interval = get_backoff_interval(
+                now - self.stable_since,
+                min_interval=self.min_interval,
+                max_interval=self.max_interval,
+                step=self.step
+            )
+            return Cadence(interval, 'stable')
+
+    def next_delay(self, cadence: Cadence) -> float:
+        if cadence.interval <= self.min_interval:
+            return cadence.interval
+        return cadence.interval * self.rand.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def start_delay(self) -> float:
+        return self.rand.uniform(0, self.start_jitter)
+
+
+_cadences: Dict[str, ChainCadence] = {}
+_cadences_lock = threading.Lock()
+
+
+def get_chain_cadence(name: str) -> ChainCadence:
+    with _cadences_lock:
+        if name not in _cadences:
+            _cadences[name] = ChainCadence(name)
+        return _cadences[name]
+
+
+def report_config_state(
+    name: str,
+    status: Dict,
+    last_dkg_successful: bool,
+    freeze_until: int
+) -> None:
+    cadence = get_chain_cadence(name)
+    now = time.time()
+    cadence.record('config', all(status.values()), now=now)
+    if last_dkg_successful:
+        cadence.clear_urgent('dkg')
+    else:
+        cadence.mark_urgent('dkg', now + cadence.max_interval)
+    if freeze_until > now:
+        cadence.mark_urgent('rotation', freeze_until)
+
+
+def report_skaled_state(
+    name: str,
+    status: Dict,
+    repair_mode: bool,
+    finish_ts: Optional[int],
+    exit_window: int = MONITOR_CADENCE_EXIT_WINDOW
+) -> None:
+    cadence = get_chain_cadence(name)
+    now = time.time()
+    cadence.record('skaled', all(status.values()), now=now)
+    if repair_mode:
+        cadence.mark_urgent('repair', now + cadence.max_interval)
+    else:
+        cadence.clear_urgent('repair')
+    if finish_ts and finish_ts - exit_window <= now:
+        cadence.mark_urgent('exit', finish_ts + exit_window)
+
+
+class PipelineSlots:
+    """
+    Node-wide limit of running pipelines. Slots are flock-ed files,
+    so they are shared between monitor processes and freed when one dies.
+    """
+
+    def __init__(self, dir_path: str, count: int) -> None:
+        self.dir_path = dir_path
+        self.count = count
+
+    def acquire(self) -> Optional[int]:
+        """ Returns descriptor of the held slot or None if all slots are busy """
+        os.makedirs(self.dir_path, exist_ok=True)
+        offset = random.randrange(self.count)
+        for index in range(self.count):
+            path = os.path.join(self.dir_path, f'slot-{(offset + index) % self.count}')
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                os.close(fd)
+        return None
+
+    def release(self, fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
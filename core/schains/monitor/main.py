@@ -30,25 +30,40 @@ from web3._utils import request as web3_request
 
 from core.node import get_skale_node_version
 from core.node_config import NodeConfig
+from core.schains.check_history import get_check_history_summary
 from core.schains.checks import ConfigChecks, get_api_checks_status, TG_ALLOWED_CHECKS, SkaledChecks
+from core.schains.config.diff import report_config_diff
 from core.schains.config.file_manager import ConfigFileManager
 from core.schains.config.static_params import get_automatic_repair_option
-from core.schains.firewall import get_default_rule_controller
+from core.schains.firewall.reconciler import get_reconciled_rule_controller
 from core.schains.firewall.utils import get_sync_agent_ranges
 from core.schains.external_config import ExternalConfig, ExternalState
 from core.schains.monitor import get_skaled_monitor, RegularConfigMonitor, SyncConfigMonitor
 from core.schains.monitor.action import ConfigActionManager, SkaledActionManager
+from core.schains.monitor.cadence import (
+    PipelineSlots,
+    get_chain_cadence,
+    report_config_state,
+    report_skaled_state
+)
 from core.schains.monitor.tasks import execute_tasks, Future, ITask
 from core.schains.process import ProcessReport
+from core.schains.ssl_rollout import report_ssl_rollout
 from core.schains.status import get_node_cli_status, get_skaled_status
 from core.node import get_current_nodes
 
 from tools.docker_utils import DockerUtils
 from tools.configs import SYNC_NODE
-from tools.configs.schains import DKG_TIMEOUT_COEFFICIENT
+from tools.configs.schains import (
+    DKG_TIMEOUT_COEFFICIENT,
+    MONITOR_ADAPTIVE_CADENCE,
+    MONITOR_PIPELINE_SLOTS,
+    MONITOR_PIPELINE_SLOTS_DIR
+)
 from tools.notifications.messages import notify_checks
 from tools.helper import is_node_part_of_chain, no_hyphens
-from tools.resources import get_statsd_client
+from tools.logger import child_listener
+from tools.resources import get_statsd_client, metrics_cycled
 from web.models.schain import SChainRecord, upsert_schain_record
 
 
@@ -59,6 +74,7 @@ class NoTasksToRunError(Exception):
     pass
 
 
+@metrics_cycled
 def run_config_pipeline(
     schain_name: str,
     skale: Skale,
@@ -103,8 +119,13 @@ def run_config_pipeline(
         econfig=econfig,
     )
 
-    status = config_checks.get_all(log=False, expose=True)
+    statsd_client = get_statsd_client()
+    with statsd_client.timer(f'admin.config_pipeline.checks.{no_hyphens(schain_name)}'):
+        status = config_checks.get_all(log=False, expose=True)
     logger.info('Config checks: %s', status)
+    report_config_state(
+        schain_name, status, last_dkg_successful, rotation_data['freeze_until']
+    )
 
     if SYNC_NODE:
         logger.info(
@@ -114,7 +135,6 @@ def run_config_pipeline(
     else:
         logger.info('Regular node mode, running config monitor')
         mon = RegularConfigMonitor(config_am, config_checks)
-    statsd_client = get_statsd_client()
 
     statsd_client.incr(f'admin.config_pipeline.{mon.__class__.__name__}.{no_hyphens(schain_name)}')
     statsd_client.gauge(
@@ -124,6 +144,7 @@ def run_config_pipeline(
         mon.run()
 
 
+@metrics_cycled
 def run_skaled_pipeline(
     schain_name: str, skale: Skale, node_config: NodeConfig, dutils: DockerUtils
 ) -> None:
@@ -134,7 +155,7 @@ def run_skaled_pipeline(
 
     dutils = dutils or DockerUtils()
 
-    rc = get_default_rule_controller(name=schain_name)
+    rc = get_reconciled_rule_controller(name=schain_name)
     skaled_checks = SkaledChecks(
         schain_name=schain.name,
         schain_record=schain_record,
@@ -155,15 +176,26 @@ def run_skaled_pipeline(
         econfig=ExternalConfig(schain_name),
         dutils=dutils,
     )
-    check_status = skaled_checks.get_all(log=False, expose=True)
+    statsd_client = get_statsd_client()
+    with statsd_client.timer(f'admin.skaled_pipeline.checks.{no_hyphens(schain_name)}'):
+        check_status = skaled_checks.get_all(log=False, expose=True, history=True)
     automatic_repair = get_automatic_repair_option()
     api_status = get_api_checks_status(status=check_status, allowed=TG_ALLOWED_CHECKS)
     notify_checks(schain_name, node_config.all(), api_status)
 
     logger.info('Skaled check status: %s', check_status)
+    report_skaled_state(
+        schain_name, check_status, schain_record.repair_mode, skaled_am.upstream_finish_ts
+    )
+    report_ssl_rollout(schain_record, check_status)
 
     logger.info('Upstream config %s', skaled_am.upstream_config_path)
 
+    config_diff = None
+    if check_status['config'] and not check_status['config_updated']:
+        config_diff = skaled_am.cfm.get_skaled_config_diff()
+        report_config_diff(schain_name, config_diff, source='skaled')
+
     mon = get_skaled_monitor(
         action_manager=skaled_am,
         check_status=check_status,
@@ -171,9 +203,10 @@ def run_skaled_pipeline(
         skaled_status=skaled_status,
         ncli_status=ncli_status,
         automatic_repair=automatic_repair,
+        check_history=get_check_history_summary(schain_name),
+        config_diff=config_diff
     )
 
-    statsd_client = get_statsd_client()
     statsd_client.incr(f'admin.skaled_pipeline.{mon.__name__}.{no_hyphens(schain_name)}')
     with statsd_client.timer(f'admin.skaled_pipeline.duration.{no_hyphens(schain_name)}'):
         mon(skaled_am, skaled_checks).run()
@@ -300,6 +333,7 @@ class ConfigTask(ITask):
         )
 
 
+@child_listener()
 def start_tasks(
     skale: Skale,
     schain: SchainStructure,
@@ -359,4 +393,10 @@ def start_tasks(
             dutils=dutils
         ),
     ]
-    execute_tasks(tasks=tasks, process_report=process_report)
+    cadence, slots = None, None
+    if MONITOR_ADAPTIVE_CADENCE:
+        cadence = get_chain_cadence(name)
+        cadence.bootstrap(get_check_history_summary(name))
+    if MONITOR_PIPELINE_SLOTS > 0:
+        slots = PipelineSlots(MONITOR_PIPELINE_SLOTS_DIR, MONITOR_PIPELINE_SLOTS)
+    execute_tasks(tasks=tasks, process_report=process_report, cadence=cadence, slots=slots)
@@ -23,18 +23,26 @@ from abc import abstractmethod
 from typing import Dict, Optional, Type
 
 from core.schains.monitor.base_monitor import IMonitor
+from core.schains.check_history import CheckSummary
 from core.schains.checks import SkaledChecks
 from core.schains.monitor.action import SkaledActionManager
+from core.schains.config.diff import ConfigDiff
 from core.schains.config.main import get_number_of_secret_shares
 from core.schains.status import NodeCliStatus, SkaledStatus
 from core.schains.ssl import ssl_reload_needed
+from core.schains.ssl_rollout import mark_ssl_rollout_started, ssl_rollout_admitted
 from tools.configs import SYNC_NODE
+from tools.configs.schains import SKALED_FLAPPING_HOLD_TIME, SKALED_FLAPPING_THRESHOLD
+from tools.helper import no_hyphens
 from tools.resources import get_statsd_client
 from web.models.schain import SChainRecord
 
 
 logger = logging.getLogger(__name__)
 
+# Checks that flap while skaled recovers by itself (e.g. catching up after a stall)
+RESTART_FLAPPING_CHECKS = ('rpc', 'blocks')
+
 
 class BaseSkaledMonitor(IMonitor):
     def __init__(self, action_manager: SkaledActionManager, checks: SkaledChecks) -> None:
@@ -72,10 +80,37 @@ class RegularSkaledMonitor(BaseSkaledMonitor):
         else:
             self.am.reset_restart_counter()
         if not self.checks.rpc:
-            self.am.skaled_rpc()
+            self.skaled_rpc()
         if not self.checks.ima_container and not SYNC_NODE:
             self.am.ima_container()
 
+    def skaled_rpc(self) -> None:
+        self.am.skaled_rpc()
+
+
+class FlappingSkaledMonitor(RegularSkaledMonitor):
+    """
+    When rpc or blocks checks keep flapping and rpc failure is recent -
+    run regular actions, but don't restart skaled on failed rpc
+    """
+
+    def skaled_rpc(self) -> None:
+        logger.warning('rpc is down, checks are flapping - holding off skaled restart')
+        self.statsd_client.incr(f'admin.skaled.restart_held.{no_hyphens(self.am.name)}')
+
+
+class ConfigOnlySkaledMonitor(RegularSkaledMonitor):
+    """
+    When upstream differs from skaled config only in sections that skaled
+    reads at genesis - sync config with upstream without restarting skaled
+    """
+
+    def execute(self) -> None:
+        logger.info('Config changes do not need skaled restart, syncing config')
+        self.am.update_config()
+        self.statsd_client.incr(f'admin.skaled.restart_avoided.{no_hyphens(self.am.name)}')
+        super().execute()
+
 
 class RepairSkaledMonitor(BaseSkaledMonitor):
     """
@@ -130,6 +165,7 @@ class RecreateSkaledMonitor(BaseSkaledMonitor):
 
     def execute(self) -> None:
         logger.info('Reload requested. Recreating sChain container')
+        mark_ssl_rollout_started(self.am.name)
         if not self.checks.volume:
             self.am.volume()
         self.am.reloaded_skaled_container()
@@ -263,8 +299,16 @@ def is_config_update_time(check_status: Dict, skaled_status: Optional[SkaledStat
     return not check_status['skaled_container'] and skaled_status.exit_time_reached
 
 
+def is_config_only_update(check_status: Dict, config_diff: Optional[ConfigDiff]) -> bool:
+    if config_diff is None or config_diff.empty:
+        return False
+    return check_status['config'] and not check_status['config_updated'] and \
+        not config_diff.restart_needed
+
+
 def is_recreate_mode(status: Dict, schain_record: SChainRecord) -> bool:
-    return status['skaled_container'] and ssl_reload_needed(schain_record)
+    return status['skaled_container'] and ssl_reload_needed(schain_record) and \
+        ssl_rollout_admitted(schain_record.name)
 
 
 def is_new_node_mode(schain_record: SChainRecord, finish_ts: Optional[int]) -> bool:
@@ -287,6 +331,37 @@ def no_config(check_status: Dict) -> bool:
     return not check_status['config']
 
 
+def get_flapping_checks(
+    check_history: Optional[Dict[str, CheckSummary]],
+    threshold: int = SKALED_FLAPPING_THRESHOLD
+) -> Dict[str, int]:
+    if not check_history:
+        return {}
+    return {
+        name: summary.flaps
+        for name, summary in check_history.items()
+        if summary.flaps >= threshold
+    }
+
+
+def is_flapping_mode(
+    check_status: Dict,
+    check_history: Optional[Dict[str, CheckSummary]],
+    hold_time: int = SKALED_FLAPPING_HOLD_TIME,
+    now: Optional[float] = None
+) -> bool:
+    if no_config(check_status) or check_status['rpc'] or not check_history:
+        return False
+    flapping = get_flapping_checks(check_history)
+    if not any(name in flapping for name in RESTART_FLAPPING_CHECKS):
+        return False
+    now = now or time.time()
+    rpc = check_history.get('rpc')
+    # Failure that is not recorded yet has just started
+    failed_since = rpc.since if rpc is not None and rpc.status is False else now
+    return now - failed_since < hold_time
+
+
 def get_skaled_monitor(
     action_manager: SkaledActionManager,
     check_status: Dict,
@@ -294,10 +369,15 @@ def get_skaled_monitor(
     skaled_status: SkaledStatus,
     ncli_status: NodeCliStatus,
     automatic_repair: bool = True,
+    check_history: Optional[Dict[str, CheckSummary]] = None,
+    config_diff: Optional[ConfigDiff] = None
 ) -> Type[BaseSkaledMonitor]:
     logger.info('Choosing skaled monitor')
     if skaled_status:
         skaled_status.log()
+    flapping = get_flapping_checks(check_history)
+    if flapping:
+        logger.warning('Checks are flapping within the history window: %s', flapping)
 
     mon_type: Type[BaseSkaledMonitor] = RegularSkaledMonitor
 
@@ -308,10 +388,14 @@ def get_skaled_monitor(
             mon_type = RecreateSkaledMonitor
         elif is_config_update_time(check_status, skaled_status):
             mon_type = UpdateConfigSkaledMonitor
+        elif is_config_only_update(check_status, config_diff):
+            mon_type = ConfigOnlySkaledMonitor
         elif is_reload_group_mode(check_status, action_manager.upstream_finish_ts):
             mon_type = ReloadGroupSkaledMonitor
         elif is_reload_ip_mode(check_status, action_manager.econfig.reload_ts):
             mon_type = ReloadIpSkaledMonitor
+        elif is_flapping_mode(check_status, check_history):
+            mon_type = FlappingSkaledMonitor
         return mon_type
 
     if no_config(check_status):
@@ -326,8 +410,12 @@ def get_skaled_monitor(
         mon_type = NewNodeSkaledMonitor
     elif is_config_update_time(check_status, skaled_status):
         mon_type = UpdateConfigSkaledMonitor
+    elif is_config_only_update(check_status, config_diff):
+        mon_type = ConfigOnlySkaledMonitor
     elif is_reload_group_mode(check_status, action_manager.upstream_finish_ts):
         mon_type = ReloadGroupSkaledMonitor
     elif is_reload_ip_mode(check_status, action_manager.econfig.reload_ts):
         mon_type = ReloadIpSkaledMonitor
+    elif is_flapping_mode(check_status, check_history):
+        mon_type = FlappingSkaledMonitor
     return mon_type
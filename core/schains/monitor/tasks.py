@@ -2,9 +2,13 @@ import abc
 import logging
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Callable
+from typing import Callable, Dict, Optional, Set, Tuple
 
+from core.schains.monitor.cadence import ChainCadence, PipelineSlots, SLOT_EXEMPT_REASONS
 from core.schains.process import ProcessReport
+from tools.configs.schains import MONITOR_PIPELINE_SLOT_HOLD_MAX
+from tools.helper import no_hyphens
+from tools.resources import get_statsd_client
 
 
 logger = logging.getLogger(__name__)
@@ -57,17 +61,49 @@ def execute_tasks(
     tasks: list[ITask],
     process_report: ProcessReport,
     sleep_interval: int = SLEEP_INTERVAL_SECONDS,
+    cadence: Optional[ChainCadence] = None,
+    slots: Optional[PipelineSlots] = None,
+    slot_hold_max: int = MONITOR_PIPELINE_SLOT_HOLD_MAX
 ) -> None:
     logger.info('Running tasks %s', tasks)
+    start_delay = cadence.start_delay() if cadence else 0
+    next_run_ts: Dict[str, float] = {task.name: time.time() + start_delay for task in tasks}
+    unscheduled: Set[str] = set()
+    held_slots: Dict[str, Tuple[int, float]] = {}  # task -> (slot, acquired at)
     with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix='T') as executor:
         stucked = []
         while True:
             for index, task in enumerate(tasks):
-                if not task.future.running() and task.needed and len(stucked) == 0:
-                    task.start_ts = int(time.time())
+                now = time.time()
+                if task.name in held_slots:
+                    slot, acquired_at = held_slots[task.name]
+                    if task.future.done() or now - acquired_at > slot_hold_max:
+                        if not task.future.done():
+                            logger.warning('Task %s exceeded slot hold time', task.name)
+                        slots.release(slot)
+                        del held_slots[task.name]
+                if cadence and task.name in unscheduled and task.future.done():
+                    unscheduled.discard(task.name)
+                    next_run_ts[task.name] = now + schedule_next_run(cadence, task.name)
+                if not task.future.running() and len(stucked) == 0 and \
+                        now >= next_run_ts[task.name] and task.needed:
+                    slot = None
+                    exempt = cadence and cadence.current().reason in SLOT_EXEMPT_REASONS
+                    if slots and not exempt:
+                        slot = slots.acquire()
+                        if slot is None:
+                            logger.info('No free pipeline slot for task %s', task.name)
+                            name = no_hyphens(process_report.name)
+                            get_statsd_client().incr(f'admin.schain.pipeline_slots.busy.{name}')
+                            continue
+                    task.start_ts = int(now)
                     logger.info('Starting task %s at %d', task.name, task.start_ts)
+                    process_report.set_task(task.name, task.start_ts)
                     pipeline = task.create_pipeline()
                     task.future = executor.submit(pipeline)
+                    if slot is not None:
+                        held_slots[task.name] = (slot, now)
+                    unscheduled.add(task.name)
                 elif task.future.running():
                     if int(time.time()) - task.start_ts > task.stuck_timeout:
                         logger.info('Canceling future for %s', task.name)
@@ -78,9 +114,22 @@ def execute_tasks(
                             stucked.append(task.name)
             time.sleep(sleep_interval)
             if len(stucked) > 0:
+                for slot, _ in held_slots.values():
+                    slots.release(slot)
                 logger.info('Sleeping before subverting execution')
                 executor.shutdown(wait=False)
                 logger.info('Subverting execution. Stucked %s', stucked)
                 process_report.ts = 0
                 break
             process_report.ts = int(time.time())
+
+
+def schedule_next_run(cadence: ChainCadence, task_name: str) -> float:
+    current = cadence.current()
+    delay = cadence.next_delay(current)
+    logger.info('Next %s run in %.1fs, cadence %s', task_name, delay, current)
+    statsd_client = get_statsd_client()
+    name = no_hyphens(cadence.name)
+    statsd_client.gauge(f'admin.schain.cadence.{task_name}.{name}', delay)
+    statsd_client.incr(f'admin.schain.cadence.{current.reason}.{name}')
+    return delay
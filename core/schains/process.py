@@ -22,11 +22,17 @@ import logging
 import os
 import shutil
 import signal
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pathlib
 import psutil
 
+from core.schains.heartbeat import (
+    get_heartbeat_table,
+    Heartbeat,
+    HeartbeatTable,
+    HeartbeatTableError
+)
 from tools.configs.schains import SCHAINS_DIR_PATH
 from tools.helper import check_pid
 
@@ -37,27 +43,37 @@ P_KILL_WAIT_TIMEOUT = 60
 
 
 def is_schain_process_report_exist(schain_name: str) -> None:
-    path = pathlib.Path(SCHAINS_DIR_PATH).joinpath(schain_name, ProcessReport.REPORT_FILENAME)
-    return path.is_file()
+    return ProcessReport(schain_name).is_exist()
 
 
 def get_schain_process_info(schain_name: str) -> Tuple[int | None, int | None]:
     report = ProcessReport(schain_name)
-    if not ProcessReport(schain_name).is_exist():
+    if not report.is_exist():
         return None, None
     else:
         return report.pid, report.ts
 
 
 class ProcessReport:
+    """
+    sChain monitor process heartbeat. Stored in the shared heartbeat table,
+    process.json is used if the table slot is unavailable and as an export
+    format for external readers.
+    """
     REPORT_FILENAME = 'process.json'
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, table: Optional[HeartbeatTable] = None) -> None:
+        self.name = name
         self.path = pathlib.Path(SCHAINS_DIR_PATH).joinpath(name, self.REPORT_FILENAME)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table or get_heartbeat_table()
+
+    @property
+    def heartbeat(self) -> Optional[Heartbeat]:
+        return self.table.get(self.name)
 
     def is_exist(self) -> bool:
-        return os.path.isfile(self.path)
+        return self.heartbeat is not None or os.path.isfile(self.path)
 
     @property
     def ts(self) -> int:
@@ -65,12 +81,7 @@ class ProcessReport:
 
     @ts.setter
     def ts(self, value: int) -> None:
-        report = {}
-        if self.is_exist():
-            report = self.read()
-        report['ts'] = value
-        self._save_tmp(report)
-        self._move()
+        self._set(ts=value)
 
     @property
     def pid(self) -> int:
@@ -78,18 +89,37 @@ class ProcessReport:
 
     @pid.setter
     def pid(self, value: int) -> None:
-        report = {}
-        if self.is_exist():
-            report = self.read()
-        report['pid'] = value
-        self._save_tmp(report)
-        self._move()
+        self._set(pid=value)
+
+    def set_task(self, task: str, ts: int) -> None:
+        try:
+            self.table.update(self.name, task=task, task_ts=ts)
+        except HeartbeatTableError as e:
+            logger.debug('Task is not tracked for %s: %s', self.name, e)
+
+    def _set(self, **fields) -> None:
+        try:
+            self.table.update(self.name, **fields)
+        except HeartbeatTableError:
+            logger.warning('Heartbeat table is not available, using %s', self.path)
+            report = {}
+            if os.path.isfile(self.path):
+                report = self._read_file()
+            report.update(fields)
+            self._save_tmp(report)
+            self._move()
 
     @property
     def _tmp_path(self) -> str:
         return self.path.with_stem('.tmp.' + self.path.stem)
 
     def read(self) -> dict:
+        hb = self.heartbeat
+        if hb is not None:
+            return {'pid': hb.pid, 'ts': hb.ts}
+        return self._read_file()
+
+    def _read_file(self) -> dict:
         with open(self.path) as process_file:
             data = json.load(process_file)
         return data
@@ -103,12 +133,29 @@ class ProcessReport:
             shutil.move(self._tmp_path, self.path)
 
     def update(self, pid: int, ts: int) -> None:
-        report = {'pid': pid, 'ts': ts}
-        self._save_tmp(report=report)
-        self._move()
+        try:
+            self.table.register(self.name, pid, ts)
+        except HeartbeatTableError:
+            logger.exception('Heartbeat table is not available, using %s', self.path)
+            self._save_tmp(report={'pid': pid, 'ts': ts})
+            self._move()
+
+    def export(self) -> None:
+        """ Dumps heartbeat to process.json """
+        hb = self.heartbeat
+        if hb is not None:
+            self._save_tmp(report={'pid': hb.pid, 'ts': hb.ts})
+            self._move()
 
     def cleanup(self) -> None:
-        os.remove(self.path)
+        self.table.release(self.name)
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+def export_process_reports() -> None:
+    for hb in get_heartbeat_table().all():
+        ProcessReport(hb.name).export()
 
 
 def terminate_process(
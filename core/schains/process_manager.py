@@ -26,32 +26,58 @@ from skale import Skale, SkaleIma
 from skale.contracts.manager.schains import SchainStructure
 
 from core.node_config import NodeConfig
+from core.schains.firewall.reconciler import reconcile_node_firewall
+from core.schains.image_prefetch import start_image_prefetch
+from core.schains.leaving_history import get_leaving_entries, get_rotating_schains
 from core.schains.monitor.main import start_tasks
 from core.schains.notifications import notify_if_not_enough_balance
 from core.schains.process import (
+    export_process_reports,
     get_schain_process_info,
     is_monitor_process_alive,
     terminate_process
 )
+from core.schains.zygote import spawn_warm_monitor
+from core.startup import startup_profiler
 
+from tools.logger import get_logging_stats
+from tools.resources import get_statsd_client, metrics_cycled
 from tools.str_formatters import arguments_list_string
-from tools.configs.schains import DKG_TIMEOUT_COEFFICIENT
+from tools.configs.schains import DKG_TIMEOUT_COEFFICIENT, MONITOR_ZYGOTE
 
 logger = logging.getLogger(__name__)
 
 
+@metrics_cycled
 def run_process_manager(skale: Skale, skale_ima: SkaleIma, node_config: NodeConfig) -> None:
     logger.info('Process manager started')
     node_id = node_config.id
     node_info = node_config.all()
     notify_if_not_enough_balance(skale, node_info)
+    start_image_prefetch()
 
     schains_to_monitor = fetch_schains_to_monitor(skale, node_id)
+    try:
+        reconcile_node_firewall([schain.name for schain in schains_to_monitor])
+    except Exception:
+        logger.exception('Node firewall reconciliation failed')
+
     for schain in schains_to_monitor:
         run_pm_schain(skale, skale_ima, node_config, schain)
+        startup_profiler.mark_first_monitored()
+    export_process_reports()
+    send_logging_stats()
     logger.info('Process manager procedure finished')
 
 
+def send_logging_stats() -> None:
+    stats = get_logging_stats()
+    if stats:
+        statsd_client = get_statsd_client()
+        statsd_client.gauge('admin.logging.queue_size', stats['queue_size'])
+        statsd_client.gauge('admin.logging.dropped', sum(stats['dropped'].values()))
+
+
 def run_pm_schain(
     skale: Skale,
     skale_ima: SkaleIma,
@@ -74,6 +100,9 @@ def run_pm_schain(
             terminate_process(pid)
         else:
             logger.info('%s Process is running: PID = %d', log_prefix, pid)
+    elif MONITOR_ZYGOTE:
+        process = spawn_warm_monitor(schain, node_config)
+        logger.info('Process started for %s from zygote: PID = %d', schain.name, process.pid)
     else:
         process = Process(
             name=schain.name,
@@ -110,12 +139,7 @@ def fetch_schains_to_monitor(skale: Skale, node_id: int) -> list:
 
 def get_leaving_schains_for_node(skale: Skale, node_id: int) -> list:
     logger.info('Get leaving_history for node ...')
-    leaving_schains = []
-    leaving_history = skale.node_rotation.get_leaving_history(node_id)
-    for leaving_schain in leaving_history:
-        schain = skale.schains.get(leaving_schain['schain_id'])
-        if skale.node_rotation.is_rotation_active(schain.name) and schain.name:
-            schain.active = True
-            leaving_schains.append(schain)
+    leaving_entries = get_leaving_entries(skale, node_id)
+    leaving_schains = get_rotating_schains(skale, leaving_entries)
     logger.info(f'Got leaving sChains for the node: {leaving_schains}')
     return leaving_schains
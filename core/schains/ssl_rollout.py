@@ -0,0 +1,210 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from filelock import FileLock
+
+from core.schains.ssl import ssl_reload_needed
+from tools.configs import (
+    SSL_ROLLOUT_FILEPATH,
+    SSL_ROLLOUT_WAVE_SIZE,
+    SSL_ROLLOUT_WAVE_TIMEOUT
+)
+from tools.helper import read_json, write_json_atomic
+from web.models.schain import SChainRecord
+
+logger = logging.getLogger(__name__)
+
+# Chain statuses
+PENDING = 'pending'        # waits for its wave
+ADMITTED = 'admitted'      # may recreate containers
+RECREATING = 'recreating'  # containers removed, waits for rpc and blocks
+DONE = 'done'
+SKIPPED = 'skipped'        # never started recreation within the wave timeout
+UNHEALTHY = 'unhealthy'    # not healthy within the wave timeout after recreation
+
+FINAL_STATUSES = (DONE, SKIPPED, UNHEALTHY)
+
+# Rollout statuses
+RUNNING = 'running'
+FINISHED = 'finished'
+HALTED = 'halted'          # set by earlier versions, admits all chains
+
+
+class SslRollout:
+    """
+    Recreation of sChain containers with a new certificate, a wave of chains at a time.
+    State is kept in a json file shared by all monitor processes,
+    so the rollout survives admin restarts.
+    """
+
+    def __init__(
+        self,
+        path: str = SSL_ROLLOUT_FILEPATH,
+        wave_size: int = SSL_ROLLOUT_WAVE_SIZE,
+        wave_timeout: int = SSL_ROLLOUT_WAVE_TIMEOUT
+    ) -> None:
+        self.path = path
+        self.wave_size = max(wave_size, 1)
+        self.wave_timeout = wave_timeout
+        self.lock = FileLock(path + '.lock')
+
+    def read(self) -> Optional[Dict]:
+        try:
+            return read_json(self.path)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write(self, state: Dict) -> None:
+        write_json_atomic(self.path, state)
+
+    def start(self, names: List[str], now: Optional[float] = None) -> Dict:
+        now = now if now is not None else time.time()
+        chains = {
+            name: {'wave': index // self.wave_size, 'status': PENDING}
+            for index, name in enumerate(sorted(names))
+        }
+        state = {
+            'status': RUNNING,
+            'created_ts': now,
+            'wave': -1,
+            'wave_start_ts': now,
+            'waves': -(-len(chains) // self.wave_size),
+            'chains': chains
+        }
+        self._next_wave(state, now)
+        with self.lock:
+            self._write(state)
+        logger.info('SSL rollout started for %d chains in %d waves', len(chains), state['waves'])
+        return state
+
+    def is_admitted(self, name: str) -> bool:
+        state = self.read()
+        if state is None or state['status'] != RUNNING or name not in state['chains']:
+            return True
+        return state['chains'][name]['status'] != PENDING
+
+    def mark_started(self, name: str, now: Optional[float] = None) -> None:
+        now = now if now is not None else time.time()
+        with self.lock:
+            state = self.read()
+            chain = state and state['chains'].get(name)
+            if chain and chain['status'] == ADMITTED:
+                chain.update(status=RECREATING, started_ts=now)
+                self._write(state)
+
+    def report(
+        self,
+        name: str,
+        reload_needed: bool,
+        healthy: bool,
+        now: Optional[float] = None
+    ) -> None:
+        """ Called by each chain monitor to move its own entry and the rollout forward """
+        now = now if now is not None else time.time()
+        state = self.read()
+        if state is None or state['status'] != RUNNING:
+            return
+        with self.lock:
+            state = self.read()
+            changed = False
+            chain = state['chains'].get(name)
+            if chain and chain['status'] == ADMITTED and chain.get('healthy_before') != healthy:
+                chain['healthy_before'] = healthy
+                changed = True
+            if chain and chain['status'] in (ADMITTED, RECREATING, SKIPPED) \
+                    and not reload_needed and healthy:
+                started_ts = chain.get('started_ts')
+                chain.update(
+                    status=DONE,
+                    finished_ts=now,
+                    downtime=now - started_ts if started_ts else 0
+                )
+                logger.info('SSL rollout finished for %s, downtime %.1fs',
+                            name, chain['downtime'])
+                changed = True
+            changed = self._advance(state, now) or changed
+            if changed:
+                self._write(state)
+
+    @classmethod
+    def _is_settled(cls, chain: Dict) -> bool:
+        # Chain that was unhealthy before recreation can't prove the new cert works
+        return chain['status'] in FINAL_STATUSES or \
+            (chain['status'] == RECREATING and chain.get('healthy_before') is False)
+
+    def _advance(self, state: Dict, now: float) -> bool:
+        wave = {
+            name: chain for name, chain in state['chains'].items()
+            if chain['wave'] == state['wave']
+        }
+        if now - state['wave_start_ts'] > self.wave_timeout:
+            for name, chain in wave.items():
+                if chain['status'] == ADMITTED:
+                    chain['status'] = SKIPPED
+                elif chain['status'] == RECREATING:
+                    chain['status'] = UNHEALTHY
+                    logger.warning('SSL rollout: %s is not healthy after recreation', name)
+        if not all(self._is_settled(chain) for chain in wave.values()):
+            return False
+        self._next_wave(state, now)
+        return True
+
+    def _next_wave(self, state: Dict, now: float) -> None:
+        state['wave'] += 1
+        state['wave_start_ts'] = now
+        if state['wave'] >= state['waves']:
+            state['status'] = FINISHED
+            logger.info('SSL rollout finished')
+            return
+        logger.info('SSL rollout wave %d started', state['wave'])
+        for chain in state['chains'].values():
+            if chain['wave'] == state['wave']:
+                chain['status'] = ADMITTED
+
+
+def start_ssl_rollout(names: List[str]) -> Dict:
+    return SslRollout().start(names)
+
+
+def ssl_rollout_admitted(name: str) -> bool:
+    return SslRollout().is_admitted(name)
+
+
+def mark_ssl_rollout_started(name: str) -> None:
+    SslRollout().mark_started(name)
+
+
+def report_ssl_rollout(schain_record: SChainRecord, check_status: Dict) -> None:
+    name = schain_record.name
+    healthy = bool(check_status.get('rpc')) and bool(check_status.get('blocks'))
+    rollout = SslRollout()
+    try:
+        state = rollout.read()
+        if state and state['status'] == RUNNING:
+            rollout.report(name, ssl_reload_needed(schain_record), healthy)
+    except Exception:
+        logger.exception('Failed to report SSL rollout state for %s', name)
+
+
+def get_ssl_rollout_state() -> Optional[Dict]:
+    return SslRollout().read()
@@ -0,0 +1,195 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import heapq
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+
+from skale import Skale
+from skale.schain_config import PORTS_PER_SCHAIN
+from skale.schain_config.ports_allocation import get_schain_base_port_on_node
+
+from core.node_config import NodeConfig
+from core.schains.config.cache import ConfigDataCache
+from tools.configs import NODE_CONFIG_FILEPATH
+
+logger = logging.getLogger(__name__)
+
+MAX_PORT = 65535
+
+
+class PortsAllocationError(Exception):
+    pass
+
+
+class ChainNodeConfig(NodeConfig):
+    """
+    Node config of the sync node for a single chain. Node id and sChain
+    base port differ between chains so they are kept in memory, the rest
+    is read from the shared node config file.
+    """
+
+    def __init__(
+        self,
+        node_id: int,
+        schain_base_port: int,
+        filepath: str = NODE_CONFIG_FILEPATH
+    ) -> None:
+        super().__init__(filepath=filepath)
+        self._node_id = node_id
+        self._schain_base_port = schain_base_port
+
+    @property
+    def id(self) -> int:
+        return self._node_id
+
+    @id.setter
+    def id(self, node_id: int) -> None:
+        self._node_id = node_id
+
+    @property
+    def schain_base_port(self) -> int:
+        return self._schain_base_port
+
+    @schain_base_port.setter
+    def schain_base_port(self, schain_port: int) -> None:
+        self._schain_base_port = schain_port
+
+    def all(self) -> dict:
+        return {
+            **super().all(),
+            'node_id': self._node_id,
+            'schain_base_port': self._schain_base_port
+        }
+
+
+def parse_schain_names(schain_name: Optional[str], schain_names: Optional[str]) -> List[str]:
+    """ Chains from comma separated SCHAIN_NAMES, SCHAIN_NAME is kept for single chain mode """
+    names = []
+    for name in (schain_names or '').split(',') + [schain_name or '']:
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def get_chain_node_configs(
+    skale: Skale,
+    schain_names: Iterable[str],
+    node_id: Optional[int] = None,
+    cache: Optional[ConfigDataCache] = None
+) -> Dict[str, ChainNodeConfig]:
+    """
+    Resolves node id and sChain base port for each chain in one pass.
+    Node structs and node sChains lists come from the shared config data
+    cache so they are fetched once for all chains and reused by monitors
+    during config generation. Configured node id belongs to a single chain
+    and is ignored when several chains are monitored.
+    """
+    schain_names = list(schain_names)
+    if node_id is not None and len(schain_names) > 1:
+        logger.warning('Node id %d is ignored, several chains are monitored', node_id)
+        node_id = None
+    cache = cache or ConfigDataCache(skale)
+    node_ids, base_ports = {}, {}
+    for name in schain_names:
+        if not skale.schains_internal.is_schain_exist(name):
+            logger.error('Provided SKALE Chain does not exist: %s', name)
+            continue
+        chain_node_id = node_id if node_id is not None else \
+            cache.get_node_ids_for_schain(name)[0]
+        node = cache.get_node(chain_node_id)
+        schains_on_node = cache.get_schains_for_node(chain_node_id)
+        node_ids[name] = chain_node_id
+        base_ports[name] = get_schain_base_port_on_node(schains_on_node, name, node['port'])
+    logger.info('Config data cache for sync chains: %d hits, %d misses', cache.hits, cache.misses)
+
+    configs = {}
+    for name, base_port in allocate_base_ports(base_ports).items():
+        configs[name] = ChainNodeConfig(node_ids[name], base_port)
+        logger.info('sChain %s: node %d, base port %d', name, node_ids[name], base_port)
+    return configs
+
+
+def allocate_base_ports(base_ports: Dict[str, int]) -> Dict[str, int]:
+    """
+    Chain containers use host network, so port ranges of all chains on the
+    sync node must not overlap. Chain keeps the base port of its source node
+    if it's free, otherwise it's moved right after the range it overlaps with.
+    """
+    allocated: Dict[str, int] = {}
+    for name, base_port in base_ports.items():
+        overlapping = True
+        while overlapping:
+            overlapping = False
+            for other in allocated.values():
+                if abs(base_port - other) < PORTS_PER_SCHAIN:
+                    base_port = other + PORTS_PER_SCHAIN
+                    overlapping = True
+        if base_port + PORTS_PER_SCHAIN - 1 > MAX_PORT:
+            raise PortsAllocationError(f'No free port range left for sChain {name}')
+        if base_port != base_ports[name]:
+            logger.warning(
+                'sChain %s: base port %d overlaps with other chains, using %d',
+                name, base_ports[name], base_port
+            )
+        allocated[name] = base_port
+    return allocated
+
+
+class ChainScheduler:
+    """
+    Per-chain run schedule of the sync node. Chains are spread evenly over
+    the first interval so process manager runs do not fire at once, failed
+    runs are retried after retry_interval.
+    """
+
+    def __init__(
+        self,
+        schain_names: List[str],
+        interval: int,
+        retry_interval: int,
+        now: Optional[float] = None
+    ) -> None:
+        self.interval = interval
+        self.retry_interval = retry_interval
+        now = time.time() if now is None else now
+        step = interval / len(schain_names) if schain_names else 0
+        self._queue = [(now + i * step, name) for i, name in enumerate(schain_names)]
+        heapq.heapify(self._queue)
+
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        now = time.time() if now is None else now
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[1])
+        return due
+
+    def reschedule(self, schain_name: str, success: bool = True,
+                   now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        delay = self.interval if success else self.retry_interval
+        heapq.heappush(self._queue, (now + delay, schain_name))
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        if not self._queue:
+            return self.interval
+        now = time.time() if now is None else now
+        return max(self._queue[0][0] - now, 0)
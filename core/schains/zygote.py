@@ -0,0 +1,123 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing
+import time
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Dict, Optional
+
+import psutil
+from skale import Skale, SkaleIma
+from skale.contracts.manager.schains import SchainStructure
+
+from core.node_config import NodeConfig
+from core.schains.firewall import iptables
+from core.schains.monitor.main import start_tasks
+from tools.configs.ima import MAINNET_IMA_ABI_FILEPATH
+from tools.configs.web3 import ABI_FILEPATH, ENDPOINT, STATE_FILEPATH
+from tools.docker_utils import DockerUtils
+from tools.logger import init_admin_logger
+from tools.resources import get_statsd_client
+from tools.rpc_router import route_web3
+from tools.wallet_utils import init_wallet
+
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_MODULES = [
+    'skale',
+    'web3',
+    'docker',
+    'peewee',
+    'core.schains.monitor.main',
+    'tools.wallet_utils'
+]
+
+
+def get_zygote_context() -> BaseContext:
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(PRELOAD_MODULES)
+    return ctx
+
+
+_shared_locks: Dict = {}
+
+
+def get_shared_locks() -> Dict:
+    """
+    Locks shared between the admin process and zygote children. Fork context
+    locks can't be passed to forkserver processes, so forkserver ones are
+    created on first use and installed in the calling process.
+    """
+    if not _shared_locks:
+        ctx = get_zygote_context()
+        _shared_locks.update({'iptables': ctx.Lock(), 'docker': ctx.Lock()})
+        set_shared_locks(_shared_locks)
+    return _shared_locks
+
+
+def set_shared_locks(locks: Dict) -> None:
+    iptables.plock = locks['iptables']
+    DockerUtils.docker_lock = locks['docker']
+
+
+def send_spawn_metrics(name: str, spawn_ts: float) -> None:
+    latency = time.time() - spawn_ts
+    rss = psutil.Process().memory_info().rss
+    logger.info('Monitor for %s spawned in %.3fs, rss: %d', name, latency, rss)
+    statsd_client = get_statsd_client()
+    statsd_client.timing('admin.monitor.spawn_latency', latency * 1000)
+    statsd_client.gauge('admin.monitor.rss', rss)
+
+
+def run_warm_monitor(
+    schain: SchainStructure,
+    spawn_ts: float,
+    locks: Dict,
+    node_config: Optional[NodeConfig] = None
+) -> None:
+    init_admin_logger()
+    set_shared_locks(locks)
+    node_config = node_config or NodeConfig()
+    wallet = init_wallet(node_config=node_config)
+    skale = Skale(ENDPOINT, ABI_FILEPATH, wallet, state_path=STATE_FILEPATH)
+    skale_ima = SkaleIma(ENDPOINT, MAINNET_IMA_ABI_FILEPATH, wallet)
+    route_web3(skale.web3)
+    route_web3(skale_ima.web3)
+    send_spawn_metrics(schain.name, spawn_ts)
+    start_tasks(skale, schain, node_config, skale_ima)
+
+
+def spawn_warm_monitor(
+    schain: SchainStructure,
+    node_config: Optional[NodeConfig] = None
+) -> BaseProcess:
+    """
+    Forks monitor from the forkserver with preloaded modules instead of
+    the admin process. Child creates its own clients and connections.
+    """
+    process = get_zygote_context().Process(
+        name=schain.name,
+        target=run_warm_monitor,
+        args=(schain, time.time(), get_shared_locks(), node_config)
+    )
+    process.start()
+    return process
@@ -0,0 +1,157 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+import psutil
+from filelock import FileLock
+
+from tools.configs import INIT_MANIFEST_FILEPATH
+from tools.helper import read_json, write_json_atomic
+from tools.resources import get_statsd_client
+
+logger = logging.getLogger(__name__)
+
+
+def get_inputs_hash(*inputs) -> str:
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class InitManifest:
+    """ Keeps hashes of inputs of the startup steps that were completed """
+
+    def __init__(self, path: str = INIT_MANIFEST_FILEPATH) -> None:
+        self.path = path
+        self.lock = FileLock(path + '.lock')
+
+    def read(self) -> Dict:
+        try:
+            return read_json(self.path)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _update(self, field: str, key: str, value) -> None:
+        with self.lock:
+            manifest = self.read()
+            manifest.setdefault(field, {})[key] = value
+            write_json_atomic(self.path, manifest)
+
+    def is_current(self, step: str, inputs_hash: str) -> bool:
+        return self.read().get('steps', {}).get(step) == inputs_hash
+
+    def record(self, step: str, inputs_hash: str) -> None:
+        self._update('steps', step, inputs_hash)
+
+    def save_profile(self, profile: Dict) -> None:
+        self._update('profile', 'last', profile)
+
+
+class StartupProfiler:
+    """ Durations of the startup steps and time until the first chain is monitored """
+
+    def __init__(self, start_ts: Optional[float] = None) -> None:
+        self.start_ts = start_ts if start_ts is not None else psutil.Process().create_time()
+        self.steps: Dict[str, float] = {}
+        self.skipped: List[str] = []
+        self.first_monitored: Optional[float] = None
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self.lock:
+                self.steps[name] = round(duration, 3)
+            logger.info('Startup step %s took %.3fs', name, duration)
+            get_statsd_client().timing(f'admin.startup.{name}', duration * 1000)
+
+    def skip(self, name: str) -> None:
+        with self.lock:
+            self.skipped.append(name)
+        logger.info('Startup step %s skipped, inputs are unchanged', name)
+        get_statsd_client().incr(f'admin.startup.skipped.{name}')
+
+    def to_dict(self) -> Dict:
+        with self.lock:
+            return {
+                'start_ts': self.start_ts,
+                'steps': dict(self.steps),
+                'skipped': list(self.skipped),
+                'time_to_first_monitored': self.first_monitored
+            }
+
+    def mark_first_monitored(self, manifest: Optional[InitManifest] = None) -> None:
+        with self.lock:
+            if self.first_monitored is not None:
+                return
+            self.first_monitored = round(time.time() - self.start_ts, 3)
+        logger.info('First chain is monitored %.3fs after start', self.first_monitored)
+        get_statsd_client().gauge('admin.startup.time_to_first_monitored', self.first_monitored)
+        (manifest or InitManifest()).save_profile(self.to_dict())
+
+
+startup_profiler = StartupProfiler()
+
+
+def run_cached_step(
+    name: str,
+    inputs_hash: str,
+    func: Callable,
+    outputs_present: Callable[[], bool] = lambda: True,
+    manifest: Optional[InitManifest] = None,
+    profiler: StartupProfiler = startup_profiler
+) -> bool:
+    """
+    Runs step unless it was completed with the same inputs and its outputs
+    are still in place, returns True if it was run
+    """
+    manifest = manifest or InitManifest()
+    if manifest.is_current(name, inputs_hash) and outputs_present():
+        profiler.skip(name)
+        return False
+    with profiler.step(name):
+        func()
+    manifest.record(name, inputs_hash)
+    return True
+
+
+def run_steps_concurrently(
+    steps: Dict[str, Callable],
+    profiler: StartupProfiler = startup_profiler
+) -> None:
+    """ Runs independent steps at the same time. Raises the first failure """
+    def run(name: str, func: Callable) -> None:
+        with profiler.step(name):
+            func()
+
+    logger.info('Running startup steps %s', list(steps))
+    with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix='I') as executor:
+        futures = [executor.submit(run, name, func) for name, func in steps.items()]
+        for future in futures:
+            future.result()
@@ -0,0 +1,116 @@
+"""
+Reports memory held by one monitoring cycle of sChain check results, check
+status maps, current node info and firewall rules for the legacy plain
+representations and the compact ones, per chain, measured with tracemalloc
+and process RSS.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/check_memory.py [schains] [nodes per chain]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import psutil
+
+from core.node import ExtendedManagerNodeInfo
+from core.schains.checks import CheckRes, IChecks
+from core.schains.firewall.types import SChainRule
+
+CHECK_NAMES = [
+    'config_dir', 'dkg', 'upstream_config', 'external_state', 'upstream_exists',
+    'rotation_id_updated', 'config_updated', 'config', 'volume', 'firewall_rules',
+    'skaled_container', 'exit_code_ok', 'ima_container', 'rpc', 'blocks', 'process'
+]
+PORTS_PER_NODE = 6
+
+
+class LegacyCheckRes:
+    def __init__(self, status, data=None):
+        self.status = status
+        self.data = data if data else {}
+
+
+class LegacySChainRule(SChainRule):
+    """ Without __slots__ every rule gets its own __dict__ """
+
+
+def make_checks_class(res_class):
+    props = {
+        name: property(lambda self, i=i: res_class(i % 5 != 0))
+        for i, name in enumerate(CHECK_NAMES)
+    }
+    props['get_name'] = lambda self: 'bench'
+    return type(f'BenchChecks{res_class.__name__}', (IChecks,), props)
+
+
+def legacy_cycle(checks, nodes):
+    results = [getattr(checks, name) for name in CHECK_NAMES]
+    status = {name: res.status for name, res in zip(CHECK_NAMES, results)}
+    node_info = [
+        {
+            'id': i, 'name': f'node-{i}', 'ip': f'10.0.{i // 256}.{i % 256}',
+            'publicIP': f'10.0.{i // 256}.{i % 256}', 'port': 10000, 'start_block': 1,
+            'last_reward_date': 1, 'finish_time': 0, 'status': 0, 'validator_id': 1,
+            'publicKey': '0x' + '1' * 128, 'domain_name': f'node-{i}.skale', 'ip_change_ts': 0
+        }
+        for i in range(nodes)
+    ]
+    rules = {
+        LegacySChainRule(10000 + port, node['ip'])
+        for node in node_info for port in range(PORTS_PER_NODE)
+    }
+    return results, status, node_info, rules
+
+
+def compact_cycle(checks, nodes):
+    results = [getattr(checks, name) for name in CHECK_NAMES]
+    status = checks.get_all(log=False)
+    node_info = [
+        ExtendedManagerNodeInfo(
+            id=i, name=f'node-{i}', ip=f'10.0.{i // 256}.{i % 256}',
+            publicIP=f'10.0.{i // 256}.{i % 256}', port=10000, ip_change_ts=0
+        )
+        for i in range(nodes)
+    ]
+    rules = {
+        SChainRule(10000 + port, node.ip)
+        for node in node_info for port in range(PORTS_PER_NODE)
+    }
+    return results, status, node_info, rules
+
+
+def measure(cycle, checks, schains, nodes):
+    gc.collect()
+    rss_before = psutil.Process().memory_info().rss
+    tracemalloc.start()
+    held = [cycle(checks, nodes) for _ in range(schains)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = psutil.Process().memory_info().rss - rss_before
+    del held
+    return current / schains, peak / schains, rss / schains
+
+
+def main():
+    schains = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    legacy_checks = make_checks_class(LegacyCheckRes)()
+    compact_checks = make_checks_class(CheckRes)()
+    # Warm up shared check name index
+    compact_cycle(compact_checks, nodes)
+
+    print(f'{schains} chains, {nodes} nodes per chain, bytes per chain')
+    print(f'{"":10} {"allocated":>10} {"peak":>10} {"rss":>10}')
+    for name, cycle, checks in (
+        ('legacy', legacy_cycle, legacy_checks),
+        ('compact', compact_cycle, compact_checks)
+    ):
+        current, peak, rss = measure(cycle, checks, schains, nodes)
+        print(f'{name:10} {current:10.0f} {peak:10.0f} {rss:10.0f}')
+
+
+if __name__ == '__main__':
+    main()
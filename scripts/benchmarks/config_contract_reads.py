@@ -0,0 +1,121 @@
+"""
+Counts SKALE Manager reads needed to collect contract data for sChain
+config generation when every chain on a node regenerates its config in
+the same cycle (e.g. after a rotation wave), without and with the shared
+config data cache.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/config_contract_reads.py [nodes] [schains] [group size]
+"""
+
+import random
+import sys
+import tempfile
+from collections import Counter
+from types import SimpleNamespace
+
+from core.schains.config.cache import ConfigDataCache
+
+# Reads done by skale.schain_config.rotation_history.get_previous_schain_groups
+# for a chain without rotations: group id, public keys, rotation and group nodes
+ROTATION_HISTORY_READS = 4
+
+
+class CountingSkale:
+    """ Fake SKALE Manager with random node groups that counts reads """
+
+    def __init__(self, nodes, schains, group_size, reads):
+        self.reads = reads
+        rnd = random.Random(0)
+        self.groups = {
+            f'schain-{i}': rnd.sample(range(nodes), group_size) for i in range(schains)
+        }
+        self.web3 = SimpleNamespace(eth=SimpleNamespace(block_number=1))
+        self.nodes = SimpleNamespace(get=self.counted('nodes.get', lambda i: {
+            'name': f'node-{i}', 'ip': f'10.0.0.{i}', 'port': 10000, 'publicKey': '0x'
+        }))
+        self.schains = SimpleNamespace(
+            get_schains_for_node=self.counted('schains.get_schains_for_node', lambda i: [
+                {'name': name} for name, group in self.groups.items() if i in group
+            ]),
+            get_by_name=self.counted('schains.get_by_name', lambda name: {'name': name}),
+            name_to_id=lambda name: name,
+            name_to_group_id=lambda name: name
+        )
+        self.schains_internal = SimpleNamespace(
+            get_node_ids_for_schain=self.counted(
+                'schains_internal.get_node_ids_for_schain', lambda name: self.groups[name]
+            ),
+            address='0x1'
+        )
+        self.key_storage = SimpleNamespace(
+            get_common_public_key=self.counted('key_storage.get_common_public_key',
+                                               lambda _: [[1, 2], [3, 4]])
+        )
+
+    def counted(self, name, func):
+        def wrapper(*args):
+            self.reads[name] += 1
+            return func(*args)
+        return wrapper
+
+
+def rotation_history(skale, name):
+    skale.reads['rotation_history'] += ROTATION_HISTORY_READS
+    return {}
+
+
+def node_schains(skale, node_id):
+    return [name for name, group in skale.groups.items() if node_id in group]
+
+
+def collect_without_cache(skale, name, node_id):
+    for group_node in skale.schains_internal.get_node_ids_for_schain(name):
+        skale.nodes.get(group_node)
+        skale.schains.get_schains_for_node(group_node)
+    skale.schains.get_schains_for_node(node_id)
+    skale.schains.get_by_name(name)
+    skale.nodes.get(node_id)
+    rotation_history(skale, name)
+    skale.reads['skale_manager_opts'] += 2
+    skale.key_storage.get_common_public_key(name)
+
+
+def collect_with_cache(skale, name, node_id, cache_dir):
+    cache = ConfigDataCache(skale, cache_dir=cache_dir)
+    cache.get_schain_nodes_with_schains(name)
+    cache.get_schains_for_node(node_id)
+    cache.get_schain(name)
+    cache.get_node(node_id)
+    cache.get('node_groups', name, lambda: rotation_history(skale, name))
+    cache.get('skale_manager_opts', 'all', lambda: skale.reads.update(skale_manager_opts=2))
+    cache.get_common_bls_public_key(name)
+
+
+def main():
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    schains = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    group_size = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+
+    reads = Counter()
+    skale = CountingSkale(nodes, schains, group_size, reads)
+    node_id = max(range(nodes), key=lambda i: len(node_schains(skale, i)))
+    chains = node_schains(skale, node_id)
+    print(f'node {node_id} runs {len(chains)} chains, group size {group_size}')
+
+    for name in chains:
+        collect_without_cache(skale, name, node_id)
+    baseline = sum(reads.values())
+
+    reads.clear()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name in chains:
+            collect_with_cache(skale, name, node_id, cache_dir)
+    cached = sum(reads.values())
+
+    print(f'without cache: {baseline / len(chains):8.1f} reads per config')
+    print(f'with cache:    {cached / len(chains):8.1f} reads per config')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures sChain IMA ABI overhead of a sync node worker restart and of
+one monitor_ima_container round over all chains: unconditional
+generation and copying versus version-keyed generation and hardlinks.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/ima_abi.py [schains] [rounds]
+"""
+
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from ima_predeployed.generator import generate_abi
+
+import core.ima.schain as ima_schain
+
+
+def timed(func, rounds):
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def main():
+    schains = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        abi_path = os.path.join(base_dir, 'schain_ima_abi.json')
+        chain_paths = {}
+        for i in range(schains):
+            os.makedirs(os.path.join(base_dir, f'schain-{i}'))
+            chain_paths[f'schain-{i}'] = os.path.join(base_dir, f'schain-{i}', 'abi.json')
+
+        def generate_always():
+            with open(abi_path, 'w') as outfile:
+                json.dump(generate_abi(), outfile, indent=4)
+
+        def copy_always():
+            for path in chain_paths.values():
+                shutil.copyfile(abi_path, path)
+
+        def copy_cached():
+            for name in chain_paths:
+                ima_schain.copy_schain_ima_abi(name)
+
+        with mock.patch.object(ima_schain, 'SCHAIN_IMA_ABI_FILEPATH', abi_path), \
+                mock.patch.object(ima_schain, 'SCHAIN_IMA_ABI_META_FILEPATH', f'{abi_path}.meta'), \
+                mock.patch.object(ima_schain, 'get_schain_ima_abi_filepath', chain_paths.get):
+            results = {
+                'restart, generate always': timed(generate_always, rounds),
+                f'ima round, copy x{schains}': timed(copy_always, rounds),
+            }
+            ima_schain.update_predeployed_ima()
+            copy_cached()
+            results['restart, version keyed'] = timed(ima_schain.update_predeployed_ima, rounds)
+            results[f'ima round, link or hash x{schains}'] = timed(copy_cached, rounds)
+
+    for name, duration in results.items():
+        print(f'{name:32} {duration:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
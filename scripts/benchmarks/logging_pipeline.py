@@ -0,0 +1,104 @@
+"""
+Measures time monitor threads spend in logging calls with synchronous
+handlers (legacy per-handler formatting with per-pattern regex compilation)
+and with the queue based pipeline.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/logging_pipeline.py [threads] [records]
+"""
+
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+
+from tools.logger import (
+    ADMIN_LOG_FORMAT,
+    compose_hiding_patterns,
+    HidingFormatter,
+    start_listener,
+    stop_listener
+)
+
+CHECKS = {f'check_{i}': bool(i % 3) for i in range(20)}
+
+
+class LegacyHidingFormatter(logging.Formatter):
+    def __init__(self, log_format, patterns):
+        super().__init__(log_format)
+        self._patterns = patterns
+
+    def format(self, record):
+        msg = super().format(record)
+        for match, replacement in self._patterns.items():
+            msg = re.compile(match).sub(replacement, msg)
+        return msg
+
+
+def get_handlers(log_dir, formatter):
+    handlers = []
+    for name, level in (('admin.log', logging.INFO), ('debug.log', logging.DEBUG)):
+        handler = RotatingFileHandler(os.path.join(log_dir, name))
+        handler.setFormatter(formatter)
+        handler.setLevel(level)
+        handlers.append(handler)
+    stream = logging.StreamHandler(open(os.devnull, 'w'))
+    stream.setFormatter(formatter)
+    stream.setLevel(logging.INFO)
+    handlers.append(stream)
+    return handlers
+
+
+def run_threads(logger, threads, records):
+    def pipeline(index):
+        spent = 0
+        for i in range(records):
+            start = time.perf_counter()
+            logger.info('sChain test-%d checks: %s, NEK:%d', index, CHECKS, i)
+            spent += time.perf_counter() - start
+        return spent
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return sum(executor.map(pipeline, range(threads)))
+
+
+def measure(mode, handlers, threads, records):
+    logger = logging.getLogger(f'benchmark.{mode}')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    dropped = {}
+    if mode == 'queue':
+        qhandler = start_listener(handlers)
+        dropped = qhandler.dropped
+        logger.addHandler(qhandler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    start = time.perf_counter()
+    spent = run_threads(logger, threads, records)
+    in_threads = time.perf_counter() - start
+    if mode == 'queue':
+        stop_listener()
+    total = time.perf_counter() - start
+    print(f'{mode}: {spent / (threads * records) * 1e6:.1f}us per call in threads, '
+          f'threads done in {in_threads:.2f}s, all records written in {total:.2f}s, '
+          f'dropped: {dict(dropped)}')
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    records = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    patterns = compose_hiding_patterns()
+    with tempfile.TemporaryDirectory() as log_dir:
+        legacy = LegacyHidingFormatter(ADMIN_LOG_FORMAT, patterns)
+        measure('sync', get_handlers(log_dir, legacy), threads, records)
+        formatter = HidingFormatter(ADMIN_LOG_FORMAT, patterns)
+        measure('queue', get_handlers(log_dir, formatter), threads, records)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares sChain monitor spawn latency and child RSS for plain fork
+and zygote (forkserver with preloaded modules) modes.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/monitor_spawn.py [iterations]
+"""
+
+import multiprocessing
+import statistics
+import sys
+import time
+
+import psutil
+
+from core.schains.zygote import get_zygote_context
+
+
+def child(queue, spawn_ts):
+    import core.schains.monitor.main  # noqa
+    queue.put((time.time() - spawn_ts, psutil.Process().memory_info().rss))
+
+
+def measure(ctx, iterations):
+    queue = ctx.Queue()
+    latencies, rss = [], []
+    for _ in range(iterations):
+        process = ctx.Process(target=child, args=(queue, time.time()))
+        process.start()
+        latency, child_rss = queue.get()
+        process.join()
+        latencies.append(latency)
+        rss.append(child_rss)
+    return statistics.median(latencies), statistics.median(rss)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    modes = {
+        'fork': multiprocessing.get_context('fork'),
+        'zygote': get_zygote_context()
+    }
+    measure(modes['zygote'], 1)  # forkserver startup is not part of spawn latency
+    for mode, ctx in modes.items():
+        latency, rss = measure(ctx, iterations)
+        print(f'{mode}: median spawn latency {latency * 1000:.1f}ms, '
+              f'median rss {rss / 2 ** 20:.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
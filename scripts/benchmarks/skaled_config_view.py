@@ -0,0 +1,79 @@
+"""
+Compares full json parsing of a skaled config with the lazy section view
+for the typical monitor access pattern (node info and sChain nodes).
+"view cold" rescans the file on every read (worst case, config changed),
+"view cached" goes through get_skaled_config_view as the monitor does.
+
+Usage (from the repo root with test env exported):
+    python scripts/benchmarks/skaled_config_view.py [accounts] [iterations]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from core.schains.config.view import get_skaled_config_view, SkaledConfigView
+from tools.helper import read_json
+
+
+def make_config(accounts: int) -> dict:
+    return {
+        'accounts': {
+            f'0x{i:040x}': {'balance': str(i), 'code': '0x' + '60' * 256, 'storage': {}}
+            for i in range(accounts)
+        },
+        'params': {'chainID': '0x1'},
+        'skaleConfig': {
+            'nodeInfo': {'nodeID': 0, 'basePort': 10000},
+            'sChain': {
+                'nodes': [{'nodeID': i, 'ip': f'10.0.0.{i}'} for i in range(16)],
+                'nodeGroups': {}
+            }
+        }
+    }
+
+
+def measure(name, func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - start) / iterations
+    # tracemalloc slows down python code, so memory is measured in a separate run
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:>12}: {elapsed * 1000:9.2f} ms/read  peak {peak / 2 ** 20:8.2f} MiB')
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'schain_bench.json')
+        with open(path, 'w') as config_file:
+            json.dump(make_config(accounts), config_file, indent=4)
+        print(f'config size {os.path.getsize(path) / 2 ** 20:.2f} MiB')
+
+        def full():
+            config = read_json(path)
+            return config['skaleConfig']['nodeInfo'], config['skaleConfig']['sChain']['nodes']
+
+        def cold():
+            view = SkaledConfigView(path)
+            return view.node_info, view.nodes
+
+        def cached():
+            view = get_skaled_config_view(path)
+            return view.node_info, view.nodes
+
+        measure('read_json', full, iterations)
+        measure('view cold', cold, iterations)
+        measure('view cached', cached, iterations)
+
+
+if __name__ == '__main__':
+    main()
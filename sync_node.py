@@ -23,13 +23,22 @@ import logging
 from typing import Dict
 
 from skale import Skale, SkaleIma
-from skale.schain_config.ports_allocation import get_schain_base_port_on_node
+from skale.contracts.manager.schains import SchainStructure
 
+from core.schains.config.cache import ConfigDataCache
 from core.schains.process_manager import run_pm_schain
+from core.schains.sync_chains import (
+    ChainNodeConfig,
+    ChainScheduler,
+    get_chain_node_configs,
+    parse_schain_names
+)
 from core.node_config import NodeConfig
 from core.ima.schain import update_predeployed_ima
 
 from tools.logger import init_sync_logger
+from tools.notifications.messages import start_notification_dispatcher
+from tools.configs import SYNC_NODE_MONITOR_INTERVAL, SYNC_NODE_RETRY_INTERVAL
 from tools.configs.web3 import ENDPOINT, ABI_FILEPATH
 from tools.configs.ima import MAINNET_IMA_ABI_FILEPATH
 
@@ -40,61 +49,81 @@ from web.migrations import migrate
 init_sync_logger()
 logger = logging.getLogger(__name__)
 
-SLEEP_INTERVAL = 180
 WORKER_RESTART_SLEEP_INTERVAL = 2
 
 SCHAIN_NAME = os.environ.get('SCHAIN_NAME')
-
-
-def monitor(skale, skale_ima, node_config, schain: Dict) -> None:
+SCHAIN_NAMES = os.environ.get('SCHAIN_NAMES')
+
+
+def monitor(
+    skale: Skale,
+    skale_ima: SkaleIma,
+    node_configs: Dict[str, ChainNodeConfig],
+    schains: Dict[str, SchainStructure]
+) -> None:
+    scheduler = ChainScheduler(
+        list(schains),
+        interval=SYNC_NODE_MONITOR_INTERVAL,
+        retry_interval=SYNC_NODE_RETRY_INTERVAL
+    )
     while True:
-        try:
-            run_pm_schain(skale, skale_ima, node_config, schain)
-        except Exception:
-            logger.exception('Process manager procedure failed!')
-        logger.info(
-            f'Sleeping for {SLEEP_INTERVAL}s after run_process_manager'
-        )
-        time.sleep(SLEEP_INTERVAL)
-
-
-def worker(schain_name: str):
+        for schain_name in scheduler.pop_due():
+            try:
+                run_pm_schain(skale, skale_ima, node_configs[schain_name], schains[schain_name])
+                success = True
+            except Exception:
+                logger.exception('Process manager procedure failed for %s', schain_name)
+                success = False
+            scheduler.reschedule(schain_name, success=success)
+        delay = scheduler.next_delay()
+        logger.info(f'Sleeping for {delay:.0f}s before the next process manager run')
+        time.sleep(delay)
+
+
+def worker(schain_names: list) -> None:
     skale = Skale(ENDPOINT, ABI_FILEPATH)
     skale_ima = SkaleIma(ENDPOINT, MAINNET_IMA_ABI_FILEPATH)
+    node_config = NodeConfig()
+    cache = ConfigDataCache(skale)
 
-    if not skale.schains_internal.is_schain_exist(schain_name):
-        logger.error(f'Provided SKALE Chain does not exist: {schain_name}')
+    node_configs = get_chain_node_configs(skale, schain_names, node_config.id, cache=cache)
+    if not node_configs:
+        logger.error(f'None of the provided SKALE Chains exist: {schain_names}')
         exit(1)
 
-    schain = skale.schains.get_by_name(schain_name)
-    node_config = NodeConfig()
+    if len(schain_names) == 1:
+        # Single chain mode keeps node id and base port in the node config file
+        chain_node_config = node_configs[schain_names[0]]
+        if not node_config.id:
+            node_config.id = chain_node_config.id
+        if node_config.schain_base_port == -1:
+            node_config.schain_base_port = chain_node_config.schain_base_port
+        chain_node_config.schain_base_port = node_config.schain_base_port
 
-    schain_nodes = skale.schains_internal.get_node_ids_for_schain(schain_name)
-    if not node_config.id:
-        node_config.id = schain_nodes[0]
+    schains = {name: cache.get_schain(name) for name in node_configs}
+    for name, chain_node_config in node_configs.items():
+        logger.info(f'Node {chain_node_config.id} will be used as a current node for {name}')
+    monitor(skale, skale_ima, node_configs, schains)
 
-    node = skale.nodes.get(node_config.id)
-    if node_config.schain_base_port == -1:
-        schains_on_node = skale.schains.get_schains_for_node(node_config.id)
-        node_config.schain_base_port = get_schain_base_port_on_node(
-            schains_on_node,
-            schain_name,
-            node['port']
-        )
 
-    logger.info(f'Node {node_config.id} will be used as a current node')
-    monitor(skale, skale_ima, node_config, schain)
+def prepare() -> None:
+    create_tables()
+    migrate()
+    update_predeployed_ima()
 
 
 def main():
-    if SCHAIN_NAME is None:
-        raise Exception('You should provide SCHAIN_NAME')
+    schain_names = parse_schain_names(SCHAIN_NAME, SCHAIN_NAMES)
+    if not schain_names:
+        raise Exception('You should provide SCHAIN_NAME or SCHAIN_NAMES')
+    start_notification_dispatcher()
+    prepared = False
     while True:
         try:
-            create_tables()
-            migrate()
-            update_predeployed_ima()
-            worker(SCHAIN_NAME)
+            if not prepared:
+                prepare()
+                prepared = True
+            worker(schain_names)
         except Exception:
             logger.exception('Sync node worker failed')
         time.sleep(WORKER_RESTART_SLEEP_INTERVAL)
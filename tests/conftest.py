@@ -32,6 +32,7 @@ from skale.utils.web3_utils import init_web3
 from core.ima.schain import update_predeployed_ima
 from core.node import get_current_nodes
 from core.node_config import NodeConfig
+from core.schains import heartbeat
 from core.schains.checks import SChainChecks
 from core.schains.config.helper import (
     get_base_port_from_config,
@@ -58,7 +59,7 @@ from tools.configs import (
     STATIC_GROUPS_FOLDER
 )
 from tools.configs.containers import CONTAINERS_FILEPATH
-from tools.configs.ima import SCHAIN_IMA_ABI_FILEPATH
+from tools.configs.ima import SCHAIN_IMA_ABI_FILEPATH, SCHAIN_IMA_ABI_META_FILEPATH
 from tools.configs.schains import SCHAINS_DIR_PATH
 from tools.configs.web3 import ABI_FILEPATH
 from tools.docker_utils import DockerUtils
@@ -105,6 +106,8 @@ def predeployed_ima():
         yield
     finally:
         os.remove(SCHAIN_IMA_ABI_FILEPATH)
+        if os.path.isfile(SCHAIN_IMA_ABI_META_FILEPATH):
+            os.remove(SCHAIN_IMA_ABI_META_FILEPATH)
 
 
 @pytest.fixture(scope='session')
@@ -256,6 +259,16 @@ SECRET_KEY = {
 }
 
 
+@pytest.fixture(autouse=True)
+def heartbeat_table(tmp_path, monkeypatch):
+    """ Keeps process heartbeats of every test in its own table """
+    monkeypatch.setattr(heartbeat, 'HEARTBEAT_TABLE_FILEPATH', str(tmp_path / 'heartbeat.table'))
+    monkeypatch.setattr(heartbeat, '_tables', {})
+    yield
+    for table in heartbeat._tables.values():
+        table.close()
+
+
 @pytest.fixture
 def _schain_name():
     """Generates default schain name"""
@@ -1,3 +1,4 @@
+import gzip
 import os
 from functools import partial
 
@@ -19,8 +20,8 @@ from tests.utils import (
     run_simple_schain_container_in_sync_mode
 )
 from tools.configs.containers import SCHAIN_CONTAINER
-from tools.configs import NODE_DATA_PATH
 from tools.docker_utils import DockerUtils
+from tools.logs_backup import LogsBackupManifest
 
 from unittest import mock
 
@@ -220,32 +221,31 @@ def test_safe_rm(dutils):
     assert dutils.safe_get_container(container_name)
     dutils.safe_rm(container_name)
     assert os.path.isfile(path)
-    with open(path) as f:
+    with gzip.open(path, 'rt') as f:
         assert f.readlines() == LOGS_TEST_LINES
     assert not dutils.safe_get_container(container_name)
 
 
-def test_get_logs_backup_filepath(dutils):
+def test_get_logs_backup_filepath(dutils, tmp_path):
+    folder = str(tmp_path)
     ls = []
     container_mock = SimpleNamespace(name='skale_schain_test')
-    with mock.patch('os.listdir', return_value=ls):
-        path = dutils.get_logs_backup_filepath(container_mock)
-    assert path == os.path.join(
-        NODE_DATA_PATH,
-        'log/.removed_containers/skale_schain_test-0.log'
-    )
-
-    ls = [
-        'skale_schain_test-0.log',
-        'skale_schain_test-1.log',
-        'skale_schain_testgg-0.log'
-    ]
-    with mock.patch('os.listdir', return_value=ls):
-        path = dutils.get_logs_backup_filepath(container_mock)
-    assert path == os.path.join(
-        NODE_DATA_PATH,
-        'log/.removed_containers/skale_schain_test-2.log'
-    )
+    with mock.patch(
+        'tools.docker_utils.LogsBackupManifest',
+        partial(LogsBackupManifest, folder=folder)
+    ):
+        with mock.patch('os.listdir', return_value=ls):
+            path = dutils.get_logs_backup_filepath(container_mock)
+        assert path == os.path.join(folder, 'skale_schain_test-0.log.gz')
+
+        ls = [
+            'skale_schain_test-0.log',
+            'skale_schain_test-1.log',
+            'skale_schain_testgg-0.log'
+        ]
+        with mock.patch('os.listdir', return_value=ls):
+            path = dutils.get_logs_backup_filepath(container_mock)
+        assert path == os.path.join(folder, 'skale_schain_test-2.log.gz')
 
 
 def run_test_schain_container(dutils):
@@ -0,0 +1,123 @@
+import json
+import os
+import time
+from unittest import mock
+
+from core.schains.firewall.reconciler import (
+    FirewallReconciler,
+    FirewallReport,
+    ReconciledSChainRuleController,
+    get_configured_rule_controller,
+    is_synced_by_report,
+    rules_digest
+)
+from core.schains.firewall.types import SChainRule
+
+from tests.utils import HostTestFirewallController, SChainTestRuleController
+
+
+NODE_IPS = ['1.1.1.1', '2.2.2.2', '3.3.3.3']
+
+
+def test_reconciler(tmp_path):
+    report_path = os.path.join(tmp_path, 'firewall_report.json')
+    host_controller = HostTestFirewallController()
+    stale_rule = SChainRule(10065, '5.5.5.5')
+    foreign_rule = SChainRule(20000, '6.6.6.6')
+    host_controller.add_rule(stale_rule)
+    host_controller.add_rule(foreign_rule)
+
+    rc_a = SChainTestRuleController('schain-a', 10064, '1.1.1.1', NODE_IPS)
+    rc_b = SChainTestRuleController('schain-b', 10192, '1.1.1.1', NODE_IPS)
+    reconciler = FirewallReconciler(host_controller, report_path=report_path)
+    report = reconciler.reconcile([rc_a, rc_b])
+
+    expected = set(rc_a.expected_rules()) | set(rc_b.expected_rules())
+    assert set(host_controller.rules) == expected | {foreign_rule}
+    assert report.added == len(expected)
+    assert report.removed == 1
+    assert report.chains['schain-a']['removed'] == 1
+    assert report.chains['schain-b']['removed'] == 0
+
+    with open(report_path) as report_file:
+        saved = json.load(report_file)
+    assert saved['chains']['schain-b'] == {
+        'synced': True,
+        'digest': rules_digest(rc_b.expected_rules()),
+        'added': len(list(rc_b.expected_rules())),
+        'removed': 0
+    }
+
+    report = reconciler.reconcile([rc_a, rc_b])
+    assert report.added == 0 and report.removed == 0
+
+
+def test_is_synced_by_report(tmp_path):
+    report_path = os.path.join(tmp_path, 'firewall_report.json')
+    rules = [SChainRule(10064, '1.1.1.1'), SChainRule(10066)]
+    assert not is_synced_by_report('test', rules, path=report_path)
+
+    report = FirewallReport(
+        ts=int(time.time()),
+        chains={'test': {'synced': True, 'digest': rules_digest(rules)}}
+    )
+    report.save(report_path)
+    assert is_synced_by_report('test', rules, path=report_path)
+    assert not is_synced_by_report('test', rules[:1], path=report_path)
+    assert not is_synced_by_report('another', rules, path=report_path)
+
+    report.ts = int(time.time()) - 3600
+    report.save(report_path)
+    assert not is_synced_by_report('test', rules, path=report_path)
+
+
+def test_reconciled_rule_controller_fallback():
+    rc = ReconciledSChainRuleController('test', 10064, '1.1.1.1', NODE_IPS)
+    with mock.patch(
+        'core.schains.firewall.reconciler.is_synced_by_report',
+        return_value=True
+    ), mock.patch(
+        'core.schains.firewall.rule_controller.SChainRuleController.is_rules_synced'
+    ) as kernel_check:
+        assert rc.is_rules_synced()
+        kernel_check.assert_not_called()
+
+    with mock.patch(
+        'core.schains.firewall.reconciler.is_synced_by_report',
+        return_value=False
+    ), mock.patch(
+        'core.schains.firewall.rule_controller.SChainRuleController.is_rules_synced',
+        return_value=False
+    ) as kernel_check:
+        assert not rc.is_rules_synced()
+        kernel_check.assert_called_once()
+
+
+def make_config(ips):
+    return {
+        'skaleConfig': {
+            'nodeInfo': {'basePort': 10064, 'nodeID': 0},
+            'sChain': {'nodes': [{'nodeID': i, 'ip': ip} for i, ip in enumerate(ips)]}
+        }
+    }
+
+
+def test_configured_rule_controller_reload_ip_mode():
+    cfm = mock.Mock(
+        skaled_config_view=make_config(NODE_IPS),
+        latest_upstream_config=make_config(['1.1.1.1', '2.2.2.2', '4.4.4.4'])
+    )
+    econfig = mock.Mock(ranges=[], reload_ts=None)
+    with mock.patch(
+        'core.schains.firewall.reconciler.ConfigFileManager', return_value=cfm
+    ), mock.patch(
+        'core.schains.firewall.reconciler.ExternalConfig', return_value=econfig
+    ):
+        assert get_configured_rule_controller('test').node_ips == NODE_IPS
+
+        econfig.reload_ts = int(time.time()) + 300
+        rc = get_configured_rule_controller('test')
+        assert rc.node_ips == ['1.1.1.1', '2.2.2.2', '4.4.4.4']
+
+        cfm.latest_upstream_config = None
+        assert get_configured_rule_controller('test').node_ips == NODE_IPS
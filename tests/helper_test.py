@@ -1,4 +1,9 @@
-from tools.helper import is_address_contract, no_hyphens
+import os
+
+import mock
+import pytest
+
+from tools.helper import is_address_contract, no_hyphens, read_json, write_json_atomic
 from tools.configs.web3 import ZERO_ADDRESS
 
 
@@ -13,3 +18,16 @@ def test_no_hyphen():
     assert no_hyphens('too-boo') == 'too_boo'
     assert no_hyphens('too-boo_goo') == 'too_boo_goo'
     assert no_hyphens('too_goo') == 'too_goo'
+
+
+def test_write_json_atomic(tmp_path):
+    path = str(tmp_path / 'data.json')
+    write_json_atomic(path, {'a': 1})
+    write_json_atomic(path, {'a': 2})
+    assert read_json(path) == {'a': 2}
+
+    with mock.patch('tools.helper.json.dump', side_effect=TypeError):
+        with pytest.raises(TypeError):
+            write_json_atomic(path, {'a': 3})
+    assert read_json(path) == {'a': 2}
+    assert os.listdir(tmp_path) == ['data.json']
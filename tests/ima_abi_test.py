@@ -0,0 +1,88 @@
+import os
+from unittest import mock
+
+import pytest
+
+from core.ima.schain import (
+    copy_schain_ima_abi,
+    get_ima_predeployed_version,
+    get_schain_ima_abi_meta,
+    update_predeployed_ima
+)
+from tools.helper import read_json
+
+
+@pytest.fixture
+def abi_filepath(tmp_path, monkeypatch):
+    """ Keeps the session predeployed_ima files intact """
+    folder = tmp_path / 'contracts_info'
+    folder.mkdir()
+    abi_filepath = str(folder / 'schain_ima_abi.json')
+    monkeypatch.setattr('core.ima.schain.SCHAIN_IMA_ABI_FILEPATH', abi_filepath)
+    monkeypatch.setattr('core.ima.schain.SCHAIN_IMA_ABI_META_FILEPATH', f'{abi_filepath}.meta')
+    return abi_filepath
+
+
+def test_update_predeployed_ima(abi_filepath):
+    with mock.patch('core.ima.schain.generate_abi', return_value={'a': 1}) as generate:
+        update_predeployed_ima()
+        inode = os.stat(abi_filepath).st_ino
+        update_predeployed_ima()
+        assert generate.call_count == 1
+        assert os.stat(abi_filepath).st_ino == inode
+        assert read_json(abi_filepath) == {'a': 1}
+        assert get_schain_ima_abi_meta()['version'] == get_ima_predeployed_version()
+
+        with mock.patch('core.ima.schain.get_ima_predeployed_version', return_value='0.0.1'):
+            update_predeployed_ima()
+        assert generate.call_count == 2
+
+        with open(abi_filepath, 'w') as abi_file:
+            abi_file.write('{}')
+        update_predeployed_ima()
+        assert generate.call_count == 3
+        assert read_json(abi_filepath) == {'a': 1}
+
+
+def test_copy_schain_ima_abi(abi_filepath, tmp_path):
+    dest = str(tmp_path / 'schain_ima_abi.json')
+    with mock.patch('core.ima.schain.generate_abi', return_value={'a': 1}), \
+            mock.patch('core.ima.schain.get_schain_ima_abi_filepath', return_value=dest):
+        update_predeployed_ima()
+        copy_schain_ima_abi('test')
+        assert read_json(dest) == {'a': 1}
+        assert os.path.samefile(abi_filepath, dest)
+
+        mtime = os.stat(dest).st_mtime_ns
+        copy_schain_ima_abi('test')
+        assert os.stat(dest).st_mtime_ns == mtime
+
+        # Copy with the same content is relinked
+        os.remove(dest)
+        with open(abi_filepath) as src, open(dest, 'w') as dst:
+            dst.write(src.read())
+        copy_schain_ima_abi('test')
+        assert os.path.samefile(abi_filepath, dest)
+
+        # Regenerated file replaces outdated copy
+        with mock.patch('core.ima.schain.get_ima_predeployed_version', return_value='0.0.1'), \
+                mock.patch('core.ima.schain.generate_abi', return_value={'a': 2}):
+            update_predeployed_ima()
+        assert read_json(dest) == {'a': 1}
+        copy_schain_ima_abi('test')
+        assert read_json(dest) == {'a': 2}
+
+
+def test_copy_schain_ima_abi_cross_device(abi_filepath, tmp_path):
+    dest = str(tmp_path / 'schain_ima_abi.json')
+    with mock.patch('core.ima.schain.generate_abi', return_value={'a': 1}), \
+            mock.patch('core.ima.schain.get_schain_ima_abi_filepath', return_value=dest), \
+            mock.patch('core.ima.schain.os.link', side_effect=OSError(18, 'Cross-device link')):
+        update_predeployed_ima()
+        copy_schain_ima_abi('test')
+        assert read_json(dest) == {'a': 1}
+        assert not os.path.samefile(abi_filepath, dest)
+
+        mtime = os.stat(dest).st_mtime_ns
+        copy_schain_ima_abi('test')
+        assert os.stat(dest).st_mtime_ns == mtime
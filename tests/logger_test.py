@@ -1,6 +1,20 @@
 import logging
+import queue
+from multiprocessing import Process
 
-from tools.logger import compose_hiding_patterns, HidingFormatter, ADMIN_LOG_FORMAT
+import mock
+
+from tools import logger as logger_module
+from tools.logger import (
+    ADMIN_LOG_FORMAT,
+    child_listener,
+    compose_hiding_patterns,
+    DroppingQueueHandler,
+    HidingFormatter,
+    ReportingQueueListener,
+    start_listener,
+    stop_listener
+)
 
 
 def test_custom_formatter():
@@ -24,3 +38,72 @@ def test_custom_formatter():
         compose_hiding_patterns()
     ).format(record)
     assert '[MainProcess][MainThread] - None:0 - [SGX_KEY], http://54.545.454.12:1231, [ETH_IP] http://[ETH_IP]:8080, [ETH_IP][ETH_IP]loc https://testnet.com, wss://127.0.0.1.com, ttt://127.0.0.1.com, foo://127.0.0.1.com, NEK//127.0.0.1.com, ' in formatted_text  # noqa
+
+
+def test_hiding_formatter_formats_once():
+    formatter = HidingFormatter('%(message)s', {r'NEK\:\w+': '[SGX_KEY]', r'(1|2)\.1': '[IP]'})
+    record = logging.makeLogRecord({'msg': 'key NEK:abc, ip %s', 'args': ('1.1',)})
+    with mock.patch.object(
+        formatter, '_filter_sensitive', wraps=formatter._filter_sensitive
+    ) as filter_mock:
+        assert formatter.format(record) == 'key [SGX_KEY], ip [IP]'
+        assert formatter.format(record) == 'key [SGX_KEY], ip [IP]'
+        assert filter_mock.call_count == 1
+    other = HidingFormatter('other %(message)s', {})
+    assert other.format(record) == 'other key NEK:abc, ip 1.1'
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def test_queue_handler_drops():
+    log_queue = queue.Queue(maxsize=2)
+    qhandler = DroppingQueueHandler(log_queue, block_timeout=0.01)
+    for i in range(3):
+        qhandler.handle(logging.LogRecord('test', logging.INFO, '', 0, 'info %d', (i,), None))
+    qhandler.handle(logging.LogRecord('test', logging.WARNING, '', 0, 'warning', None, None))
+    assert qhandler.dropped == {'INFO': 1, 'WARNING': 1}
+
+    target = ListHandler()
+    target.setFormatter(HidingFormatter('%(levelname)s %(message)s', {}))
+    listener = ReportingQueueListener(log_queue, qhandler, target)
+    listener.start()
+    listener.stop()
+    assert target.messages == [
+        "WARNING Logging queue is full, dropped records: {'INFO': 1, 'WARNING': 1}",
+        'INFO info 0',
+        'INFO info 1'
+    ]
+
+
+@child_listener()
+def log_in_child():
+    logging.getLogger('child').warning('child record')
+
+
+def test_child_listener(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_module, '_listener', None)
+    log_path = tmp_path / 'test.log'
+    qhandler = start_listener([logging.FileHandler(log_path)])
+    root = logging.getLogger()
+    root.addHandler(qhandler)
+    try:
+        process = Process(target=log_in_child)
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+        assert log_path.read_text() == 'child record\n'
+        # Main process listener is left running
+        log_in_child()
+        stop_listener()
+        assert log_path.read_text() == 'child record\n' * 2
+    finally:
+        root.removeHandler(qhandler)
+        for handler in logger_module._listener.handlers:
+            handler.close()
@@ -0,0 +1,74 @@
+import gzip
+import os
+
+import pytest
+
+from tools.configs.containers import CONTAINER_LOGS_SEPARATOR
+from tools.logs_backup import LogsBackupManifest, split_head_tail, write_logs_backup
+
+
+def lines(number):
+    return (f'line {i}\n'.encode() for i in range(number))
+
+
+def test_split_head_tail():
+    head, tail = split_head_tail(lines(1000), head=3, tail=2)
+    assert head == [b'line 0\n', b'line 1\n', b'line 2\n']
+    assert list(tail) == [b'line 998\n', b'line 999\n']
+
+    head, tail = split_head_tail(lines(4), head=3, tail=2)
+    assert head == [b'line 0\n', b'line 1\n', b'line 2\n']
+    assert list(tail) == [b'line 2\n', b'line 3\n']
+
+
+def test_write_logs_backup(tmp_path):
+    path = os.path.join(tmp_path, 'skale_schain_test-0.log.gz')
+    size = write_logs_backup(path, lines(10000), head=2, tail=1)
+    assert size == os.path.getsize(path)
+    with gzip.open(path, 'rb') as backup:
+        assert backup.read() == b'line 0\nline 1\n' + CONTAINER_LOGS_SEPARATOR + b'line 9999\n'
+
+
+@pytest.fixture
+def backups_folder(tmp_path):
+    for filename in ('skale_schain_test-0.log', 'skale_schain_test-1.log',
+                     'skale_schain_testgg-0.log', 'unrelated.txt'):
+        with open(os.path.join(tmp_path, filename), 'w') as backup:
+            backup.write('x' * 10)
+    return str(tmp_path)
+
+
+def test_manifest_indexes(backups_folder):
+    manifest = LogsBackupManifest(folder=backups_folder)
+    assert manifest.next_backup_path('skale_schain_test') == \
+        os.path.join(backups_folder, 'skale_schain_test-2.log.gz')
+    assert manifest.reserve('skale_schain_test').endswith('skale_schain_test-2.log.gz')
+    assert manifest.reserve('skale_schain_test').endswith('skale_schain_test-3.log.gz')
+    assert manifest.reserve('skale_schain_testgg').endswith('skale_schain_testgg-1.log.gz')
+    assert manifest.reserve('skale_ima_test').endswith('skale_ima_test-0.log.gz')
+
+    # Index is kept in the manifest, backups folder is not listed anymore
+    for filename in os.listdir(backups_folder):
+        if filename.endswith('.log'):
+            os.remove(os.path.join(backups_folder, filename))
+    manifest = LogsBackupManifest(folder=backups_folder)
+    assert manifest.reserve('skale_schain_test').endswith('skale_schain_test-4.log.gz')
+
+
+def test_manifest_retention(backups_folder):
+    manifest = LogsBackupManifest(folder=backups_folder, max_bytes=35)
+    path = manifest.reserve('skale_schain_test')
+    size = write_logs_backup(path, lines(10), head=5, tail=5)
+    assert size > 35
+
+    removed = manifest.register(path, size)
+    assert sorted(removed) == [
+        'skale_schain_test-0.log',
+        'skale_schain_test-1.log',
+        'skale_schain_testgg-0.log'
+    ]
+    assert os.path.isfile(path)
+    assert sorted(f for f in os.listdir(backups_folder) if not f.startswith('.')) == [
+        'skale_schain_test-2.log.gz',
+        'unrelated.txt'
+    ]
@@ -0,0 +1,81 @@
+import os
+import threading
+
+import mock
+
+from tools.metrics import (
+    get_aggregated_metrics,
+    get_cycle_buffer,
+    metrics_cycle,
+    MetricsAggregator,
+    StatsClient
+)
+
+
+def get_client(tmp_path, maxudpsize=512):
+    client = StatsClient(maxudpsize=maxudpsize, aggregator=MetricsAggregator(str(tmp_path)))
+    client._send = mock.Mock()
+    return client
+
+
+def test_metrics_cycle_batches(tmp_path):
+    client = get_client(tmp_path)
+    with metrics_cycle(client) as buffer:
+        assert get_cycle_buffer() is buffer
+        with metrics_cycle(client) as nested:
+            assert nested is buffer
+        for i in range(100):
+            buffer.gauge(f'admin.checks.test_metric_{i}', i)
+        client._send.assert_not_called()
+    assert get_cycle_buffer() is None
+
+    packets = [c.args[0] for c in client._send.call_args_list]
+    assert len(packets) < 100
+    assert all(len(packet) < 512 for packet in packets)
+    assert sum(len(packet.split('\n')) for packet in packets) == 100
+
+    saved = get_aggregated_metrics(str(tmp_path))
+    assert list(saved.values())[0]['gauges']['admin.checks.test_metric_99'] == 99
+
+
+def test_aggregator(tmp_path):
+    client = get_client(tmp_path)
+    client.incr('counter')
+    client.decr('counter', 3)
+    client.gauge('gauge', 5)
+    client.gauge('gauge', 2, delta=True)
+    client.gauge('gauge', -1)
+    client.timing('timer', 30)
+    client.timing('timer', 700)
+    with client.timer('timer'):
+        pass
+
+    snapshot = client.aggregator.snapshot()
+    assert snapshot['counters'] == {'counter': -2}
+    assert snapshot['gauges'] == {'gauge': -1}
+    hist = snapshot['timers']['timer']
+    assert hist['count'] == 3
+    assert hist['max'] == 700
+    assert hist['buckets'][:5] == [1, 1, 0, 0, 1]
+    # negative gauge is sent as two stats
+    assert client._send.call_count == 8
+
+    client.aggregator.save()
+    assert os.listdir(tmp_path) == [os.path.basename(client.aggregator.path)]
+
+
+def test_aggregator_save_threads(tmp_path):
+    aggregator = MetricsAggregator(str(tmp_path))
+    aggregator.incr('admin.test')
+
+    def save():
+        for _ in range(50):
+            aggregator.save()
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert os.listdir(tmp_path) == [os.path.basename(aggregator.path)]
+    assert list(get_aggregated_metrics(str(tmp_path)).values())[0]['counters'] == {'admin.test': 1}
@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from unittest import mock
 
 import pytest
 from peewee import CharField, Model, SqliteDatabase
@@ -17,7 +18,11 @@ from web.migrations import (
     add_config_version_field,
     add_restart_count_field,
     add_ssl_change_date_field,
-    add_repair_date_field
+    add_repair_date_field,
+    get_schema_version,
+    set_schema_version,
+    run_migrations,
+    MIGRATIONS
 )
 
 
@@ -125,3 +130,47 @@ def test_add_repair_date_field(upserted_db, migrator, model):
     add_repair_date_field(upserted_db, migrator)
     for r in model.select().execute():
         r.repair_date < datetime.now()
+
+
+def test_run_migrations(upserted_db, migrator, model):
+    assert get_schema_version(upserted_db) == 0
+    run_migrations(upserted_db, migrator)
+    assert get_schema_version(upserted_db) == len(MIGRATIONS)
+    columns = {c.name for c in upserted_db.get_columns('SChainRecord')}
+    assert {'new_schain', 'repair_mode', 'restart_count', 'repair_date'} <= columns
+
+    with mock.patch.object(upserted_db, 'get_columns') as get_columns:
+        run_migrations(upserted_db, migrator)
+    get_columns.assert_not_called()
+
+
+def test_run_migrations_pending_only(upserted_db, migrator, model):
+    model.insert_many([{'name': generate_random_name()}]).execute()
+    applied = []
+
+    def rename_records(db, migrator, columns=None):
+        applied.append('rename')
+        model.update(name=model.name.concat('-migrated')).execute()
+
+    migrations = [add_restart_count_field, rename_records]
+    set_schema_version(upserted_db, 1)
+    run_migrations(upserted_db, migrator, migrations=migrations)
+    assert applied == ['rename']
+    assert get_schema_version(upserted_db) == 2
+    assert all(r.name.endswith('-migrated') for r in model.select())
+    columns = {c.name for c in upserted_db.get_columns('SChainRecord')}
+    assert 'restart_count' not in columns
+
+    run_migrations(upserted_db, migrator, migrations=migrations)
+    assert applied == ['rename']
+
+
+def test_run_migrations_rollback(upserted_db, migrator, model):
+    def broken(db, migrator, columns=None):
+        raise ValueError('Broken migration')
+
+    with pytest.raises(ValueError):
+        run_migrations(upserted_db, migrator, migrations=[add_restart_count_field, broken])
+    assert get_schema_version(upserted_db) == 0
+    columns = {c.name for c in upserted_db.get_columns('SChainRecord')}
+    assert 'restart_count' not in columns
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import socket
+import time
 
 import mock
 import pytest
@@ -11,9 +14,12 @@ from skale.utils.helper import ip_from_bytes
 from skale.wallets import Web3Wallet
 
 from core.node import (
+    check_validator_nodes,
     get_block_device_size,
     get_node_hardware_info,
-    Node, NodeExitStatus, NodeStatus
+    scan_ports,
+    Node, NodeExitStatus, NodeStatus,
+    ValidatorNodesCache
 )
 from core.node_config import NodeConfig
 from tools.configs import NODE_DATA_PATH
@@ -284,3 +290,57 @@ def test_get_block_device_size():
     response_mock.json = mock.Mock(return_value={'Err': 'Test error'})
     with mock.patch('requests.get', return_value=response_mock):
         assert get_block_device_size() == -1
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen(8)
+        yield server.getsockname()[1]
+
+
+def test_scan_ports(listening_port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as closed:
+        closed.bind(('127.0.0.1', 0))
+        closed_port = closed.getsockname()[1]
+
+        res = asyncio.run(scan_ports(['127.0.0.1', '127.0.0.1'], listening_port))
+        assert list(res) == ['127.0.0.1']
+        assert 0 <= res['127.0.0.1'] < 1000
+
+        assert asyncio.run(scan_ports(['127.0.0.1'], closed_port)) == {'127.0.0.1': None}
+    assert asyncio.run(scan_ports([], listening_port)) == {}
+
+
+def test_scan_ports_deadline(listening_port):
+    # TEST-NET-1 addresses are not routable, connects hang until the deadline
+    ips = [f'192.0.2.{i}' for i in range(1, 21)]
+    start = time.monotonic()
+    res = asyncio.run(scan_ports(ips, listening_port, timeout=5, deadline=0.5, concurrency=4))
+    assert time.monotonic() - start < 2
+    assert res == {ip: None for ip in ips}
+
+
+def test_validator_nodes_cache():
+    cache = ValidatorNodesCache(ttl=60)
+    res = [[2, '1.1.1.1', True, 1.5]]
+    with mock.patch('core.node.scan_validator_nodes', return_value=res) as scan_mock:
+        assert cache.get(mock.Mock(), 1) == res
+        assert cache.get(mock.Mock(), 1) == res
+        cache.get(mock.Mock(), 2)
+    assert scan_mock.call_count == 2
+
+    cache.ttl = 0
+    with mock.patch('core.node.scan_validator_nodes', return_value=[]):
+        assert cache.get(mock.Mock(), 1) == []
+
+
+def test_check_validator_nodes(skale, nodes):
+    with mock.patch('core.node.validator_nodes_cache', ValidatorNodesCache()):
+        res = check_validator_nodes(skale, nodes[0])
+    assert res['status'] == 0
+    assert [node[0] for node in res['data']] == nodes[1:]
+    for node_id, ip, reachable, latency in res['data']:
+        assert ip == ip_from_bytes(skale.nodes.contract.functions.getNodeIP(node_id).call())
+        assert reachable is (latency is not None)
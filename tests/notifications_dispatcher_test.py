@@ -0,0 +1,132 @@
+import threading
+
+import mock
+import pytest
+from redis import BlockingConnectionPool, Redis
+
+from tools.notifications.dispatcher import (
+    ChannelRateLimiter,
+    NotificationDispatcher,
+    NotificationEvent,
+    QUEUE_KEY,
+    coalesce_events,
+    compose_digest,
+    enqueue_notification
+)
+
+
+def checks_event(name, ok=True):
+    return NotificationEvent('checks', name, {'name': name, 'ok': ok})
+
+
+def checks_handler(payload, client):
+    return [f'{payload["name"]}: {"ok" if payload["ok"] else "failed"}']
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def dispatcher(sent):
+    return NotificationDispatcher(
+        handlers={'checks': checks_handler},
+        sender=sent.append,
+        client=mock.Mock(),
+        window=0,
+        limiter=ChannelRateLimiter(rate=1, period=60),
+        max_items=3
+    )
+
+
+def test_coalesce_events():
+    events = [
+        checks_event('a', ok=False),
+        checks_event('b'),
+        checks_event('a'),
+        NotificationEvent('balance', 'a', {})
+    ]
+    assert coalesce_events(events) == [
+        checks_event('b'),
+        checks_event('a'),
+        NotificationEvent('balance', 'a', {})
+    ]
+
+
+def test_compose_digest():
+    assert compose_digest('checks', [['a: ok']]) == ['a: ok']
+    messages = [[f'{name}: ok'] for name in 'abcd']
+    assert compose_digest('checks', messages, max_items=2) == [
+        '4 checks notifications',
+        '', 'a: ok',
+        '', 'b: ok',
+        '\n... and 2 more'
+    ]
+
+
+def test_channel_rate_limiter():
+    limiter = ChannelRateLimiter(rate=2, period=10)
+    limiter.record('checks', 0)
+    limiter.record('checks', 5)
+    assert not limiter.allow('checks', 9)
+    assert limiter.allow('balance', 9)
+    assert limiter.allow('checks', 10)
+
+
+def test_dispatcher_sends_digest(dispatcher, sent):
+    dispatcher.process([
+        checks_event('a', ok=False),
+        checks_event('b'),
+        checks_event('a'),
+        NotificationEvent('unknown', 'a', {})
+    ], now=0)
+    assert sent == [['2 checks notifications', '', 'b: ok', '', 'a: ok']]
+    assert dispatcher.pending == {}
+
+
+def test_dispatcher_defers_rate_limited(dispatcher, sent):
+    dispatcher.process([checks_event('a')], now=0)
+    dispatcher.process([checks_event('b', ok=False)], now=10)
+    dispatcher.process([checks_event('b'), checks_event('c')], now=20)
+    assert sent == [['a: ok']]
+    assert list(dispatcher.pending['checks']) == ['b', 'c']
+
+    dispatcher.process([], now=60)
+    assert sent == [['a: ok'], ['2 checks notifications', '', 'b: ok', '', 'c: ok']]
+    assert dispatcher.pending == {}
+
+
+def test_dispatcher_survives_failures(dispatcher, sent):
+    def broken_handler(payload, client):
+        raise ValueError('broken')
+
+    dispatcher.handlers['broken'] = broken_handler
+    dispatcher.sender = mock.Mock(side_effect=ConnectionError)
+    dispatcher.process([NotificationEvent('broken', 'a', {}), checks_event('a')], now=0)
+    dispatcher.sender.assert_called_once_with(['a: ok'])
+    assert dispatcher.pending == {}
+
+
+def test_dispatcher_redis_roundtrip(sent):
+    client = Redis(connection_pool=BlockingConnectionPool())
+    client.delete(QUEUE_KEY)
+    for name in ['a', 'b', 'a']:
+        enqueue_notification(checks_event(name), client=client, max_size=2)
+    assert client.llen(QUEUE_KEY) == 2
+
+    dispatcher = NotificationDispatcher(
+        handlers={'checks': checks_handler},
+        sender=sent.append,
+        client=client,
+        window=1
+    )
+    thread = threading.Thread(target=dispatcher.run, daemon=True)
+    thread.start()
+    try:
+        thread.join(timeout=3)
+    finally:
+        dispatcher.stop()
+    thread.join()
+    assert sent == [['2 checks notifications', '', 'b: ok', '', 'a: ok']]
+    assert client.llen(QUEUE_KEY) == 0
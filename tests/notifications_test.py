@@ -8,9 +8,13 @@ from redis import BlockingConnectionPool, Redis
 from tools.notifications.messages import (cleanup_notification_state,
                                           compose_balance_message,
                                           compose_checks_message,
-                                          notify_checks, notify_balance,
+                                          notify_checks,
                                           notify_repair_mode,
-                                          send_message)
+                                          process_balance_notification,
+                                          process_checks_notification,
+                                          send_message,
+                                          NOTIFICATION_HANDLERS)
+from tools.notifications.dispatcher import NotificationEvent, QUEUE_KEY
 
 CURRENT_TIMESTAMP = 1594903080
 CURRENT_DATETIME = datetime.utcfromtimestamp(CURRENT_TIMESTAMP)
@@ -131,8 +135,14 @@ def test_cleanup_empty_notification_state():
     redis_client_mock.delete.assert_not_called()
 
 
-@mock.patch('tools.notifications.messages.send_message')
-def test_notify_balance(send_message_mock, cleaned_state):
+def test_process_balance_notification(cleaned_state):
+    messages = []
+
+    def notify_balance(*args):
+        message = process_balance_notification(*args)
+        if message:
+            messages.append(message)
+
     def get_state_data():
         count_key = 'messages.balance.count'
         state_key = 'messages.balance.state'
@@ -145,13 +155,13 @@ def test_notify_balance(send_message_mock, cleaned_state):
     balance, required_balance = 1, 0.5
 
     notify_balance(NODE_INFO, balance, required_balance)
-    assert send_message_mock.call_count == 1
+    assert len(messages) == 1
 
     count, state = get_state_data()
     assert count == 1 and state == 1
 
     notify_balance(NODE_INFO, balance, required_balance)
-    assert send_message_mock.call_count == 1
+    assert len(messages) == 1
 
     count, state = get_state_data()
     assert count == 2 and state == 1
@@ -159,22 +169,27 @@ def test_notify_balance(send_message_mock, cleaned_state):
     # not enough balance
     balance, required_balance = 1, 2
 
-    initial_call_count = send_message_mock.call_count
+    initial_call_count = len(messages)
     notify_balance(NODE_INFO, balance, required_balance)
-    assert send_message_mock.call_count == initial_call_count + 1
+    assert len(messages) == initial_call_count + 1
     count, state = get_state_data()
     assert count == 1 and state == 0
 
     # Next is not allowed
     notify_balance(NODE_INFO, balance, required_balance)
-    assert send_message_mock.call_count == initial_call_count + 1
+    assert len(messages) == initial_call_count + 1
     count, state = get_state_data()
     assert count == 2 and state == 0
 
 
-@mock.patch('tools.notifications.messages.send_message')
-def test_notify_checks(send_message_mock, cleaned_state):
+def test_process_checks_notification(cleaned_state):
     schain_name = 'test-schain'
+    messages = []
+
+    def notify_checks(*args):
+        message = process_checks_notification(*args)
+        if message:
+            messages.append(message)
 
     def get_state_data():
         count_key = f'messages.checks.{schain_name}.count'
@@ -220,37 +235,55 @@ def test_notify_checks(send_message_mock, cleaned_state):
 
     # Successful checks
     notify_checks(schain_name, NODE_INFO, successfull_checks)
-    assert send_message_mock.call_count == 1
+    assert len(messages) == 1
 
     check_state(1, "[('config', True), ('container', True), ('data_dir', True), ('dkg', True), ('firewall_rules', True), ('rpc', True), ('volume', True)]")  # noqa
 
     notify_checks(schain_name, NODE_INFO, successfull_checks)
-    assert send_message_mock.call_count == 1
+    assert len(messages) == 1
 
     count, state = get_state_data()
     check_state(2, "[('config', True), ('container', True), ('data_dir', True), ('dkg', True), ('firewall_rules', True), ('rpc', True), ('volume', True)]")  # noqa
 
     # Failed checks
-    initial_call_count = send_message_mock.call_count
+    initial_call_count = len(messages)
     notify_checks(schain_name, NODE_INFO, failed_checks_1)
-    assert send_message_mock.call_count == initial_call_count + 1
+    assert len(messages) == initial_call_count + 1
     check_state(1, "[('config', True), ('container', False), ('data_dir', True), ('dkg', False), ('firewall_rules', True), ('rpc', False), ('volume', True)]")  # noqa
 
     # Next is not allowed
     notify_checks(schain_name, NODE_INFO, failed_checks_1)
-    assert send_message_mock.call_count == initial_call_count + 1
+    assert len(messages) == initial_call_count + 1
     check_state(2, "[('config', True), ('container', False), ('data_dir', True), ('dkg', False), ('firewall_rules', True), ('rpc', False), ('volume', True)]")  # noqa
 
     # If state changed message should be sent
     notify_checks(schain_name, NODE_INFO, failed_checks_2)
-    assert send_message_mock.call_count == initial_call_count + 2
+    assert len(messages) == initial_call_count + 2
     check_state(1, "[('config', True), ('container', False), ('data_dir', True), ('dkg', False), ('firewall_rules', False), ('rpc', False), ('volume', False)]")  # noqa
 
 
-@mock.patch('tools.notifications.messages.send_message')
-def test_notify_repair(send_message_mock):
-    notify_repair_mode(NODE_INFO, 'test-schain')
-    send_message_mock.assert_called_with(
-        ['\u2757 Repair mode for test-schain enabled \n',
-         'Node ID: 1', 'Node IP: 1.1.1.1', 'SChain: test-schain']
+def test_notify_checks_enqueues():
+    client_mock = mock.Mock()
+    checks = {'dkg': True, 'rpc': False}
+    notify_checks('test-schain', NODE_INFO, checks, client=client_mock)
+    pipe = client_mock.pipeline.return_value
+    event = NotificationEvent.from_json(pipe.rpush.call_args[0][1])
+    assert pipe.rpush.call_args[0][0] == QUEUE_KEY
+    assert event == NotificationEvent(
+        'checks',
+        'test-schain',
+        {'schain_name': 'test-schain', 'node': NODE_INFO, 'checks': checks}
     )
+    pipe.execute.assert_called_once()
+
+
+def test_notify_repair():
+    client_mock = mock.Mock()
+    notify_repair_mode(NODE_INFO, 'test-schain', client=client_mock)
+    raw = client_mock.pipeline.return_value.rpush.call_args[0][1]
+    event = NotificationEvent.from_json(raw)
+    assert event.channel == 'repair_mode'
+    assert NOTIFICATION_HANDLERS['repair_mode'](event.payload, client_mock) == [
+        '\u2757 Repair mode for test-schain enabled \n',
+        'Node ID: 1', 'Node IP: 1.1.1.1', 'SChain: test-schain'
+    ]
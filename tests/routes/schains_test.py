@@ -9,6 +9,7 @@ from flask import Flask, appcontext_pushed, g
 from Crypto.Hash import keccak
 
 from core.node_config import NodeConfig
+from core.schains.check_history import get_check_history
 from core.schains.config.file_manager import ConfigFileManager
 from tests.utils import get_bp_data, get_test_rule_controller
 from web.models.schain import SChainRecord, upsert_schain_record
@@ -150,3 +151,25 @@ def test_schain_containers_versions(skale_bp):
             'ima_version': expected_ima_version
         }
     }
+
+
+def test_schain_check_history(skale_bp, schain_config, _schain_name):
+    history = get_check_history(_schain_name)
+    history.append({'rpc': False, 'config': True})
+    history.append({'rpc': True, 'config': True})
+    data = get_bp_data(
+        skale_bp,
+        get_api_url(BLUEPRINT_NAME, 'check-history'),
+        params={'schain_name': _schain_name, 'records': 'True'}
+    )
+    assert data['status'] == 'ok'
+    payload = data['payload']
+    assert payload['summary']['rpc']['flaps'] == 1
+    assert payload['summary']['config']['status'] is True
+    assert [record['checks'] for record in payload['records']] == [
+        {'rpc': False, 'config': True},
+        {'rpc': True, 'config': True}
+    ]
+
+    data = get_bp_data(skale_bp, get_api_url(BLUEPRINT_NAME, 'check-history'))
+    assert data['status'] == 'error'
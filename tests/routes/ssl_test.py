@@ -113,7 +113,8 @@ def post_bp_files_data(bp, request, file_data, full_response=False, **kwargs):
 def test_upload(skale_bp, ssl_folder, db, cert_key_pair_host):
     cert_path, key_path = cert_key_pair_host
     with mock.patch('web.routes.ssl.set_schains_need_reload'), \
-            mock.patch('web.routes.ssl.reload_nginx'):
+            mock.patch('web.routes.ssl.reload_nginx'), \
+            mock.patch('web.routes.ssl.start_ssl_rollout') as start_rollout_mock:
         with files_data(cert_path, key_path, force=False) as data:
             response = post_bp_files_data(
                 skale_bp,
@@ -121,6 +122,7 @@ def test_upload(skale_bp, ssl_folder, db, cert_key_pair_host):
                 file_data=data
             )
     assert response == {'status': 'ok', 'payload': {}}
+    start_rollout_mock.assert_called_once()
     uploaded_cert_path = os.path.join(SSL_CERTIFICATES_FILEPATH, 'ssl_cert')
     uploaded_key_path = os.path.join(SSL_CERTIFICATES_FILEPATH, 'ssl_key')
     assert filecmp.cmp(cert_path, uploaded_cert_path)
@@ -146,7 +148,8 @@ def test_upload_bad_cert(skale_bp, db, ssl_folder, bad_cert_host):
 def test_upload_cert_exist(skale_bp, db, cert_key_pair_host, cert_key_pair):
     cert_path, key_path = cert_key_pair_host
     with mock.patch('web.routes.ssl.set_schains_need_reload'), \
-            mock.patch('web.routes.ssl.reload_nginx'):
+            mock.patch('web.routes.ssl.reload_nginx'), \
+            mock.patch('web.routes.ssl.start_ssl_rollout'):
         with files_data(cert_path, key_path, force=False) as data:
             response = post_bp_files_data(
                 skale_bp,
@@ -168,3 +171,10 @@ def test_upload_cert_exist(skale_bp, db, cert_key_pair_host, cert_key_pair):
                 'status': 'ok',
                 'payload': {}
             }
+
+
+def test_rollout(skale_bp):
+    state = {'status': 'running', 'wave': 0, 'chains': {}}
+    with mock.patch('web.routes.ssl.get_ssl_rollout_state', return_value=state):
+        data = get_bp_data(skale_bp, get_api_url(BLUEPRINT_NAME, 'rollout'))
+    assert data == {'status': 'ok', 'payload': state}
@@ -0,0 +1,174 @@
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from web3 import Web3
+
+from tools.metrics import MetricsAggregator
+from tools.rpc_router import (
+    aggregate_rpc_stats,
+    get_rpc_stats,
+    get_saved_rpc_stats,
+    pinned_block,
+    RpcRouter
+)
+
+
+class StubNode:
+    """ Minimal JSON-RPC server with configurable latency and head block """
+
+    def __init__(self, delay=0, head=100):
+        self.delay = delay
+        self.head = head
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                stub.requests.append((body['method'], body['params']))
+                time.sleep(stub.delay)
+                result = hex(stub.head) if body['method'] == 'eth_blockNumber' else '0x1'
+                data = json.dumps({'jsonrpc': '2.0', 'id': body['id'], 'result': result})
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data.encode())
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def methods(self):
+        return [method for method, _ in self.requests]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def nodes():
+    nodes = [StubNode(), StubNode()]
+    try:
+        yield nodes
+    finally:
+        for node in nodes:
+            node.stop()
+
+
+def test_router_prefers_fast_endpoint(nodes):
+    slow, fast = nodes
+    slow.delay = 0.05
+    router = RpcRouter([slow.url, fast.url], hedge_min_delay=1)
+    web3 = Web3(router)
+    for _ in range(20):
+        assert web3.eth.block_number == 100
+    assert len(fast.requests) > len(slow.requests)
+    stats = {item['endpoint']: item for item in router.stats()}
+    assert stats[f'127.0.0.1:{fast.server.server_port}']['latency'] < \
+        stats[f'127.0.0.1:{slow.server.server_port}']['latency']
+    assert len(get_rpc_stats()) >= 2
+
+
+def test_router_hedges_slow_read(nodes):
+    stalled, healthy = nodes
+    router = RpcRouter([stalled.url, healthy.url], hedge_min_delay=0.05)
+    router.make_request('eth_chainId', [])
+    router.make_request('eth_chainId', [])
+    stalled.delay = 2
+    # Stalled endpoint is the primary one
+    router.endpoints[0].latency, router.endpoints[1].latency = 0.001, 0.01
+
+    start = time.monotonic()
+    assert router.make_request('eth_blockNumber', [])['result'] == hex(100)
+    assert time.monotonic() - start < 1
+    assert router.endpoints[1].hedged == 1
+
+
+def test_router_failover(nodes):
+    down, alive = nodes
+    down.stop()
+    router = RpcRouter([down.url, alive.url], hedge_min_delay=1)
+    for _ in range(5):
+        assert router.make_request('eth_blockNumber', [])['result'] == hex(100)
+    assert router.endpoints[0].errors >= 1
+    assert router.registry.ranked()[0].endpoint == alive.url
+
+
+def test_router_pinned_block(nodes):
+    first, second = nodes
+    first.head, second.head = 120, 120
+    web3 = Web3(RpcRouter([first.url, second.url]))
+    with pinned_block(web3) as block:
+        assert block == 120
+        first.head = second.head = 125
+        for _ in range(5):
+            web3.provider.make_request('eth_call', [{'to': '0x0'}, 'latest'])
+            web3.provider.make_request('eth_sendRawTransaction', ['0x00'])
+    pinned = first if 'eth_call' in first.methods() else second
+    other = second if pinned is first else first
+    assert 'eth_call' not in other.methods()
+    assert 'eth_sendRawTransaction' not in other.methods()
+    calls = [params for method, params in pinned.requests if method == 'eth_call']
+    assert calls == [[{'to': '0x0'}, hex(120)]] * 5
+
+
+def test_router_sticky_writes(nodes):
+    router = RpcRouter([node.url for node in nodes])
+    for _ in range(5):
+        router.make_request('eth_sendRawTransaction', ['0x00'])
+        router.make_request('eth_getTransactionReceipt', ['0x00'])
+    assert sorted(len(node.requests) for node in nodes) == [0, 10]
+
+
+def test_saved_rpc_stats(nodes, tmp_path):
+    router = RpcRouter([node.url for node in nodes])
+    for _ in range(3):
+        router.make_request('eth_blockNumber', [])
+    MetricsAggregator(str(tmp_path)).save()
+    saved = get_saved_rpc_stats(str(tmp_path))
+    assert list(saved) == ['MainProcess']
+    labels = {stats['endpoint'] for stats in saved['MainProcess']}
+    assert {f'127.0.0.1:{node.server.server_port}' for node in nodes} <= labels
+
+    endpoint = {'endpoint': 'a:1', 'hedged': 0, 'head': 10}
+    totals = aggregate_rpc_stats({
+        'MainProcess': [{**endpoint, 'latency': 0.1, 'requests': 2, 'errors': 1}],
+        'test-chain': [{**endpoint, 'latency': 0.4, 'requests': 4, 'errors': 1, 'head': 12}]
+    })
+    assert totals == [{
+        'endpoint': 'a:1', 'latency': pytest.approx(0.325), 'requests': 6,
+        'errors': 2, 'hedged': 0, 'head': 12
+    }]
+
+
+def read_in_child(router, queue):
+    queue.put(router.make_request('eth_blockNumber', [])['result'])
+
+
+def test_router_after_fork(nodes):
+    router = RpcRouter([node.url for node in nodes], hedge_min_delay=0.01)
+    nodes[0].delay = 0.05
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: router.make_request('eth_blockNumber', []), range(6)))
+    parent_registry = router.registry
+
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    process = ctx.Process(target=read_in_child, args=(router, queue))
+    process.start()
+    process.join(timeout=20)
+    if process.is_alive():
+        process.kill()
+    assert process.exitcode == 0
+    assert queue.get(timeout=1) == hex(100)
+    assert router.registry is parent_registry
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from core.schains.check_history import (
+    CheckHistory,
+    CheckSummary,
+    HEADER_SIZE,
+    MAX_CHECKS,
+    RECORD
+)
+from core.schains.checks import CheckRes, IChecks
+from core.schains.monitor.skaled_monitor import get_flapping_checks, is_flapping_mode
+
+
+@pytest.fixture
+def history(tmp_path):
+    return CheckHistory(os.path.join(tmp_path, 'checks_history.bin'), capacity=4)
+
+
+def test_check_history_ring_buffer(history):
+    assert history.read() == []
+    for i in range(6):
+        history.append({'config': True, 'rpc': i % 2 == 0}, {'rpc': 0.5}, ts=100 + i)
+    assert os.path.getsize(history.path) == HEADER_SIZE + 4 * RECORD.size
+
+    records = history.read()
+    assert [record.ts for record in records] == [102, 103, 104, 105]
+    assert [record.checks['rpc'] for record in records] == [True, False, True, False]
+    assert records[0].durations == {'config': 0, 'rpc': 0.5}
+    assert [record.ts for record in history.read(since=104)] == [104, 105]
+
+
+def test_check_history_new_checks(history):
+    history.append({'config': True}, ts=100)
+    history.append({'config': False, 'volume': True}, ts=101)
+    records = history.read()
+    assert records[0].checks == {'config': True}
+    assert records[1].checks == {'config': False, 'volume': True}
+
+    history.append({f'check_{i}': True for i in range(MAX_CHECKS + 1)}, ts=102)
+    assert len(history.read()[-1].checks) == MAX_CHECKS - 2
+
+
+def test_check_history_summary(history):
+    for ts, status in ((100, True), (110, False), (130, True), (140, True)):
+        history.append({'skaled_container': status}, ts=ts)
+    summary = history.summary(window=100, now=150)['skaled_container']
+    assert summary.status is True
+    assert summary.since == 130
+    assert summary.flaps == 2
+    assert summary.time_ok == 30
+    assert summary.time_failed == 20
+
+    assert history.summary(window=15, now=150)['skaled_container'].flaps == 0
+    assert get_flapping_checks(history.summary(window=100, now=150), threshold=2) == {
+        'skaled_container': 2
+    }
+    assert get_flapping_checks(None) == {}
+
+
+def test_is_flapping_mode():
+    summary = {
+        'rpc': CheckSummary(status=False, since=190, flaps=5),
+        'blocks': CheckSummary(status=True, since=100)
+    }
+    failed_rpc = {'config': True, 'rpc': False}
+    assert is_flapping_mode(failed_rpc, summary, hold_time=60, now=200)
+    # Failure lasts longer than hold time, skaled can be restarted
+    assert not is_flapping_mode(failed_rpc, summary, hold_time=60, now=250)
+    assert not is_flapping_mode({'config': True, 'rpc': True}, summary, now=200)
+    assert not is_flapping_mode({'config': False, 'rpc': False}, summary, now=200)
+    assert not is_flapping_mode(failed_rpc, None, now=200)
+
+    # Current failure is not recorded yet, blocks check flaps
+    summary = {
+        'rpc': CheckSummary(status=True, since=100),
+        'blocks': CheckSummary(status=True, since=190, flaps=5)
+    }
+    assert is_flapping_mode(failed_rpc, summary, hold_time=60, now=200)
+    summary['blocks'].flaps = 1
+    assert not is_flapping_mode(failed_rpc, summary, hold_time=60, now=200)
+
+
+def test_checks_get_all_records_history(history):
+    class Checks(IChecks):
+        def get_name(self):
+            return 'test'
+
+        @property
+        def config(self):
+            return CheckRes(True)
+
+        @property
+        def rpc(self):
+            return CheckRes(False)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('core.schains.check_history.get_check_history', lambda name: history)
+        Checks().get_all(log=False, history=True)
+    assert history.read()[0].checks == {'config': True, 'rpc': False}
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from core.node import ExtendedManagerNodeInfo
+from core.schains.checks import CheckRes, CheckStatus
+from core.schains.firewall.types import SChainRule
+
+
+def test_check_status_mapping():
+    status = CheckStatus({'config': True, 'rpc': False})
+    assert status == {'config': True, 'rpc': False}
+    assert len(status) == 2
+    assert list(status) == ['config', 'rpc']
+
+    status['rpc'] = True
+    status['volume'] = False
+    assert status.to_dict() == {'config': True, 'rpc': True, 'volume': False}
+    assert all(CheckStatus({'config': True, 'rpc': True}).values())
+
+    del status['config']
+    assert 'config' not in status
+    with pytest.raises(KeyError):
+        status['config']
+    with pytest.raises(KeyError):
+        del status['not_a_check']
+    assert json.loads(json.dumps(status.to_dict())) == {'rpc': True, 'volume': False}
+
+
+def test_compact_objects_have_no_dict():
+    res = CheckRes(True)
+    assert res.data == {}
+    assert not hasattr(res, '__dict__')
+    assert not hasattr(CheckStatus(), '__dict__')
+    assert not hasattr(SChainRule(10000, '1.1.1.1'), '__dict__')
+
+
+def test_extended_node_info():
+    node = ExtendedManagerNodeInfo(
+        id=1, name='node-1', ip='1.1.1.1', publicIP='2.2.2.2', port=10000, ip_change_ts=0
+    )
+    assert node['ip'] == node.ip == '1.1.1.1'
+    assert node.to_dict()['publicIP'] == '2.2.2.2'
+    assert not hasattr(node, '__dict__')
+    with pytest.raises(KeyError):
+        node['status']
@@ -13,6 +13,9 @@ from skale.skale_manager import spawn_skale_manager_lib
 from core.schains.cleaner import (
     cleanup_schain,
     delete_bls_keys,
+    fetch_membership_batch,
+    run_removal,
+    SChainMembership,
     remove_schain,
     monitor,
     get_schains_on_node,
@@ -85,13 +88,17 @@ def test_monitor(db, schain_dirs_for_monitor, skale, node_config, dutils):
             skale,
             TEST_SCHAIN_NAME_1,
             node_config.id,
-            dutils=dutils
+            dutils=dutils,
+            membership=mock.ANY,
+            sync_agent_ranges=mock.ANY
         )
         ensure_schain_removed_mock.assert_any_call(
             skale,
             TEST_SCHAIN_NAME_2,
             node_config.id,
-            dutils=dutils
+            dutils=dutils,
+            membership=mock.ANY,
+            sync_agent_ranges=mock.ANY
         )
 
     monitor(skale, node_config, dutils=dutils)
@@ -279,3 +286,51 @@ def test_cleanup_schain(
     assert not os.path.isdir(schain_dir_path)
     record = SChainRecord.get_by_name(schain_name)
     assert record.is_deleted is True
+
+
+def test_fetch_membership_batch():
+    skale_mock = mock.Mock()
+    skale_mock.schains_internal.is_schain_exist.side_effect = lambda name: name != 'removed'
+    skale_mock.node_rotation.is_rotation_active.side_effect = lambda name: name == 'rotating'
+    skale_mock.schains_internal.get_node_ids_for_schain.side_effect = \
+        lambda name: [1, 2] if name == 'member' else [3]
+
+    memberships = fetch_membership_batch(
+        skale_mock,
+        ['removed', 'rotating', 'member', 'left'],
+        node_id=1
+    )
+    assert memberships == {
+        'removed': SChainMembership('removed', False, False, False),
+        'rotating': SChainMembership('rotating', True, True, False),
+        'member': SChainMembership('member', True, False, True),
+        'left': SChainMembership('left', True, False, False)
+    }
+    assert fetch_membership_batch(skale_mock, [], node_id=1) == {}
+
+
+def test_run_removal():
+    dutils = mock.Mock()
+    memberships = {
+        name: SChainMembership(name, False, False, False)
+        for name in ['a', 'b', 'c', 'd']
+    }
+
+    def ensure_removed(skale, name, node_id, dutils, membership, sync_agent_ranges):
+        if name == 'b':
+            raise ValueError('Removal failed')
+
+    ensure_removed_mock = mock.Mock(side_effect=ensure_removed)
+    with mock.patch('core.schains.cleaner.ensure_schain_removed', ensure_removed_mock):
+        run_removal(
+            mock.Mock(),
+            node_id=1,
+            memberships=memberships,
+            sync_agent_ranges=[],
+            dutils=dutils,
+            workers=4
+        )
+    assert ensure_removed_mock.call_count == 4
+    ensure_removed_mock.assert_any_call(
+        mock.ANY, 'a', 1, dutils=dutils, membership=memberships['a'], sync_agent_ranges=[]
+    )
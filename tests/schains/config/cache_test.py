@@ -0,0 +1,113 @@
+import os
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import mock
+import pytest
+
+from core.schains.config.cache import ConfigDataCache
+
+
+class FakeSkale:
+    def __init__(self):
+        self.reads = Counter()
+        self.web3 = SimpleNamespace(eth=SimpleNamespace(block_number=10))
+        self.groups = {'schain-a': [0, 1], 'schain-b': [1, 2]}
+        self.rotation_ids = {'schain-a': 0, 'schain-b': 0}
+        self.ips = {}
+        self.nodes = SimpleNamespace(
+            get=self.counted('node', lambda i: {'ip': self.ips.get(i, f'10.0.0.{i}')}),
+            get_last_change_ip_time=lambda i: 100 if i in self.ips else 0
+        )
+        self.node_rotation = SimpleNamespace(
+            get_rotation=lambda name: {'rotation_id': self.rotation_ids[name]}
+        )
+        self.schains = SimpleNamespace(get_schains_for_node=self.counted(
+            'node_schains',
+            lambda i: [name for name, group in self.groups.items() if i in group]
+        ))
+        self.schains_internal = SimpleNamespace(get_node_ids_for_schain=self.counted(
+            'schain_node_ids',
+            lambda name: self.groups[name]
+        ))
+
+    def counted(self, kind, func):
+        def wrapper(*args):
+            self.reads[kind] += 1
+            return func(*args)
+        return wrapper
+
+
+@pytest.fixture
+def skale():
+    return FakeSkale()
+
+
+def test_config_data_cache_shared_between_chains(skale, tmp_path):
+    nodes_a = ConfigDataCache(skale, cache_dir=tmp_path).get_schain_nodes_with_schains('schain-a')
+    assert nodes_a == [
+        {'ip': '10.0.0.0', 'id': 0, 'schains': ['schain-a']},
+        {'ip': '10.0.0.1', 'id': 1, 'schains': ['schain-a', 'schain-b']}
+    ]
+    cache = ConfigDataCache(skale, cache_dir=tmp_path)
+    nodes_b = cache.get_schain_nodes_with_schains('schain-b')
+    assert [node['id'] for node in nodes_b] == [1, 2]
+    # Node 1 is fetched once for both chains
+    assert skale.reads == {'node': 3, 'node_schains': 3, 'schain_node_ids': 2}
+    assert (cache.hits, cache.misses) == (2, 3)
+    # Cached entries are not mutated by callers
+    assert cache.get_node(1) == {'ip': '10.0.0.1'}
+
+
+def test_config_data_cache_block_age(skale, tmp_path):
+    with mock.patch('core.schains.config.cache.time.time', return_value=1000):
+        ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=2, block_time=10).get_node(1)
+        ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=0).get_node(1)
+    assert skale.reads['node'] == 1
+    # Head could not advance more than 2 blocks in 20 seconds
+    with mock.patch('core.schains.config.cache.time.time', return_value=1020):
+        cache = ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=2, block_time=10)
+        cache.get_node(1)
+    assert skale.reads['node'] == 1
+    with mock.patch('core.schains.config.cache.time.time', return_value=1021):
+        ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=2, block_time=10).get_node(1)
+    assert skale.reads['node'] == 2
+
+
+def test_config_data_cache_evicts_expired(skale, tmp_path):
+    cache = ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=1, block_time=10)
+    cache.get_node(1)
+    cache.get_node(2)
+    old_ts = time.time() - 11
+    os.utime(cache._entry_path('node', 1), (old_ts, old_ts))
+    ConfigDataCache(skale, cache_dir=tmp_path, max_block_age=1, block_time=10)
+    assert os.listdir(tmp_path) == [os.path.basename(cache._entry_path('node', 2))]
+
+
+def test_config_data_cache_broken_entry(skale, tmp_path):
+    cache = ConfigDataCache(skale, cache_dir=tmp_path)
+    cache.get_node(1)
+    with open(cache._entry_path('node', 1), 'wb') as entry_file:
+        entry_file.write(b'broken')
+    assert ConfigDataCache(skale, cache_dir=tmp_path).get_node(1) == {'ip': '10.0.0.1'}
+    assert skale.reads['node'] == 2
+
+
+def test_config_data_cache_rotation_and_ip_change(skale, tmp_path):
+    cache = ConfigDataCache(skale, cache_dir=tmp_path)
+    assert cache.get_node_ids_for_schain('schain-a') == [0, 1]
+    assert cache.get_node_ids_for_schain('schain-a', rotation_id=0) == [0, 1]
+    assert skale.reads['schain_node_ids'] == 1
+
+    skale.groups['schain-a'] = [0, 2]
+    skale.rotation_ids['schain-a'] = 1
+    nodes = cache.get_schain_nodes_with_schains('schain-a', rotation_id=1)
+    assert [node['id'] for node in nodes] == [0, 2]
+    assert skale.reads['schain_node_ids'] == 2
+
+    assert cache.get_node(1) == {'ip': '10.0.0.1'}
+    skale.ips[1] = '10.0.1.1'
+    assert cache.get_node(1) == {'ip': '10.0.1.1'}
+    assert cache.get_node(1) == {'ip': '10.0.1.1'}
+    assert skale.reads['node'] == 4
@@ -0,0 +1,63 @@
+import copy
+
+from core.schains.config.diff import diff_configs
+from core.schains.monitor.skaled_monitor import is_config_only_update
+
+from tests.utils import generate_schain_config
+
+
+def test_diff_configs():
+    config = generate_schain_config('test-chain')
+    assert diff_configs(config, copy.deepcopy(config)).empty
+
+    new_config = copy.deepcopy(config)
+    new_config['accounts']['0x1'] = {'balance': '0x1'}
+    new_config['genesis']['timestamp'] = '0x01'
+    diff = diff_configs(config, new_config)
+    assert diff.categories == {'accounts', 'genesis'}
+    assert diff.to_dict()['genesis'] == ['genesis.timestamp']
+    assert not diff.restart_needed
+
+    new_config['skaleConfig']['sChain']['nodes'][1]['ip'] = '1.1.1.1'
+    new_config['skaleConfig']['nodeInfo']['httpRpcPort'] += 1
+    new_config['params']['chainID'] = '0x02'
+    diff = diff_configs(config, new_config)
+    assert diff.to_dict() == {
+        'accounts': ['accounts.0x1'],
+        'genesis': ['genesis.timestamp'],
+        'ips': ['skaleConfig.sChain.nodes.1.ip'],
+        'ports': ['skaleConfig.nodeInfo.httpRpcPort'],
+        'params': ['params.chainID']
+    }
+    assert diff.restart_needed
+
+
+def test_diff_configs_node_groups():
+    config = generate_schain_config('test-chain')
+    new_config = copy.deepcopy(config)
+    new_config['skaleConfig']['sChain']['nodeGroups']['2'] = {'nodes': {}}
+    new_config['skaleConfig']['sChain']['nodes'].pop()
+    new_config['skaleConfig']['nodeInfo']['ecdsaKeyName'] = 'NEK:1'
+    diff = diff_configs(config, new_config)
+    assert diff.to_dict() == {
+        'node_groups': ['skaleConfig.sChain.nodeGroups.2', 'skaleConfig.sChain.nodes'],
+        'other': ['skaleConfig.nodeInfo.ecdsaKeyName']
+    }
+    assert diff_configs(None, config).categories == {
+        'accounts', 'genesis', 'params', 'other'
+    }
+
+
+def test_is_config_only_update():
+    config = generate_schain_config('test-chain')
+    new_config = copy.deepcopy(config)
+    new_config['genesis']['timestamp'] = '0x01'
+    genesis_diff = diff_configs(config, new_config)
+    outdated = {'config': True, 'config_updated': False}
+    assert is_config_only_update(outdated, genesis_diff)
+    assert not is_config_only_update({'config': True, 'config_updated': True}, genesis_diff)
+    assert not is_config_only_update(outdated, None)
+    assert not is_config_only_update(outdated, diff_configs(config, config))
+
+    new_config['params']['chainID'] = '0x02'
+    assert not is_config_only_update(outdated, diff_configs(config, new_config))
@@ -0,0 +1,114 @@
+import copy
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from core.schains.config.cache import ConfigDataCache
+from core.schains.config.file_manager import ConfigFileManager
+from core.schains.config.upgrade import (
+    ConfigUpgradeError,
+    run_config_upgrade,
+    verify_config_diff
+)
+from tools.helper import read_json
+from web.models.schain import SChainRecord
+
+from tests.utils import CONFIG_STREAM, upsert_schain_record_with_config
+
+
+class FakeSkale:
+    def __init__(self, node_ids):
+        self.web3 = SimpleNamespace(eth=SimpleNamespace(block_number=10))
+        self.nodes = SimpleNamespace(
+            get=lambda i: {'port': 10000},
+            get_last_change_ip_time=lambda i: 0
+        )
+        self.schains = SimpleNamespace(
+            get_schains_for_node=lambda i: [],
+            get_by_name=lambda name: {'name': name}
+        )
+        self.schains_internal = SimpleNamespace(get_node_ids_for_schain=lambda name: node_ids)
+        self.node_rotation = SimpleNamespace(get_rotation=lambda name: {'rotation_id': 12})
+
+
+@pytest.fixture
+def outdated_chain(upstreams, schain_db):
+    upsert_schain_record_with_config(schain_db, version='0.0.0')
+    return schain_db
+
+
+def run_upgrade(name, new_config, tmp_path):
+    skale = FakeSkale([0, 1])
+    node_config = SimpleNamespace(id=0, sgx_key_name='key')
+    report_path = str(tmp_path / 'report.json')
+    with mock.patch('core.schains.config.upgrade.create_new_upstream_config',
+                    return_value=new_config) as create_config, \
+            mock.patch('core.schains.config.upgrade.ConfigDataCache',
+                       lambda skale: ConfigDataCache(skale, cache_dir=str(tmp_path))), \
+            mock.patch.object(ConfigDataCache, 'get_skale_manager_opts'):
+        results = run_config_upgrade(
+            skale,
+            node_config,
+            [SimpleNamespace(name=name, generation=0)],
+            workers=2,
+            report_filepath=report_path
+        )
+    return results, create_config, report_path
+
+
+def test_verify_config_diff(schain_config):
+    new_config = copy.deepcopy(schain_config)
+    assert verify_config_diff(schain_config, new_config) == []
+    new_config['skaleConfig']['nodeInfo']['newOption'] = 1
+    new_config['extra'] = 1
+    assert verify_config_diff(schain_config, new_config) == ['extra', 'skaleConfig.nodeInfo']
+
+    new_config['skaleConfig']['nodeInfo']['nodeID'] += 1
+    with pytest.raises(ConfigUpgradeError):
+        verify_config_diff(schain_config, new_config)
+
+
+def test_run_config_upgrade(outdated_chain, schain_config, tmp_path):
+    name = outdated_chain
+    cfm = ConfigFileManager(name)
+    new_config = copy.deepcopy(schain_config)
+    new_config['skaleConfig']['nodeInfo']['newOption'] = 1
+
+    results, create_config, report_path = run_upgrade(name, new_config, tmp_path)
+    assert [(r.name, r.status, r.changed) for r in results] == [
+        (name, 'switched', ['skaleConfig.nodeInfo'])
+    ]
+    assert create_config.call_args.kwargs['cache'] is not None
+    assert cfm.latest_upstream_config == new_config
+    assert cfm.upstream_exist_for_rotation_id(12)
+    assert not cfm.skaled_config_exists()
+    assert SChainRecord.get_by_name(name).config_version == CONFIG_STREAM
+    report = read_json(report_path)
+    assert report['stream_version'] == CONFIG_STREAM
+    assert report['chains'][0]['status'] == 'switched'
+
+    # Chain is on the current stream version now
+    results, create_config, _ = run_upgrade(name, new_config, tmp_path)
+    assert results == []
+    create_config.assert_not_called()
+
+
+def test_run_config_upgrade_unchanged(outdated_chain, schain_config, tmp_path):
+    name = outdated_chain
+    results, _, _ = run_upgrade(name, copy.deepcopy(schain_config), tmp_path)
+    assert results[0].status == 'unchanged'
+    assert ConfigFileManager(name).skaled_config_exists()
+    assert SChainRecord.get_by_name(name).config_version == CONFIG_STREAM
+
+
+def test_run_config_upgrade_rejected(outdated_chain, schain_config, tmp_path):
+    name = outdated_chain
+    new_config = copy.deepcopy(schain_config)
+    new_config['skaleConfig']['sChain']['schainID'] += 1
+    results, _, _ = run_upgrade(name, new_config, tmp_path)
+    assert results[0].status == 'rejected'
+    cfm = ConfigFileManager(name)
+    assert cfm.skaled_config_exists()
+    assert not cfm.upstream_exist_for_rotation_id(12)
+    assert SChainRecord.get_by_name(name).config_version == '0.0.0'
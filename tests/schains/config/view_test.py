@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+from core.schains.config.view import (
+    ConfigViewError,
+    get_skaled_config_view,
+    scan_sections,
+    SkaledConfigView
+)
+
+CONFIG = {
+    'sealEngine': 'Ethash',
+    'accounts': {
+        '0x1': {'balance': '0', 'code': '0x60' * 100, 'storage': {'0x0': '0x1'}},
+        '0x2': {'balance': '1', 'note': 'brackets {[ and "quotes" \\\\ inside'}
+    },
+    'params': {'chainID': '0x1', 'list': [1, 2.5, True, None]},
+    'skaleConfig': {
+        'nodeInfo': {'nodeID': 2, 'basePort': 10000},
+        'sChain': {
+            'nodes': [
+                {'nodeID': 1, 'ip': '1.1.1.1'},
+                {'nodeID': 2, 'ip': '2.2.2.2'}
+            ],
+            'nodeGroups': {'0': {'finish_ts': None}}
+        }
+    }
+}
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = os.path.join(tmp_path, 'schain_test.json')
+    with open(path, 'w') as config_file:
+        json.dump(CONFIG, config_file, indent=4)
+    return path
+
+
+def test_scan_sections():
+    data = json.dumps(CONFIG).encode()
+    sections = scan_sections(data)
+    assert list(sections) == list(CONFIG)
+    for key, (start, end) in sections.items():
+        assert json.loads(data[start:end]) == CONFIG[key]
+    with pytest.raises(ConfigViewError):
+        scan_sections(b'[1, 2]')
+
+
+def test_skaled_config_view(config_path):
+    view = SkaledConfigView(config_path)
+    assert view.base_port == 10000
+    assert view.node_ips == ['1.1.1.1', '2.2.2.2']
+    assert view.own_ip == '2.2.2.2'
+    assert view.node_groups == {'0': {'finish_ts': None}}
+    assert 'accounts' not in view._sections
+    assert view['params'] == CONFIG['params']
+    assert dict(view) == CONFIG
+    with pytest.raises(KeyError):
+        view['unknown']
+
+
+def test_get_skaled_config_view_cache(config_path):
+    assert get_skaled_config_view(config_path + '.missing') is None
+    view = get_skaled_config_view(config_path)
+    assert get_skaled_config_view(config_path) is view
+
+    with open(config_path, 'w') as config_file:
+        json.dump({**CONFIG, 'skaleConfig': {'nodeInfo': {'basePort': 1}}}, config_file)
+    updated = get_skaled_config_view(config_path)
+    assert updated is not view
+    assert updated.base_port == 1
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+from multiprocessing import Process
+
+import mock
+import pytest
+
+from core.schains.heartbeat import HeartbeatTable, HeartbeatTableError
+from core.schains.process import ProcessReport
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    return os.path.join(tmp_path, 'heartbeat.table')
+
+
+def test_heartbeat_table(table_path):
+    table = HeartbeatTable(path=table_path, slots=2)
+    assert table.all() == []
+    assert table.get('test-a') is None
+
+    ts = int(time.time())
+    table.register('test-a', 10, ts)
+    table.update('test-a', ts=ts + 10, task='config', task_ts=ts + 5)
+    hb = table.get('test-a')
+    assert (hb.pid, hb.start_ts, hb.ts, hb.task, hb.task_ts) == (10, ts, ts + 10, 'config', ts + 5)
+
+    table.register('test-b', 11, ts)
+    with pytest.raises(HeartbeatTableError):
+        table.register('test-c', 12, ts)
+
+    reopened = HeartbeatTable(path=table_path, slots=10)
+    assert reopened.slots == 2
+    assert [hb.name for hb in reopened.all()] == ['test-a', 'test-b']
+
+    table.release('test-a')
+    assert reopened.get('test-a') is None
+    table.register('test-c', 12, ts)
+    assert reopened.get('test-c').pid == 12
+
+
+def test_heartbeat_update_threads(table_path):
+    table = HeartbeatTable(path=table_path)
+    table.register('test', 10, 1)
+
+    def beat_field(field_name):
+        for value in range(1, 1001):
+            table.update('test', **{field_name: value})
+
+    with mock.patch('core.schains.heartbeat.fcntl.flock') as flock_mock:
+        threads = [threading.Thread(target=beat_field, args=(f,)) for f in ('ts', 'task_ts')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    flock_mock.assert_not_called()
+    hb = table.get('test')
+    assert (hb.pid, hb.ts, hb.task_ts) == (10, 1000, 1000)
+
+
+def beat(table_path, name):
+    table = HeartbeatTable(path=table_path)
+    table.register(name, os.getpid(), 1)
+    table.update(name, ts=2)
+
+
+def test_heartbeat_table_other_process(table_path):
+    table = HeartbeatTable(path=table_path)
+    process = Process(target=beat, args=(table_path, 'test'))
+    process.start()
+    process.join()
+    hb = table.get('test')
+    assert hb.pid == process.pid
+    assert hb.ts == 2
+
+
+def test_process_report_table_full(_schain_name, table_path):
+    table = HeartbeatTable(path=table_path, slots=1)
+    table.register('another', 1, 1)
+    report = ProcessReport(_schain_name, table=table)
+    try:
+        report.update(pid=10, ts=20)
+        assert report.path.is_file()
+        assert report.read() == {'pid': 10, 'ts': 20}
+        report.ts = 30
+        assert report.ts == 30
+    finally:
+        report.cleanup()
+        report.path.parent.rmdir()
+
+
+def test_process_report_export(_schain_name, table_path):
+    report = ProcessReport(_schain_name, table=HeartbeatTable(path=table_path))
+    try:
+        report.update(pid=10, ts=20)
+        assert not report.path.is_file()
+        report.export()
+        assert report._read_file() == {'pid': 10, 'ts': 20}
+    finally:
+        report.cleanup()
+        report.path.parent.rmdir()
@@ -1,4 +1,14 @@
-from core.schains.ima import get_ima_env
+import asyncio
+import json
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+import websockets
+
+from core.schains.ima import get_ima_env, get_ima_log_checks, ImaHealthCache
 
 
 def test_get_ima_env(_schain_name, schain_config):
@@ -13,3 +23,100 @@ def test_get_ima_env(_schain_name, schain_config):
     assert ima_env_dict['RPC_PORT'] == 10010
     assert ima_env_dict['TIME_FRAMING'] == 100
     isinstance(ima_env_dict['CID_SCHAIN'], str)
+
+
+class FakeContainer:
+    def __init__(self, name, status):
+        self.name = name
+        self.status = status
+
+
+class FakeDockerUtils:
+    def __init__(self, containers):
+        self.containers = containers
+
+    def get_all_ima_containers(self, all=False, format=False):
+        return self.containers
+
+
+@pytest.fixture
+def ima_agents():
+    """ Stub IMA agents: fast one replies immediately, stuck one never replies """
+    async def fast(ws):
+        await ws.recv()
+        await ws.send(json.dumps({
+            'last_transfer_errors': [{'ts': 1, 'text': 'failed'}],
+            'last_error_categories': ['connection']
+        }))
+
+    async def stuck(ws):
+        await ws.recv()
+        await ws.wait_closed()
+
+    async def serve(handler):
+        return await websockets.serve(handler, 'localhost', 0)
+
+    loop = asyncio.new_event_loop()
+    servers = [loop.run_until_complete(serve(handler)) for handler in (fast, stuck)]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield [server.sockets[0].getsockname()[1] for server in servers]
+    finally:
+        async def shutdown():
+            for server in servers:
+                server.close()
+                await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=15)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_get_ima_log_checks(tmp_path, ima_agents):
+    fast_port, stuck_port = ima_agents
+    ports = {'fast-chain': fast_port, 'stuck-chain': stuck_port}
+    for name in ('fast-chain', 'stuck-chain', 'stopped-chain', 'no-ima-chain'):
+        os.mkdir(os.path.join(tmp_path, name))
+    docker_utils = FakeDockerUtils([
+        FakeContainer('skale_ima_fast-chain', 'running'),
+        FakeContainer('skale_ima_stuck-chain', 'running'),
+        FakeContainer('skale_ima_stopped-chain', 'exited')
+    ])
+    with mock.patch('core.schains.ima.SCHAINS_DIR_PATH', str(tmp_path)), \
+            mock.patch('core.schains.ima.get_ima_monitoring_port', ports.get):
+        start = time.monotonic()
+        checks = get_ima_log_checks(docker_utils, deadline=1)
+        assert time.monotonic() - start < 3
+
+    results = {name: result for check in checks for name, result in check.items()}
+    assert results == {
+        'fast-chain': {
+            'error': None,
+            'last_ima_errors': [{'ts': 1, 'text': 'failed'}],
+            'error_categories': ['connection']
+        },
+        'stuck-chain': {
+            'error': 'Request timed out after 1s',
+            'last_ima_errors': [],
+            'error_categories': []
+        },
+        'stopped-chain': {
+            'error': 'IMA docker container is not running',
+            'last_ima_errors': [],
+            'error_categories': []
+        }
+    }
+
+
+def test_ima_health_cache():
+    docker_utils = FakeDockerUtils([])
+    cache = ImaHealthCache(ttl=60)
+    with mock.patch('core.schains.ima.get_ima_log_checks', side_effect=[['first'], ['second']]):
+        assert cache.get(docker_utils) == ['first']
+        assert cache.get(docker_utils) == ['first']
+        cache.ts -= 120
+        assert cache.get(docker_utils) == ['first']
+        cache.refresh_thread.join()
+        assert cache.get(docker_utils) == ['second']
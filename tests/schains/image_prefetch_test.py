@@ -0,0 +1,74 @@
+import os
+import time
+
+import pytest
+
+from core.schains.image_prefetch import (
+    get_prefetch_targets,
+    ImagePrefetcher,
+    PrefetchTarget,
+    read_prefetch_state
+)
+from core.schains.runner import get_image_name
+from tools.configs.containers import CONTAINERS_INFO, IMA_CONTAINER, SCHAIN_CONTAINER
+
+
+class FakeDockerUtils:
+    def __init__(self, images, failing=()):
+        self.images = set(images)
+        self.failing = set(failing)
+        self.pulls = []
+
+    def pulled(self, image):
+        return image in self.images
+
+    def pull(self, image, lock=True):
+        assert not lock
+        self.pulls.append(image)
+        if image in self.failing:
+            raise RuntimeError('Pull failed')
+        self.images.add(image)
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return os.path.join(tmp_path, 'image_prefetch.json')
+
+
+def test_get_prefetch_targets(ima_migration_schedule):
+    targets = get_prefetch_targets()
+    assert [target.image for target in targets[:2]] == [
+        get_image_name(SCHAIN_CONTAINER),
+        get_image_name(IMA_CONTAINER)
+    ]
+    if CONTAINERS_INFO[IMA_CONTAINER].get('new_version'):
+        assert targets[-1].image == get_image_name(IMA_CONTAINER, new=True)
+        assert targets[-1].deadline > 0
+
+
+def test_image_prefetcher(state_path):
+    targets = [
+        PrefetchTarget('skale/present:1', 0),
+        PrefetchTarget('skale/missing:1', 0),
+        PrefetchTarget('skale/broken:1', 100)
+    ]
+    dutils = FakeDockerUtils(['skale/present:1'], failing=['skale/broken:1'])
+    state = ImagePrefetcher(dutils, state_path=state_path).run(targets)
+    assert dutils.pulls == ['skale/missing:1', 'skale/broken:1']
+    assert {image: pull.status for image, pull in state.items()} == {
+        'skale/present:1': 'present',
+        'skale/missing:1': 'pulled',
+        'skale/broken:1': 'failed'
+    }
+    assert read_prefetch_state(state_path) == state
+
+    # Failed pull is not retried before retry interval passes
+    dutils.pulls.clear()
+    ImagePrefetcher(dutils, state_path=state_path, retry_interval=600).run(targets)
+    assert dutils.pulls == []
+
+    dutils.failing.clear()
+    prefetcher = ImagePrefetcher(dutils, state_path=state_path, retry_interval=600)
+    prefetcher.state['skale/broken:1'].ts = int(time.time()) - 1000
+    assert prefetcher.run(targets)['skale/broken:1'].status == 'pulled'
+    assert dutils.pulls == ['skale/broken:1']
@@ -0,0 +1,81 @@
+import mock
+import pytest
+
+from core.schains.leaving_history import (
+    LeavingEntry,
+    LeavingHistoryIndex,
+    get_rotating_schains,
+    schain_id_to_hex
+)
+
+NOW = 1_700_000_000
+
+
+class Schain:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.active = False
+
+
+@pytest.fixture
+def skale_mock():
+    skale = mock.Mock()
+    skale.schains.get.side_effect = lambda schain_id: Schain(f'schain-{schain_id[-1]}')
+    skale.node_rotation.is_rotation_active.side_effect = lambda name: name == 'schain-3'
+    skale.node_rotation.get_leaving_history.return_value = [
+        {'schain_id': b'\x01', 'finished_rotation': NOW - 3600},
+        {'schain_id': b'\x02', 'finished_rotation': NOW - 60}
+    ]
+    return skale
+
+
+def test_schain_id_to_hex():
+    assert schain_id_to_hex(b'\xab\x01') == '0xab01'
+    assert schain_id_to_hex('0xAB01') == '0xab01'
+    assert schain_id_to_hex('ab01') == '0xab01'
+
+
+def test_leaving_history_index(skale_mock, tmp_path):
+    index = LeavingHistoryIndex(skale_mock, 1, dir_path=str(tmp_path))
+    entries = index.refresh()
+    assert entries == [
+        LeavingEntry('0x01', NOW - 3600, 'schain-1'),
+        LeavingEntry('0x02', NOW - 60, 'schain-2')
+    ]
+    assert skale_mock.schains.get.call_count == 2
+
+    # only new entries are resolved, index is kept on disk
+    skale_mock.node_rotation.get_leaving_history.return_value.append(
+        {'schain_id': b'\x03', 'finished_rotation': NOW + 3600}
+    )
+    restarted = LeavingHistoryIndex(skale_mock, 1, dir_path=str(tmp_path))
+    entries = restarted.refresh()
+    assert [entry.name for entry in entries] == ['schain-1', 'schain-2', 'schain-3']
+    assert skale_mock.schains.get.call_count == 3
+    assert restarted.read() == entries
+
+    restarted.refresh()
+    assert skale_mock.schains.get.call_count == 3
+
+
+def test_leaving_history_index_rebuild(skale_mock, tmp_path):
+    index = LeavingHistoryIndex(skale_mock, 1, dir_path=str(tmp_path))
+    index.refresh()
+    skale_mock.node_rotation.get_leaving_history.return_value = [
+        {'schain_id': '0x04', 'finished_rotation': NOW}
+    ]
+    assert index.refresh() == [LeavingEntry('0x04', NOW, 'schain-4')]
+
+
+def test_get_rotating_schains(skale_mock):
+    entries = [
+        LeavingEntry('0x01', NOW - 3600, 'schain-1'),
+        LeavingEntry('0x02', NOW - 60, 'schain-2'),
+        LeavingEntry('0x03', NOW + 3600, 'schain-3'),
+        LeavingEntry('0x05', NOW + 3600, '')
+    ]
+    schains = get_rotating_schains(skale_mock, entries, now=NOW)
+    assert [(schain.name, schain.active) for schain in schains] == [('schain-3', True)]
+    # finished and removed entries are not checked on contracts
+    checked = [c.args[0] for c in skale_mock.node_rotation.is_rotation_active.call_args_list]
+    assert sorted(checked) == ['schain-2', 'schain-3']
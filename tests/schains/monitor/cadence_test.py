@@ -0,0 +1,211 @@
+import functools
+import random
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import pytest
+
+from core.schains.check_history import CheckSummary
+from core.schains.monitor.cadence import (
+    Cadence,
+    ChainCadence,
+    PipelineSlots,
+    SLOT_EXEMPT_REASONS,
+    get_backoff_interval,
+    get_chain_cadence,
+    report_config_state,
+    report_skaled_state
+)
+from core.schains.monitor.tasks import execute_tasks, ITask
+from core.schains.process import ProcessReport
+
+
+def test_get_backoff_interval():
+    assert get_backoff_interval(0, 10, 160, 600) == 10
+    assert get_backoff_interval(599, 10, 160, 600) == 10
+    assert get_backoff_interval(600, 10, 160, 600) == 20
+    assert get_backoff_interval(1800, 10, 160, 600) == 80
+    assert get_backoff_interval(10 ** 6, 10, 160, 600) == 160
+
+
+def test_chain_cadence():
+    cadence = ChainCadence('test', min_interval=10, max_interval=160, step=600, jitter=0.2)
+    assert cadence.current(now=0) == Cadence(10, 'unknown')
+
+    cadence.record('config', True, now=0)
+    cadence.record('skaled', True, now=100)
+    assert cadence.current(now=700) == Cadence(20, 'stable')
+    assert 16 <= cadence.next_delay(Cadence(20, 'stable')) <= 24
+    assert cadence.next_delay(Cadence(10, 'failing')) == 10
+
+    cadence.record('skaled', False, now=800)
+    assert cadence.current(now=800) == Cadence(10, 'failing')
+    cadence.record('skaled', True, now=900)
+    assert cadence.current(now=1000) == Cadence(10, 'stable')
+
+    cadence.mark_urgent('repair', until=2000)
+    cadence.mark_urgent('dkg', until=1500)
+    assert cadence.current(now=1400) == Cadence(10, 'dkg')
+    assert cadence.current(now=1600) == Cadence(10, 'repair')
+    cadence.clear_urgent('repair')
+    assert cadence.current(now=1600) == Cadence(20, 'stable')
+
+
+def test_chain_cadence_bootstrap():
+    cadence = ChainCadence('test', min_interval=10, max_interval=160, step=600)
+    cadence.bootstrap({
+        'rpc': CheckSummary(status=True, since=100),
+        'blocks': CheckSummary(status=False, since=200)
+    })
+    assert cadence.stable_since is None
+    cadence.bootstrap({
+        'rpc': CheckSummary(status=True, since=100),
+        'blocks': CheckSummary(status=True, since=200)
+    })
+    assert cadence.current(now=1400) == Cadence(40, 'stable')
+
+
+def test_report_state(_schain_name):
+    now = time.time()
+    report_config_state(_schain_name, {'config': True}, False, int(now) + 600)
+    report_skaled_state(_schain_name, {'rpc': True}, False, int(now) + 60)
+    cadence = get_chain_cadence(_schain_name)
+    assert set(cadence.urgent) == {'dkg', 'rotation', 'exit'}
+    assert cadence.current().reason == 'dkg'
+
+    report_config_state(_schain_name, {'config': True}, True, 0)
+    assert cadence.current().reason == 'rotation'
+    report_skaled_state(_schain_name, {'rpc': False}, True, None)
+    assert cadence.current().reason == 'rotation'
+    assert cadence.healthy == {'config': True, 'skaled': False}
+
+
+def test_pipeline_slots(tmp_path):
+    slots = PipelineSlots(str(tmp_path), 2)
+    first, second = slots.acquire(), slots.acquire()
+    assert first is not None and second is not None
+    assert slots.acquire() is None
+    slots.release(first)
+    third = slots.acquire()
+    assert third is not None
+    slots.release(second)
+    slots.release(third)
+
+
+class CountedTask(ITask):
+    def __init__(self, name: str, duration: float = 0, stuck_timeout: int = 3600) -> None:
+        self._name = name
+        self.duration = duration
+        self._stuck_timeout = stuck_timeout
+        self._start_ts = 0
+        self._future = Future()
+        self.runs = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def future(self) -> Future:
+        return self._future
+
+    @future.setter
+    def future(self, value: Future) -> None:
+        self._future = value
+
+    @property
+    def start_ts(self) -> int:
+        return self._start_ts
+
+    @start_ts.setter
+    def start_ts(self, value: int) -> None:
+        self._start_ts = value
+
+    @property
+    def stuck_timeout(self) -> int:
+        return self._stuck_timeout
+
+    @property
+    def needed(self) -> bool:
+        return True
+
+    def run(self) -> None:
+        self.runs += 1
+        time.sleep(self.duration)
+
+    def create_pipeline(self) -> Callable:
+        return functools.partial(self.run)
+
+
+@pytest.fixture
+def stable_cadence(_schain_name):
+    cadence = ChainCadence(
+        _schain_name,
+        min_interval=1,
+        max_interval=100,
+        step=1,
+        start_jitter=0,
+        rand=random.Random(1)
+    )
+    cadence.record('counted', True, now=time.time() - 100)
+    return cadence
+
+
+def run_until_stuck(tasks, process_report, **kwargs) -> None:
+    stuck = CountedTask('stuck', duration=5, stuck_timeout=2)
+    execute_tasks(tasks=[stuck, *tasks], process_report=process_report, sleep_interval=1, **kwargs)
+
+
+def test_execute_tasks_cadence(_schain_name, stable_cadence):
+    process_report = ProcessReport(name=_schain_name)
+    regular, adaptive = CountedTask('counted'), CountedTask('counted')
+    run_until_stuck([regular], process_report)
+    run_until_stuck([adaptive], process_report, cadence=stable_cadence)
+    assert regular.runs >= 3
+    assert adaptive.runs == 1
+
+
+def test_execute_tasks_slots(_schain_name, tmp_path, stable_cadence):
+    process_report = ProcessReport(name=_schain_name)
+    slots = PipelineSlots(str(tmp_path), 2)
+    held = slots.acquire()
+    task = CountedTask('counted')
+    try:
+        run_until_stuck([task], process_report, slots=slots)
+    finally:
+        slots.release(held)
+    # stuck task holds the second slot
+    assert task.runs == 0
+
+    stable_cadence.mark_urgent('dkg', until=time.time() + 100)
+    held = slots.acquire()
+    try:
+        run_until_stuck([task], process_report, slots=slots, cadence=stable_cadence)
+    finally:
+        slots.release(held)
+    assert task.runs >= 1
+
+
+def test_execute_tasks_slot_hold_max(_schain_name, tmp_path, stable_cadence):
+    process_report = ProcessReport(name=_schain_name)
+    slots = PipelineSlots(str(tmp_path), 2)
+    held = slots.acquire()
+    task = CountedTask('counted')
+    try:
+        run_until_stuck([task], process_report, slots=slots, slot_hold_max=0)
+    finally:
+        slots.release(held)
+    # stuck task gives its slot back after the hold time
+    assert task.runs >= 1
+    first, second = slots.acquire(), slots.acquire()
+    assert first is not None and second is not None
+    slots.release(first)
+    slots.release(second)
+
+
+def test_slot_exempt_reasons(stable_cadence):
+    stable_cadence.record('skaled', False)
+    assert stable_cadence.current().reason in SLOT_EXEMPT_REASONS
+    for reason in ('rotation', 'exit', 'repair'):
+        assert reason in SLOT_EXEMPT_REASONS
@@ -7,10 +7,13 @@ import freezegun
 import pytest
 
 from core.schains.checks import CheckRes, SkaledChecks
+from core.schains.config.diff import diff_configs
 from core.schains.config.directory import schain_config_dir
 from core.schains.monitor.action import SkaledActionManager
 from core.schains.monitor.skaled_monitor import (
     BackupSkaledMonitor,
+    ConfigOnlySkaledMonitor,
+    FlappingSkaledMonitor,
     get_skaled_monitor,
     ReloadGroupSkaledMonitor,
     ReloadIpSkaledMonitor,
@@ -21,6 +24,7 @@ from core.schains.monitor.skaled_monitor import (
     RepairSkaledMonitor,
     UpdateConfigSkaledMonitor,
 )
+from core.schains.check_history import CheckSummary
 from core.schains.external_config import ExternalConfig
 from core.schains.exit_scheduler import ExitScheduleFileManager
 from core.schains.runner import get_container_info
@@ -358,6 +362,58 @@ def test_get_skaled_monitor_reload_ip(
     assert mon == ReloadIpSkaledMonitor
 
 
+def test_get_skaled_monitor_config_only(
+    skaled_am, skaled_checks_outdated_config, schain_db, skaled_status, ncli_status
+):
+    name = schain_db
+    schain_record = SChainRecord.get_by_name(name)
+    state = skaled_checks_outdated_config.get_all()
+    state['config'] = True
+
+    genesis_diff = diff_configs({'accounts': {'0x1': {'balance': '1'}}},
+                                {'accounts': {'0x1': {'balance': '2'}}})
+    mon = get_skaled_monitor(
+        skaled_am, state, schain_record, skaled_status, ncli_status, config_diff=genesis_diff
+    )
+    assert mon == ConfigOnlySkaledMonitor
+
+    ports_diff = diff_configs({'skaleConfig': {'nodeInfo': {'basePort': 10000}}},
+                              {'skaleConfig': {'nodeInfo': {'basePort': 10064}}})
+    mon = get_skaled_monitor(
+        skaled_am, state, schain_record, skaled_status, ncli_status, config_diff=ports_diff
+    )
+    assert mon == RegularSkaledMonitor
+
+
+def test_get_skaled_monitor_flapping(
+    skaled_am, skaled_checks, schain_db, skaled_status, ncli_status
+):
+    name = schain_db
+    schain_record = SChainRecord.get_by_name(name)
+    state = skaled_checks.get_all()
+    state['rpc'] = False
+
+    history = {'rpc': CheckSummary(status=False, since=time.time() - 10, flaps=10)}
+    mon = get_skaled_monitor(
+        skaled_am, state, schain_record, skaled_status, ncli_status, check_history=history
+    )
+    assert mon == FlappingSkaledMonitor
+
+    history['rpc'].since = time.time() - 3600
+    mon = get_skaled_monitor(
+        skaled_am, state, schain_record, skaled_status, ncli_status, check_history=history
+    )
+    assert mon == RegularSkaledMonitor
+
+
+def test_flapping_skaled_monitor_holds_restart(skaled_am, skaled_checks, clean_docker, dutils):
+    with mock.patch.object(skaled_am, 'skaled_rpc') as rpc_mock, \
+            mock.patch.object(type(skaled_checks), 'rpc', CheckRes(False)):
+        FlappingSkaledMonitor(skaled_am, skaled_checks).run()
+    rpc_mock.assert_not_called()
+    assert dutils.safe_get_container(f'skale_schain_{skaled_am.name}')
+
+
 @freezegun.freeze_time(CURRENT_DATETIME)
 def test_get_skaled_monitor_new_node(
     schain_db,
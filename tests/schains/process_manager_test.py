@@ -25,6 +25,7 @@ def tmp_dir(_schain_name):
     try:
         yield path
     finally:
+        ProcessReport(_schain_name).cleanup()
         shutil.rmtree(path, ignore_errors=True)
 
 
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from core.schains.ssl_rollout import SslRollout
+
+
+@pytest.fixture
+def rollout(tmp_path):
+    path = os.path.join(tmp_path, 'ssl_rollout.json')
+    return SslRollout(path=path, wave_size=2, wave_timeout=100)
+
+
+def statuses(rollout):
+    state = rollout.read()
+    return {name: chain['status'] for name, chain in state['chains'].items()}
+
+
+def test_no_rollout_admits_all(rollout):
+    assert rollout.is_admitted('a')
+    rollout.report('a', reload_needed=False, healthy=True)
+    assert rollout.read() is None
+
+
+def test_rollout_waves(rollout):
+    rollout.start(['c', 'a', 'b'], now=0)
+    assert statuses(rollout) == {'a': 'admitted', 'b': 'admitted', 'c': 'pending'}
+    assert rollout.is_admitted('a') and rollout.is_admitted('b')
+    assert not rollout.is_admitted('c')
+    assert rollout.is_admitted('unknown')
+
+    rollout.mark_started('a', now=10)
+    rollout.mark_started('c', now=10)
+    assert statuses(rollout) == {'a': 'recreating', 'b': 'admitted', 'c': 'pending'}
+
+    # container is back, but rpc is not
+    rollout.report('a', reload_needed=False, healthy=False, now=20)
+    # chain without running container started with the new cert right away
+    rollout.report('b', reload_needed=False, healthy=True, now=20)
+    assert statuses(rollout) == {'a': 'recreating', 'b': 'done', 'c': 'pending'}
+
+    rollout.report('a', reload_needed=False, healthy=True, now=40)
+    state = rollout.read()
+    assert state['wave'] == 1
+    assert state['chains']['a']['downtime'] == 30
+    assert state['chains']['b']['downtime'] == 0
+    assert statuses(rollout)['c'] == 'admitted'
+
+    rollout.mark_started('c', now=50)
+    rollout.report('c', reload_needed=False, healthy=True, now=55)
+    state = rollout.read()
+    assert state['status'] == 'finished'
+    assert state['chains']['c']['downtime'] == 5
+
+
+def test_rollout_survives_restart(rollout):
+    rollout.start(['a', 'b', 'c'], now=0)
+    rollout.mark_started('a', now=10)
+    restarted = SslRollout(path=rollout.path, wave_size=2, wave_timeout=100)
+    assert statuses(restarted)['a'] == 'recreating'
+    assert not restarted.is_admitted('c')
+
+
+def test_rollout_continues_after_unhealthy(rollout):
+    rollout.start(['a', 'b', 'c'], now=0)
+    rollout.mark_started('a', now=10)
+    rollout.report('a', reload_needed=False, healthy=False, now=50)
+    rollout.report('c', reload_needed=True, healthy=True, now=150)
+    state = rollout.read()
+    assert state['status'] == 'running'
+    assert statuses(rollout) == {'a': 'unhealthy', 'b': 'skipped', 'c': 'admitted'}
+    assert rollout.is_admitted('c')
+
+
+def test_rollout_ignores_chains_unhealthy_before(rollout):
+    rollout.start(['a', 'b', 'c'], now=0)
+    rollout.report('a', reload_needed=True, healthy=False, now=5)
+    rollout.mark_started('a', now=10)
+    rollout.report('b', reload_needed=False, healthy=True, now=20)
+    # wave moves on without waiting for the timeout
+    assert statuses(rollout) == {'a': 'recreating', 'b': 'done', 'c': 'admitted'}
+    rollout.report('a', reload_needed=False, healthy=True, now=30)
+    assert statuses(rollout)['a'] == 'done'
+
+
+def test_halted_rollout_admits_all(rollout):
+    rollout.start(['a', 'b', 'c'], now=0)
+    state = rollout.read()
+    state['status'] = 'halted'
+    rollout._write(state)
+    assert rollout.is_admitted('c')
+    rollout.report('c', reload_needed=False, healthy=True, now=10)
+    assert statuses(rollout)['c'] == 'pending'
+
+
+def test_rollout_skips_silent_chains(rollout):
+    rollout.start(['a', 'b', 'c'], now=0)
+    rollout.report('a', reload_needed=False, healthy=True, now=10)
+    rollout.report('c', reload_needed=True, healthy=True, now=150)
+    assert statuses(rollout) == {'a': 'done', 'b': 'skipped', 'c': 'admitted'}
+    assert rollout.read()['status'] == 'running'
@@ -0,0 +1,132 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from skale.schain_config import PORTS_PER_SCHAIN
+
+from core.schains.config.cache import ConfigDataCache
+from core.schains.sync_chains import (
+    ChainNodeConfig,
+    allocate_base_ports,
+    ChainScheduler,
+    get_chain_node_configs,
+    parse_schain_names,
+    PortsAllocationError
+)
+
+
+class FakeSkale:
+    def __init__(self):
+        self.reads = Counter()
+        self.web3 = SimpleNamespace(eth=SimpleNamespace(block_number=10))
+        self.groups = {'schain-a': [0, 1], 'schain-b': [1, 2], 'schain-c': [1]}
+        self.nodes = SimpleNamespace(
+            get=self.counted('node', lambda i: {'port': 10000 + i}),
+            get_last_change_ip_time=lambda i: 0
+        )
+        self.node_rotation = SimpleNamespace(get_rotation=lambda name: {'rotation_id': 0})
+        self.schains = SimpleNamespace(get_schains_for_node=self.counted(
+            'node_schains',
+            lambda i: [
+                SimpleNamespace(name=name)
+                for name, group in self.groups.items() if i in group
+            ]
+        ))
+        self.schains_internal = SimpleNamespace(
+            get_node_ids_for_schain=self.counted(
+                'schain_node_ids',
+                lambda name: self.groups[name]
+            ),
+            is_schain_exist=lambda name: name in self.groups
+        )
+
+    def counted(self, kind, func):
+        def wrapper(*args):
+            self.reads[kind] += 1
+            return func(*args)
+        return wrapper
+
+
+@pytest.fixture
+def skale():
+    return FakeSkale()
+
+
+def test_parse_schain_names():
+    assert parse_schain_names('schain-a', None) == ['schain-a']
+    assert parse_schain_names(None, 'schain-a, schain-b,,schain-a') == ['schain-a', 'schain-b']
+    assert parse_schain_names('schain-c', 'schain-a') == ['schain-a', 'schain-c']
+    assert parse_schain_names(None, '') == []
+
+
+def test_get_chain_node_configs(skale, tmp_path):
+    cache = ConfigDataCache(skale, cache_dir=tmp_path)
+    configs = get_chain_node_configs(
+        skale, ['schain-a', 'schain-b', 'schain-c', 'missing'], cache=cache
+    )
+    assert list(configs) == ['schain-a', 'schain-b', 'schain-c']
+    assert configs['schain-a'].id == 0
+    assert configs['schain-a'].schain_base_port == 10000
+    assert configs['schain-b'].id == 1
+    assert configs['schain-b'].schain_base_port == 10001 + PORTS_PER_SCHAIN
+    assert configs['schain-c'].id == 1
+    assert configs['schain-c'].schain_base_port == 10001 + 2 * PORTS_PER_SCHAIN
+    # Node 1 is shared by two chains and fetched once
+    assert skale.reads['node'] == 2
+    assert skale.reads['node_schains'] == 2
+
+    configs = get_chain_node_configs(skale, ['schain-b'], node_id=2, cache=cache)
+    assert configs['schain-b'].id == 2
+    assert configs['schain-b'].schain_base_port == 10002
+
+    # Node id from the single chain mode config is not applied to other chains
+    configs = get_chain_node_configs(skale, ['schain-a', 'schain-b'], node_id=2, cache=cache)
+    assert [configs[name].id for name in configs] == [0, 1]
+
+
+def test_get_chain_node_configs_shared_port(skale, tmp_path):
+    skale.groups = {'schain-x': [5], 'schain-y': [6]}
+    skale.nodes.get = lambda node_id: {'port': 10000}
+    configs = get_chain_node_configs(
+        skale, ['schain-x', 'schain-y'], cache=ConfigDataCache(skale, cache_dir=tmp_path)
+    )
+    assert configs['schain-x'].schain_base_port == 10000
+    assert configs['schain-y'].schain_base_port == 10000 + PORTS_PER_SCHAIN
+
+
+def test_allocate_base_ports():
+    assert allocate_base_ports({'a': 10000, 'b': 10000 + PORTS_PER_SCHAIN}) == {
+        'a': 10000, 'b': 10000 + PORTS_PER_SCHAIN
+    }
+    assert allocate_base_ports({'a': 10000, 'b': 10000 + 2 * PORTS_PER_SCHAIN, 'c': 10010}) == {
+        'a': 10000, 'b': 10000 + 2 * PORTS_PER_SCHAIN, 'c': 10000 + PORTS_PER_SCHAIN
+    }
+    with pytest.raises(PortsAllocationError):
+        allocate_base_ports({'a': 65535 - PORTS_PER_SCHAIN, 'b': 65535 - PORTS_PER_SCHAIN})
+
+
+def test_chain_node_config(tmp_path):
+    filepath = str(tmp_path / 'node_config.json')
+    config = ChainNodeConfig(3, 10192, filepath=filepath)
+    config.name = 'node-3'
+    assert config.all() == {'name': 'node-3', 'node_id': 3, 'schain_base_port': 10192}
+    config.schain_base_port = 10000
+    assert config.schain_base_port == 10000
+    assert ChainNodeConfig(4, 10064, filepath=filepath).id == 4
+
+
+def test_chain_scheduler():
+    scheduler = ChainScheduler(
+        ['schain-a', 'schain-b', 'schain-c'], interval=90, retry_interval=10, now=0
+    )
+    assert scheduler.pop_due(now=0) == ['schain-a']
+    assert scheduler.next_delay(now=0) == 30
+    assert scheduler.pop_due(now=60) == ['schain-b', 'schain-c']
+
+    scheduler.reschedule('schain-a', now=60)
+    scheduler.reschedule('schain-b', success=False, now=60)
+    scheduler.reschedule('schain-c', now=61)
+    assert scheduler.next_delay(now=60) == 10
+    assert scheduler.pop_due(now=70) == ['schain-b']
+    assert scheduler.pop_due(now=151) == ['schain-a', 'schain-c']
+    assert scheduler.next_delay(now=151) == 90
@@ -0,0 +1,39 @@
+import pytest
+
+from core.schains import zygote
+from core.schains.firewall import iptables
+from core.schains.zygote import get_shared_locks, get_zygote_context, set_shared_locks
+from tools.docker_utils import DockerUtils
+
+
+@pytest.fixture
+def shared_locks(monkeypatch):
+    monkeypatch.setattr(iptables, 'plock', iptables.plock)
+    monkeypatch.setattr(DockerUtils, 'docker_lock', DockerUtils.docker_lock)
+    monkeypatch.setattr(zygote, '_shared_locks', {})
+    return get_shared_locks()
+
+
+def try_acquire(locks, queue):
+    set_shared_locks(locks)
+    acquired = iptables.plock.acquire(timeout=0.1)
+    queue.put(acquired)
+
+
+def test_zygote_shared_locks(shared_locks):
+    assert iptables.plock is shared_locks['iptables']
+    assert DockerUtils.docker_lock is shared_locks['docker']
+    assert get_shared_locks() is shared_locks
+
+    ctx = get_zygote_context()
+    queue = ctx.Queue()
+    with iptables.plock:
+        process = ctx.Process(target=try_acquire, args=(get_shared_locks(), queue))
+        process.start()
+        assert queue.get(timeout=60) is False
+        process.join()
+
+    process = ctx.Process(target=try_acquire, args=(get_shared_locks(), queue))
+    process.start()
+    assert queue.get(timeout=60) is True
+    process.join()
@@ -0,0 +1,84 @@
+import os
+import time
+
+import mock
+import pytest
+
+from core.startup import (
+    InitManifest,
+    StartupProfiler,
+    get_inputs_hash,
+    run_cached_step,
+    run_steps_concurrently
+)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return InitManifest(os.path.join(tmp_path, 'init_manifest.json'))
+
+
+@pytest.fixture
+def profiler():
+    return StartupProfiler(start_ts=time.time())
+
+
+def test_get_inputs_hash():
+    assert get_inputs_hash(1, 'ip', ['template']) == get_inputs_hash(1, 'ip', ['template'])
+    assert get_inputs_hash(1, 'ip', ['template']) != get_inputs_hash(1, 'ip', ['changed'])
+
+
+def test_run_cached_step(manifest, profiler):
+    func = mock.Mock()
+    assert run_cached_step('monitoring', 'a', func, manifest=manifest, profiler=profiler)
+    assert not run_cached_step('monitoring', 'a', func, manifest=manifest, profiler=profiler)
+    assert func.call_count == 1
+    assert profiler.skipped == ['monitoring']
+
+    assert run_cached_step('monitoring', 'b', func, manifest=manifest, profiler=profiler)
+    assert run_cached_step(
+        'monitoring', 'b', func,
+        outputs_present=lambda: False, manifest=manifest, profiler=profiler
+    )
+    assert func.call_count == 3
+    assert manifest.read()['steps'] == {'monitoring': 'b'}
+
+
+def test_run_cached_step_failed(manifest, profiler):
+    with pytest.raises(ValueError):
+        run_cached_step(
+            'monitoring', 'a', mock.Mock(side_effect=ValueError),
+            manifest=manifest, profiler=profiler
+        )
+    assert not manifest.is_current('monitoring', 'a')
+
+
+def test_run_steps_concurrently(profiler):
+    start = time.monotonic()
+    run_steps_concurrently({
+        'first': lambda: time.sleep(0.5),
+        'second': lambda: time.sleep(0.5)
+    }, profiler=profiler)
+    assert time.monotonic() - start < 0.9
+    assert set(profiler.steps) == {'first', 'second'}
+
+    with pytest.raises(ValueError):
+        run_steps_concurrently({
+            'ok': lambda: None,
+            'failed': mock.Mock(side_effect=ValueError)
+        }, profiler=profiler)
+
+
+def test_mark_first_monitored(manifest):
+    profiler = StartupProfiler(start_ts=time.time() - 10)
+    with profiler.step('db'):
+        pass
+    profiler.mark_first_monitored(manifest=manifest)
+    first = profiler.first_monitored
+    assert 10 <= first < 11
+    profiler.mark_first_monitored(manifest=manifest)
+    assert profiler.first_monitored == first
+
+    profile = manifest.read()['profile']['last']
+    assert profile['time_to_first_monitored'] == first
+    assert list(profile['steps']) == ['db']
@@ -206,11 +206,11 @@ class HostTestFirewallController(IHostFirewallController):
     def __init__(self):
         self._rules = set()
 
-    def add_rule(self, srule):
+    def add_rule(self, srule, check=True):
         self._rules.add(srule)
 
-    def remove_rule(self, srule):
-        if self.has_rule(srule):
+    def remove_rule(self, srule, check=True):
+        if not check or self.has_rule(srule):
             self._rules.remove(srule)
 
     @property
@@ -47,6 +47,13 @@ SSL_CRT_NAME = 'ssl_cert'
 SSL_KEY_PATH = os.path.join(SSL_CERTIFICATES_FILEPATH, SSL_KEY_NAME)
 SSL_CERT_PATH = os.path.join(SSL_CERTIFICATES_FILEPATH, SSL_CRT_NAME)
 
+SSL_ROLLOUT_FILENAME = 'ssl_rollout.json'
+SSL_ROLLOUT_FILEPATH = os.path.join(NODE_DATA_PATH, SSL_ROLLOUT_FILENAME)
+# Number of chains recreated with the new certificate at the same time
+SSL_ROLLOUT_WAVE_SIZE = int(os.getenv('SSL_ROLLOUT_WAVE_SIZE', 2))
+# Chains that are not healthy after this time (seconds) halt the rollout
+SSL_ROLLOUT_WAVE_TIMEOUT = int(os.getenv('SSL_ROLLOUT_WAVE_TIMEOUT', 1800))
+
 BACKUP_RUN = os.getenv('BACKUP_RUN', False)
 SGX_SERVER_URL = os.environ.get('SGX_SERVER_URL')
 
@@ -103,6 +110,22 @@ CHANGE_IP_DELAY = 300
 
 STATSD_HOST = '127.0.0.1'
 STATSD_PORT = 8125
+# Ethernet MTU without IP and UDP headers
+STATSD_MAX_UDP_SIZE = int(os.getenv('STATSD_MAX_UDP_SIZE', 1472))
+METRICS_DIR_PATH = os.path.join(NODE_DATA_PATH, 'metrics')
 SYNC_NODE = os.getenv('SYNC_NODE') == 'True'
+# Seconds between process manager runs for each chain of the sync node
+SYNC_NODE_MONITOR_INTERVAL = int(os.getenv('SYNC_NODE_MONITOR_INTERVAL', 180))
+SYNC_NODE_RETRY_INTERVAL = int(os.getenv('SYNC_NODE_RETRY_INTERVAL', 30))
 
 DOCKER_NODE_CONFIG_FILEPATH = os.path.join(NODE_DATA_PATH, 'docker.json')
+
+VALIDATOR_NODES_CONNECT_TIMEOUT = float(os.getenv('VALIDATOR_NODES_CONNECT_TIMEOUT', 1))
+# Whole scan of validator nodes is cut at this deadline (seconds)
+VALIDATOR_NODES_SCAN_DEADLINE = float(os.getenv('VALIDATOR_NODES_SCAN_DEADLINE', 3))
+VALIDATOR_NODES_SCAN_CONCURRENCY = int(os.getenv('VALIDATOR_NODES_SCAN_CONCURRENCY', 64))
+VALIDATOR_NODES_READ_WORKERS = int(os.getenv('VALIDATOR_NODES_READ_WORKERS', 8))
+VALIDATOR_NODES_CACHE_TTL = int(os.getenv('VALIDATOR_NODES_CACHE_TTL', 30))
+
+INIT_MANIFEST_FILENAME = 'init_manifest.json'
+INIT_MANIFEST_FILEPATH = os.path.join(NODE_DATA_PATH, INIT_MANIFEST_FILENAME)
@@ -18,7 +18,7 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-from tools.configs import CONFIG_FOLDER
+from tools.configs import CONFIG_FOLDER, NODE_DATA_PATH
 from tools.helper import read_json
 
 DATA_DIR_CONTAINER_PATH = '/data_dir'
@@ -57,3 +57,8 @@ MAX_SCHAIN_RESTART_COUNT = int(os.getenv('MAX_SCHAIN_RESTART_COUNT', 5))
 CONTAINER_LOGS_SEPARATOR = b'=' * 80 + b'\n'
 
 HISTORIC_STATE_IMAGE_POSTFIX = '-historic'
+
+IMAGE_PREFETCH_STATE_PATH = os.path.join(NODE_DATA_PATH, 'image_prefetch.json')
+IMAGE_PREFETCH_WORKERS = int(os.getenv('IMAGE_PREFETCH_WORKERS', 1))
+# Failed pull is retried not earlier than this interval (seconds)
+IMAGE_PREFETCH_RETRY_INTERVAL = int(os.getenv('IMAGE_PREFETCH_RETRY_INTERVAL', 600))
@@ -32,6 +32,8 @@ IMA_NETWORK_BROWSER_FILEPATH = os.path.join(SCHAIN_CONFIG_DIR_SKALED, IMA_NETWOR
 
 SCHAIN_IMA_ABI_FILENAME = 'schain_ima_abi.json'
 SCHAIN_IMA_ABI_FILEPATH = os.path.join(CONTRACTS_INFO_FOLDER, SCHAIN_IMA_ABI_FILENAME)
+# ima_predeployed version and content hash of the generated sChain IMA ABI
+SCHAIN_IMA_ABI_META_FILEPATH = f'{SCHAIN_IMA_ABI_FILEPATH}.meta'
 
 IMA_STATE_PATH = 'ima_state.json'
 IMA_STATE_CONTAINER_PATH = os.path.join(SCHAIN_CONFIG_DIR_SKALED, IMA_STATE_PATH)
@@ -89,3 +91,7 @@ MAINNET_IMA_CONTRACTS = {
 }
 
 DEFAULT_TIME_FRAME = 1800  # 30 min
+
+IMA_HEALTHCHECK_TIMEOUT = int(os.getenv('IMA_HEALTHCHECK_TIMEOUT', 5))
+IMA_HEALTHCHECK_DEADLINE = int(os.getenv('IMA_HEALTHCHECK_DEADLINE', 10))
+IMA_HEALTH_CACHE_TTL = int(os.getenv('IMA_HEALTH_CACHE_TTL', 30))
@@ -49,3 +49,13 @@ LOG_BACKUP_COUNT = 20
 
 ADMIN_LOG_FORMAT = '[%(asctime)s %(levelname)s][%(process)d][%(processName)s][%(threadName)s] - %(name)s:%(lineno)d - %(message)s'  # noqa
 API_LOG_FORMAT = '[%(asctime)s] %(process)d %(levelname)s %(url)s %(module)s: %(message)s'  # noqa
+
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+# How long WARNING and higher records wait for free space in the full queue
+LOG_QUEUE_BLOCK_TIMEOUT = float(os.getenv('LOG_QUEUE_BLOCK_TIMEOUT', 1))
+
+REMOVED_CONTAINERS_MANIFEST_FILENAME = '.manifest.json'
+# Total size of compressed removed containers logs to keep
+REMOVED_CONTAINERS_LOGS_MAX_BYTES = int(
+    os.getenv('REMOVED_CONTAINERS_LOGS_MAX_BYTES', 2 * 1024 ** 3)
+)
@@ -56,3 +56,55 @@ RPC_CHECK_TIMEOUT_STEP = 10
 MAX_CONSENSUS_STORAGE_INF_VALUE = 1000000000000000000
 
 DKG_TIMEOUT_COEFFICIENT = 2.2
+
+FIREWALL_REPORT_FILENAME = 'firewall_report.json'
+FIREWALL_REPORT_FILEPATH = os.path.join(NODE_DATA_PATH, FIREWALL_REPORT_FILENAME)
+FIREWALL_REPORT_MAX_AGE = int(os.getenv('FIREWALL_REPORT_MAX_AGE', 600))
+
+HEARTBEAT_TABLE_FILENAME = 'heartbeat.table'
+HEARTBEAT_TABLE_FILEPATH = os.path.join(NODE_DATA_PATH, HEARTBEAT_TABLE_FILENAME)
+HEARTBEAT_TABLE_SLOTS = int(os.getenv('HEARTBEAT_TABLE_SLOTS', 256))
+
+MONITOR_ZYGOTE = os.getenv('MONITOR_ZYGOTE') == 'True'
+
+CLEANER_WORKERS = int(os.getenv('CLEANER_WORKERS', 4))
+
+CONFIG_CACHE_DIR_NAME = 'config_cache'
+CONFIG_CACHE_DIR_PATH = os.path.join(NODE_DATA_PATH, CONFIG_CACHE_DIR_NAME)
+# Contract data fetched at head block N is reused while head <= N + age,
+# default covers one process manager cycle
+CONFIG_CACHE_MAX_BLOCK_AGE = int(os.getenv('CONFIG_CACHE_MAX_BLOCK_AGE', 15))
+# Minimal time between mainnet blocks (slot time), bounds the head advance
+CONFIG_CACHE_BLOCK_TIME = int(os.getenv('CONFIG_CACHE_BLOCK_TIME', 12))
+
+CHECK_HISTORY_FILENAME = 'checks_history.bin'
+CHECK_HISTORY_CAPACITY = int(os.getenv('CHECK_HISTORY_CAPACITY', 4096))
+# Default window for check history summaries (seconds)
+CHECK_HISTORY_WINDOW = int(os.getenv('CHECK_HISTORY_WINDOW', 3600))
+SKALED_FLAPPING_THRESHOLD = int(os.getenv('SKALED_FLAPPING_THRESHOLD', 4))
+# While rpc or blocks checks flap, failed rpc restarts skaled only after this time (seconds)
+SKALED_FLAPPING_HOLD_TIME = int(os.getenv('SKALED_FLAPPING_HOLD_TIME', 600))
+
+MONITOR_ADAPTIVE_CADENCE = os.getenv('MONITOR_ADAPTIVE_CADENCE', 'True') == 'True'
+MONITOR_CADENCE_MIN = int(os.getenv('MONITOR_CADENCE_MIN', 10))
+MONITOR_CADENCE_MAX = int(os.getenv('MONITOR_CADENCE_MAX', 160))
+# Interval doubles after each step of uninterrupted healthy checks (seconds)
+MONITOR_CADENCE_BACKOFF_STEP = int(os.getenv('MONITOR_CADENCE_BACKOFF_STEP', 600))
+MONITOR_CADENCE_JITTER = float(os.getenv('MONITOR_CADENCE_JITTER', 0.2))
+MONITOR_START_JITTER = int(os.getenv('MONITOR_START_JITTER', 10))
+# Checks are run at the minimal interval around skaled exit time (seconds)
+MONITOR_CADENCE_EXIT_WINDOW = int(os.getenv('MONITOR_CADENCE_EXIT_WINDOW', 1800))
+# Node-wide limit of concurrently running pipelines, 0 disables it
+MONITOR_PIPELINE_SLOTS = int(os.getenv('MONITOR_PIPELINE_SLOTS', 0))
+# Slot is given back after this time even if the pipeline is still running (seconds)
+MONITOR_PIPELINE_SLOT_HOLD_MAX = int(os.getenv('MONITOR_PIPELINE_SLOT_HOLD_MAX', 300))
+MONITOR_PIPELINE_SLOTS_DIR = os.path.join(NODE_DATA_PATH, 'pipeline_slots')
+
+LEAVING_HISTORY_DIR_PATH = os.path.join(NODE_DATA_PATH, 'leaving_history')
+# Entries finished earlier than this (seconds) are not checked on contracts anymore
+LEAVING_HISTORY_FINISH_MARGIN = int(os.getenv('LEAVING_HISTORY_FINISH_MARGIN', 600))
+LEAVING_HISTORY_WORKERS = int(os.getenv('LEAVING_HISTORY_WORKERS', 4))
+
+# Concurrent config regenerations when node stream version changes
+CONFIG_UPGRADE_WORKERS = int(os.getenv('CONFIG_UPGRADE_WORKERS', 8))
+CONFIG_UPGRADE_REPORT_FILEPATH = os.path.join(NODE_DATA_PATH, 'config_upgrade.json')
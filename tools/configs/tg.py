@@ -25,3 +25,11 @@ TG_CHAT_ID = os.getenv('TG_CHAT_ID', None)
 CHECKS_STATE_EXPIRATION = int(
     os.getenv('CHECKS_STATE_EXPIRATION', 24 * 60 * 60)
 )
+
+# Events are collected for this long before a digest is composed
+NOTIFICATIONS_WINDOW = int(os.getenv('NOTIFICATIONS_WINDOW', 15))
+# Each channel gets at most NOTIFICATIONS_CHANNEL_RATE messages per period
+NOTIFICATIONS_CHANNEL_RATE = int(os.getenv('NOTIFICATIONS_CHANNEL_RATE', 4))
+NOTIFICATIONS_CHANNEL_PERIOD = int(os.getenv('NOTIFICATIONS_CHANNEL_PERIOD', 60))
+NOTIFICATIONS_QUEUE_MAX_SIZE = int(os.getenv('NOTIFICATIONS_QUEUE_MAX_SIZE', 1000))
+NOTIFICATIONS_DIGEST_MAX_ITEMS = int(os.getenv('NOTIFICATIONS_DIGEST_MAX_ITEMS', 20))
@@ -25,6 +25,11 @@ from tools.configs import (
 from tools.configs import NODE_DATA_PATH
 
 ENDPOINT = os.environ['ENDPOINT']
+# Comma separated list of mainnet endpoints, ENDPOINT is always the first one
+ENDPOINTS = [ENDPOINT] + [
+    endpoint.strip() for endpoint in os.getenv('EXTRA_ENDPOINTS', '').split(',')
+    if endpoint.strip() and endpoint.strip() != ENDPOINT
+]
 
 UNTRUSTED_PROVIDERS = ["infura.io", "gateway.pokt.network"]
 ABI_FILEPATH = os.getenv('ABI_FILEPATH') or \
@@ -37,3 +42,11 @@ STATE_FILEPATH = None if not STATE_FILENAME \
 NODE_REGISTER_CONFIRMATION_BLOCKS = 5
 
 ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
+RPC_PROVIDER_TIMEOUT = int(os.getenv('RPC_PROVIDER_TIMEOUT', 30))
+RPC_EWMA_ALPHA = 0.2
+# Read is hedged after max(min delay, factor * EWMA latency of the endpoint)
+RPC_HEDGE_MIN_DELAY = float(os.getenv('RPC_HEDGE_MIN_DELAY', 0.5))
+RPC_HEDGE_LATENCY_FACTOR = float(os.getenv('RPC_HEDGE_LATENCY_FACTOR', 3))
+RPC_UNHEALTHY_ERROR_RATE = 0.5
+RPC_MAX_BLOCK_LAG = int(os.getenv('RPC_MAX_BLOCK_LAG', 5))
@@ -21,7 +21,6 @@ import io
 import itertools
 import logging
 import multiprocessing
-import os
 import re
 import time
 from datetime import datetime
@@ -46,8 +45,8 @@ from tools.configs.containers import (
     RUNNING_STATUS,
     CONTAINER_LOGS_SEPARATOR
 )
-from tools.configs.logs import REMOVED_CONTAINERS_FOLDER_PATH
 from tools.helper import read_json
+from tools.logs_backup import LogsBackupManifest, write_logs_backup
 
 
 logger = logging.getLogger(__name__)
@@ -88,6 +87,7 @@ def get_docker_group_id() -> int:
 
 
 class DockerUtils:
+    # Replaced with a forkserver lock by core.schains.zygote in zygote mode
     docker_lock = multiprocessing.Lock()
 
     def __init__(
@@ -300,16 +300,14 @@ class DockerUtils:
         log_filepath: str,
         head: int = DOCKER_DEFAULT_HEAD_LINES,
         tail: int = DOCKER_DEFAULT_TAIL_LINES
-    ) -> None:
-        head_lines, tail_lines = DockerUtils.get_container_logs(
-            container=container,
+    ) -> int:
+        """ Streams container logs into gzip compressed file, returns file size """
+        return write_logs_backup(
+            log_filepath,
+            container.logs(stream=True, follow=False),
             head=head,
             tail=tail
         )
-        with open(log_filepath, 'wb') as out:
-            out.write(head_lines)
-            out.write(CONTAINER_LOGS_SEPARATOR)
-            out.write(tail_lines)
 
     def backup_container_logs(
         self,
@@ -318,23 +316,22 @@ class DockerUtils:
         tail: int = DOCKER_DEFAULT_TAIL_LINES
     ) -> None:
         logger.info(f'Going to backup container logs: {container.name}')
-        logs_backup_filepath = self.get_logs_backup_filepath(container)
-        DockerUtils.save_container_logs(
+        manifest = LogsBackupManifest()
+        logs_backup_filepath = manifest.reserve(container.name)
+        size = DockerUtils.save_container_logs(
             container,
             logs_backup_filepath,
             head=head,
             tail=tail
         )
+        manifest.register(logs_backup_filepath, size)
         logger.info(
             f'Old container logs saved to {logs_backup_filepath}, '
-            f'head {head}, tail: {tail}'
+            f'head {head}, tail: {tail}, size: {size}'
         )
 
     def get_logs_backup_filepath(self, container: Container) -> str:
-        container_index = sum(1 for f in os.listdir(REMOVED_CONTAINERS_FOLDER_PATH)
-                              if f.startswith(f'{container.name}-'))
-        log_file_name = f'{container.name}-{container_index}.log'
-        return os.path.join(REMOVED_CONTAINERS_FOLDER_PATH, log_file_name)
+        return LogsBackupManifest().next_backup_path(container.name)
 
     def restart(
         self,
@@ -381,9 +378,12 @@ class DockerUtils:
         for container in containers:
             self.restart(container.name, timeout=timeout)
 
-    def pull(self, name: str) -> None:
+    def pull(self, name: str, lock: bool = True) -> None:
+        repo, tag = name.split(':')
+        if not lock:
+            self.client.images.pull(repository=repo, tag=tag)
+            return
         with DockerUtils.docker_lock:
-            repo, tag = name.split(':')
             self.client.images.pull(repository=repo, tag=tag)
 
     def pulled(self, name: str) -> bool:
@@ -23,6 +23,7 @@ import json
 import logging
 import psutil
 import subprocess
+import threading
 import time
 from subprocess import PIPE
 
@@ -35,6 +36,7 @@ from skale.wallets import BaseWallet
 
 from tools.configs import INIT_LOCK_PATH
 from tools.configs.web3 import ENDPOINT, ABI_FILEPATH, STATE_FILEPATH, ZERO_ADDRESS
+from tools.rpc_router import route_web3
 
 
 logger = logging.getLogger(__name__)
@@ -66,6 +68,18 @@ def write_json(path, content):
         json.dump(content, outfile, indent=4)
 
 
+def write_json_atomic(path, content):
+    """ Readers see either the old or the new content, concurrent writers don't share tmp files """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        write_json(tmp_path, content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def init_file(path, content=None):
     if not os.path.exists(path):
         write_json(path, content)
@@ -132,7 +146,9 @@ def wait_until_admin_inited():
 
 
 def init_skale(wallet: BaseWallet) -> Skale:
-    return Skale(ENDPOINT, ABI_FILEPATH, wallet, state_path=STATE_FILEPATH)
+    skale = Skale(ENDPOINT, ABI_FILEPATH, wallet, state_path=STATE_FILEPATH)
+    route_web3(skale.web3)
+    return skale
 
 
 def safe_load_yml(filepath):
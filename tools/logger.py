@@ -17,11 +17,18 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
 import logging
+import multiprocessing
+import os
+import queue
 import re
 import sys
+from collections import Counter
+from contextlib import contextmanager
 from logging import StreamHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Iterator, Optional
 from urllib.parse import urlparse
 
 from flask import has_request_context, request
@@ -34,7 +41,9 @@ from tools.configs.logs import (
     SYNC_LOG_PATH,
     DEBUG_LOG_PATH,
     LOG_FILE_SIZE_BYTES,
-    LOG_BACKUP_COUNT
+    LOG_BACKUP_COUNT,
+    LOG_QUEUE_BLOCK_TIMEOUT,
+    LOG_QUEUE_SIZE
 )
 from tools.configs.web3 import ENDPOINT
 
@@ -49,38 +58,168 @@ def compose_hiding_patterns():
     }
 
 
+def get_request_url() -> Optional[str]:
+    if has_request_context():
+        return request.full_path[:-1]
+    return None
+
+
 class RequestFormatter(logging.Formatter):
     def format(self, record):
-        if not isinstance(record, str):
-            if has_request_context():
-                record.url = request.full_path[:-1]
-            else:
-                record.url = None
+        if not isinstance(record, str) and not hasattr(record, 'url'):
+            record.url = get_request_url()
         return super().format(record)
 
 
 class HidingFormatter(RequestFormatter):
+    """
+    Hides sensitive data using single precompiled alternation of all patterns.
+    Result is cached on the record, so handlers sharing the formatter
+    format and scrub each record only once.
+    """
+
     def __init__(self, log_format: str, patterns: dict) -> None:
         super().__init__(log_format)
         self._patterns: dict = patterns
+        self._replacements = list(patterns.values())
+        self._regex = None
+        if patterns:
+            self._regex = re.compile('|'.join(
+                f'(?P<p{i}>{pattern})' for i, pattern in enumerate(patterns)
+            ))
+
+    def _replace(self, match: re.Match) -> str:
+        return self._replacements[int(match.lastgroup[1:])]
 
     def _filter_sensitive(self, msg) -> str:
-        for match, replacement in self._patterns.items():
-            pat = re.compile(match)
-            msg = pat.sub(replacement, msg)
-        return msg
+        if self._regex is None:
+            return msg
+        return self._regex.sub(self._replace, msg)
 
     def format(self, record) -> str:
-        msg = super().format(record)
-        return self._filter_sensitive(msg)
+        cached = record.__dict__.get('_hidden_message')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        msg = self._filter_sensitive(super().format(record))
+        record._hidden_message = (self, msg)
+        return msg
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Puts records to the bounded queue without blocking. If the queue is full
+    records below WARNING are dropped, others wait up to LOG_QUEUE_BLOCK_TIMEOUT.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        block_timeout: float = LOG_QUEUE_BLOCK_TIMEOUT
+    ) -> None:
+        super().__init__(log_queue)
+        self.block_timeout = block_timeout
+        self.dropped: Counter = Counter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is done by the listener, only the state of the caller is captured
+        record.msg = record.getMessage()
+        record.args = None
+        if not hasattr(record, 'url'):
+            record.url = get_request_url()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped[record.levelname] += 1
+
+
+class ReportingQueueListener(QueueListener):
+    """ Writes records to the handlers and reports dropped records """
+
+    def __init__(self, log_queue: queue.Queue, qhandler: DroppingQueueHandler, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.qhandler = qhandler
+        self.reported = 0
+
+    def enqueue_sentinel(self) -> None:
+        # Queue can be full, sentinel should not be dropped
+        self.queue.put(self._sentinel)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        dropped = sum(self.qhandler.dropped.values())
+        if dropped > self.reported:
+            self.reported = dropped
+            super().handle(logging.makeLogRecord({
+                'name': __name__,
+                'levelno': logging.WARNING,
+                'levelname': logging.getLevelName(logging.WARNING),
+                'msg': f'Logging queue is full, dropped records: {dict(self.qhandler.dropped)}'
+            }))
+        super().handle(record)
+
+
+_listener: Optional[ReportingQueueListener] = None
+_listener_pid: Optional[int] = None
+
+
+def get_logging_stats() -> Dict:
+    if _listener is None:
+        return {}
+    return {
+        'queue_size': _listener.queue.qsize(),
+        'dropped': dict(_listener.qhandler.dropped)
+    }
+
+
+def start_listener(handlers: list) -> DroppingQueueHandler:
+    global _listener, _listener_pid
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    qhandler = DroppingQueueHandler(log_queue)
+    _listener = ReportingQueueListener(log_queue, qhandler, *handlers)
+    _listener.start()
+    _listener_pid = os.getpid()
+    return qhandler
+
+
+def stop_listener() -> None:
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+# Flushes the queue on interpreter exit, multiprocessing children use child_listener
+atexit.register(stop_listener)
+
+
+def restart_listener_in_child() -> None:
+    """ Listener thread does not survive fork, child gets its own queue and thread """
+    if _listener is None or _listener_pid == os.getpid():
+        return
+    root = logging.getLogger()
+    old_qhandler = _listener.qhandler
+    qhandler = start_listener(list(_listener.handlers))
+    root.removeHandler(old_qhandler)
+    root.addHandler(qhandler)
 
-    def formatException(self, exc_info) -> str:
-        msg = super().formatException(exc_info)
-        return self._filter_sensitive(msg)
 
-    def formatStack(self, stack_info) -> str:
-        msg = super().formatStack(stack_info)
-        return self._filter_sensitive(msg)
+@contextmanager
+def child_listener() -> Iterator[None]:
+    """
+    Runs the logging listener of a multiprocessing child. Children exit without
+    atexit hooks, so the queue is flushed explicitly. Does nothing in the main process.
+    """
+    if multiprocessing.parent_process() is None:
+        yield
+        return
+    restart_listener_in_child()
+    try:
+        yield
+    finally:
+        stop_listener()
 
 
 def init_logger(
@@ -88,6 +227,9 @@ def init_logger(
     log_file_path=None,
     debug_file_path=None
 ):
+    if logging.getLogger().handlers:
+        # Already configured, same as logging.basicConfig
+        return
     handlers = []
 
     hiding_patterns = compose_hiding_patterns()
@@ -116,7 +258,7 @@ def init_logger(
         f_handler_debug.setLevel(logging.DEBUG)
         handlers.append(f_handler_debug)
 
-    logging.basicConfig(level=logging.DEBUG, handlers=handlers)
+    logging.basicConfig(level=logging.DEBUG, handlers=[start_listener(handlers)])
 
 
 def init_admin_logger():
@@ -0,0 +1,161 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from filelock import FileLock
+
+from tools.configs.containers import CONTAINER_LOGS_SEPARATOR
+from tools.configs.logs import (
+    REMOVED_CONTAINERS_FOLDER_PATH,
+    REMOVED_CONTAINERS_LOGS_MAX_BYTES,
+    REMOVED_CONTAINERS_MANIFEST_FILENAME
+)
+from tools.helper import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+BACKUP_FILENAME_RE = re.compile(r'^(?P<name>.+)-(?P<index>\d+)\.log(?:\.gz)?$')
+
+
+def split_head_tail(lines: Iterable[bytes], head: int, tail: int) -> Tuple[List[bytes], deque]:
+    """
+    Splits log stream into first head lines and last tail lines in one pass.
+    Memory is bounded by head + tail lines regardless of the stream size.
+    As with docker logs tail, short logs appear in both parts.
+    """
+    head_lines: List[bytes] = []
+    tail_lines: deque = deque(maxlen=tail)
+    for line in lines:
+        if len(head_lines) < head:
+            head_lines.append(line)
+        tail_lines.append(line)
+    return head_lines, tail_lines
+
+
+def write_logs_backup(path: str, lines: Iterable[bytes], head: int, tail: int) -> int:
+    """ Writes gzip compressed head and tail of the log stream, returns file size """
+    head_lines, tail_lines = split_head_tail(lines, head, tail)
+    tmp_path = path + '.tmp'
+    with gzip.open(tmp_path, 'wb') as out:
+        out.writelines(head_lines)
+        out.write(CONTAINER_LOGS_SEPARATOR)
+        out.writelines(tail_lines)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+class LogsBackupManifest:
+    """
+    Index of removed containers logs backups. Keeps the next backup index
+    for each container and the list of backups (oldest first) to enforce
+    the total size limit without listing the backups folder.
+    """
+
+    def __init__(
+        self,
+        folder: str = REMOVED_CONTAINERS_FOLDER_PATH,
+        max_bytes: int = REMOVED_CONTAINERS_LOGS_MAX_BYTES
+    ) -> None:
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.filepath = os.path.join(folder, REMOVED_CONTAINERS_MANIFEST_FILENAME)
+        self.lock = FileLock(self.filepath + '.lock')
+
+    def _bootstrap(self) -> Dict:
+        """ Builds manifest from backups created before it was introduced """
+        indexes: Dict[str, int] = {}
+        backups = []
+        for filename in os.listdir(self.folder):
+            match = BACKUP_FILENAME_RE.match(filename)
+            if match is None:
+                continue
+            name, index = match.group('name'), int(match.group('index'))
+            indexes[name] = max(indexes.get(name, 0), index + 1)
+            try:
+                stat = os.stat(os.path.join(self.folder, filename))
+            except FileNotFoundError:
+                continue
+            backups.append({'filename': filename, 'size': stat.st_size, 'ts': stat.st_mtime})
+        backups.sort(key=lambda backup: backup['ts'])
+        return {'indexes': indexes, 'backups': backups}
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.filepath) as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return self._bootstrap()
+        except ValueError:
+            logger.warning('Logs backup manifest is corrupted, rebuilding')
+            return self._bootstrap()
+
+    def _write(self, manifest: Dict) -> None:
+        write_json_atomic(self.filepath, manifest)
+
+    def get_backup_path(self, container_name: str, index: int) -> str:
+        return os.path.join(self.folder, f'{container_name}-{index}.log.gz')
+
+    def next_backup_path(self, container_name: str) -> str:
+        """ Returns path that the next container logs backup will have """
+        with self.lock:
+            index = self._read()['indexes'].get(container_name, 0)
+        return self.get_backup_path(container_name, index)
+
+    def reserve(self, container_name: str) -> str:
+        """ Allocates index for the next container logs backup, returns its path """
+        with self.lock:
+            manifest = self._read()
+            index = manifest['indexes'].get(container_name, 0)
+            manifest['indexes'][container_name] = index + 1
+            self._write(manifest)
+        return self.get_backup_path(container_name, index)
+
+    def register(self, path: str, size: int) -> List[str]:
+        """ Records new backup and removes the oldest ones above the size limit """
+        with self.lock:
+            manifest = self._read()
+            backups = manifest['backups']
+            backups.append({'filename': os.path.basename(path), 'size': size, 'ts': time.time()})
+            removed = self._enforce_retention(backups)
+            self._write(manifest)
+        if removed:
+            logger.info('Removed old container logs backups: %s', removed)
+        return removed
+
+    def _enforce_retention(self, backups: List[Dict]) -> List[str]:
+        removed = []
+        total = sum(backup['size'] for backup in backups)
+        # The newest backup is always kept, even if it exceeds the limit alone
+        while total > self.max_bytes and len(backups) > 1:
+            backup = backups.pop(0)
+            total -= backup['size']
+            try:
+                os.remove(os.path.join(self.folder, backup['filename']))
+            except FileNotFoundError:
+                pass
+            removed.append(backup['filename'])
+        return removed
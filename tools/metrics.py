@@ -0,0 +1,201 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from multiprocessing import current_process
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import statsd
+from statsd.client.udp import Pipeline
+
+from tools.configs import METRICS_DIR_PATH
+
+
+logger = logging.getLogger(__name__)
+
+HISTOGRAM_BUCKETS_MS = (10, 50, 100, 500, 1000, 5000, 10000, 60000, 300000)
+
+# Other process state saved along with the metrics snapshot, e.g. RPC endpoint stats
+_snapshot_sections: Dict[str, Callable[[], Any]] = {}
+
+
+def add_snapshot_section(name: str, getter: Callable[[], Any]) -> None:
+    _snapshot_sections[name] = getter
+
+
+class MetricsAggregator:
+    """
+    In-process aggregation of all sent metrics. Snapshot is saved to
+    METRICS_DIR_PATH so it's available even if statsd is down.
+    """
+
+    def __init__(self, metrics_dir: str = METRICS_DIR_PATH) -> None:
+        self.metrics_dir = metrics_dir
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.timers: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+
+    def incr(self, stat: str, count: int = 1) -> None:
+        with self.lock:
+            self.counters[stat] = self.counters.get(stat, 0) + count
+
+    def gauge(self, stat: str, value: float, delta: bool = False) -> None:
+        with self.lock:
+            if delta:
+                value += self.gauges.get(stat, 0)
+            self.gauges[stat] = value
+
+    def timing(self, stat: str, delta: float) -> None:
+        with self.lock:
+            if stat not in self.timers:
+                self.timers[stat] = {
+                    'count': 0,
+                    'sum': 0,
+                    'min': delta,
+                    'max': delta,
+                    'buckets': [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+                }
+            hist = self.timers[stat]
+            hist['count'] += 1
+            hist['sum'] += delta
+            hist['min'] = min(hist['min'], delta)
+            hist['max'] = max(hist['max'], delta)
+            index = next(
+                (i for i, bound in enumerate(HISTOGRAM_BUCKETS_MS) if delta <= bound),
+                len(HISTOGRAM_BUCKETS_MS)
+            )
+            hist['buckets'][index] += 1
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return {
+                'counters': dict(self.counters),
+                'gauges': dict(self.gauges),
+                'timers': {
+                    stat: {**hist, 'buckets': list(hist['buckets'])}
+                    for stat, hist in self.timers.items()
+                },
+                'buckets_ms': list(HISTOGRAM_BUCKETS_MS)
+            }
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.metrics_dir, f'{current_process().name}.json')
+
+    def save(self) -> None:
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        path = self.path
+        # Pipelines of one chain run in threads of the same process and save concurrently
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        snapshot = self.snapshot()
+        for name, getter in _snapshot_sections.items():
+            section = getter()
+            if section:
+                snapshot[name] = section
+        with open(tmp_path, 'w') as tmp_file:
+            json.dump(snapshot, tmp_file)
+        os.replace(tmp_path, path)
+
+
+class AggregatingMixin:
+    aggregator: MetricsAggregator
+
+    def timing(self, stat, delta, rate=1):
+        if isinstance(delta, timedelta):
+            delta = delta.total_seconds() * 1000.
+        self.aggregator.timing(stat, delta)
+        super().timing(stat, delta, rate)
+
+    def incr(self, stat, count=1, rate=1):
+        self.aggregator.incr(stat, count)
+        super().incr(stat, count, rate)
+
+    def decr(self, stat, count=1, rate=1):
+        self.incr(stat, -count, rate)
+
+    def gauge(self, stat, value, rate=1, delta=False):
+        self.aggregator.gauge(stat, value, delta)
+        super().gauge(stat, value, rate, delta)
+
+
+class StatsClient(AggregatingMixin, statsd.StatsClient):
+    def __init__(self, *args, aggregator: MetricsAggregator, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.aggregator = aggregator
+
+    def pipeline(self) -> 'MetricsBuffer':
+        return MetricsBuffer(self)
+
+
+class MetricsBuffer(AggregatingMixin, Pipeline):
+    """ Keeps metrics of the cycle and sends them in packets of up to maxudpsize """
+
+    def __init__(self, client: StatsClient) -> None:
+        super().__init__(client)
+        self.aggregator = client.aggregator
+
+    def pipeline(self) -> 'MetricsBuffer':
+        return self.__class__(self)
+
+
+_local = threading.local()
+
+
+def get_cycle_buffer() -> Optional[MetricsBuffer]:
+    return getattr(_local, 'buffer', None)
+
+
+@contextmanager
+def metrics_cycle(client: StatsClient) -> Iterator[MetricsBuffer]:
+    """
+    Buffers all metrics sent from the current thread until the end of the cycle.
+    Nested cycles are merged into the outer one.
+    """
+    outer = get_cycle_buffer()
+    if outer is not None:
+        yield outer
+        return
+    _local.buffer = client.pipeline()
+    try:
+        yield _local.buffer
+    finally:
+        buffer, _local.buffer = _local.buffer, None
+        buffer.send()
+        try:
+            client.aggregator.save()
+        except OSError:
+            logger.exception('Failed to save aggregated metrics')
+
+
+def get_aggregated_metrics(metrics_dir: str = METRICS_DIR_PATH) -> Dict[str, Dict]:
+    metrics = {}
+    if not os.path.isdir(metrics_dir):
+        return metrics
+    for filename in sorted(os.listdir(metrics_dir)):
+        if filename.startswith('.tmp.') or not filename.endswith('.json'):
+            continue
+        with open(os.path.join(metrics_dir, filename)) as metrics_file:
+            metrics[filename[:-len('.json')]] = json.load(metrics_file)
+    return metrics
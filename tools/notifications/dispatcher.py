@@ -0,0 +1,214 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, List, Optional
+
+from redis import Redis
+
+from tools.configs.tg import (
+    NOTIFICATIONS_CHANNEL_PERIOD,
+    NOTIFICATIONS_CHANNEL_RATE,
+    NOTIFICATIONS_DIGEST_MAX_ITEMS,
+    NOTIFICATIONS_QUEUE_MAX_SIZE,
+    NOTIFICATIONS_WINDOW
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = 'messages.queue'
+
+# Turns event payload into message lines, None if nothing should be sent
+Handler = Callable[[Dict, Redis], Optional[List[str]]]
+Sender = Callable[[List[str]], None]
+
+
+@dataclass
+class NotificationEvent:
+    channel: str
+    key: str
+    payload: Dict
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'NotificationEvent':
+        return cls(**json.loads(raw))
+
+
+def enqueue_notification(
+    event: NotificationEvent,
+    client: Redis,
+    max_size: int = NOTIFICATIONS_QUEUE_MAX_SIZE
+) -> None:
+    """ Single round trip, the oldest events are dropped when nobody consumes them """
+    pipe = client.pipeline(transaction=False)
+    pipe.rpush(QUEUE_KEY, event.to_json())
+    pipe.ltrim(QUEUE_KEY, -max_size, -1)
+    pipe.execute()
+
+
+def coalesce_events(events: List[NotificationEvent]) -> List[NotificationEvent]:
+    """ Keeps the latest event for each channel and key, ordered by arrival """
+    latest: Dict[tuple, NotificationEvent] = {}
+    for event in events:
+        latest.pop((event.channel, event.key), None)
+        latest[(event.channel, event.key)] = event
+    return list(latest.values())
+
+
+def compose_digest(
+    channel: str,
+    messages: List[List[str]],
+    max_items: int = NOTIFICATIONS_DIGEST_MAX_ITEMS
+) -> List[str]:
+    if len(messages) == 1:
+        return list(messages[0])
+    lines = [f'{len(messages)} {channel} notifications']
+    for message in messages[:max_items]:
+        lines.append('')
+        lines.extend(message)
+    if len(messages) > max_items:
+        lines.append(f'\n... and {len(messages) - max_items} more')
+    return lines
+
+
+class ChannelRateLimiter:
+    """ Sliding window limit of sent messages for each channel """
+
+    def __init__(
+        self,
+        rate: int = NOTIFICATIONS_CHANNEL_RATE,
+        period: int = NOTIFICATIONS_CHANNEL_PERIOD
+    ) -> None:
+        self.rate = rate
+        self.period = period
+        self.sent: Dict[str, Deque[float]] = {}
+
+    def allow(self, channel: str, now: float) -> bool:
+        sent = self.sent.setdefault(channel, deque())
+        while sent and sent[0] <= now - self.period:
+            sent.popleft()
+        return len(sent) < self.rate
+
+    def record(self, channel: str, now: float) -> None:
+        self.sent.setdefault(channel, deque()).append(now)
+
+
+class NotificationDispatcher:
+    """
+    Consumes events pushed by monitors, collects them for a window,
+    and sends a single digest for each channel
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Handler],
+        sender: Sender,
+        client: Redis,
+        window: int = NOTIFICATIONS_WINDOW,
+        limiter: Optional[ChannelRateLimiter] = None,
+        max_items: int = NOTIFICATIONS_DIGEST_MAX_ITEMS,
+        max_pending: int = NOTIFICATIONS_QUEUE_MAX_SIZE
+    ) -> None:
+        self.handlers = handlers
+        self.sender = sender
+        self.client = client
+        self.window = window
+        self.limiter = limiter or ChannelRateLimiter()
+        self.max_items = max_items
+        self.max_pending = max_pending
+        # Messages held back by the rate limit, channel -> key -> message
+        self.pending: Dict[str, Dict[str, List[str]]] = {}
+        self._stop = threading.Event()
+
+    def collect(self) -> List[NotificationEvent]:
+        first = self.client.blpop(QUEUE_KEY, timeout=max(self.window, 1))
+        if first is None:
+            return []
+        self._stop.wait(self.window)
+        pipe = self.client.pipeline()
+        pipe.lrange(QUEUE_KEY, 0, -1)
+        pipe.delete(QUEUE_KEY)
+        rest, _ = pipe.execute()
+        events = []
+        for raw in [first[1], *rest]:
+            try:
+                events.append(NotificationEvent.from_json(raw))
+            except (ValueError, TypeError):
+                logger.warning('Skipping malformed notification event %s', raw)
+        return events
+
+    def process(self, events: List[NotificationEvent], now: Optional[float] = None) -> None:
+        coalesced = coalesce_events(events)
+        logger.debug('Processing %d notification events, %d after coalescing',
+                     len(events), len(coalesced))
+        for event in coalesced:
+            handler = self.handlers.get(event.channel)
+            if handler is None:
+                logger.warning('No handler for notification channel %s', event.channel)
+                continue
+            try:
+                message = handler(event.payload, self.client)
+            except Exception:
+                logger.exception('Handling %s notification for %s failed',
+                                 event.channel, event.key)
+                continue
+            if message:
+                self._add_pending(event.channel, event.key, message)
+        self.flush(now if now is not None else time.monotonic())
+
+    def _add_pending(self, channel: str, key: str, message: List[str]) -> None:
+        pending = self.pending.setdefault(channel, {})
+        pending.pop(key, None)
+        pending[key] = message
+        if len(pending) > self.max_pending:
+            pending.pop(next(iter(pending)))
+
+    def flush(self, now: float) -> None:
+        for channel in list(self.pending):
+            if not self.limiter.allow(channel, now):
+                logger.info('Deferring %d %s notifications, rate limit reached',
+                            len(self.pending[channel]), channel)
+                continue
+            messages = list(self.pending.pop(channel).values())
+            digest = compose_digest(channel, messages, max_items=self.max_items)
+            self.limiter.record(channel, now)
+            logger.info('Sending %s digest with %d notifications', channel, len(messages))
+            try:
+                self.sender(digest)
+            except Exception:
+                logger.exception('Sending %s digest failed', channel)
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.process(self.collect())
+            except Exception:
+                logger.exception('Notification dispatcher cycle failed')
+                self._stop.wait(self.window)
+
+    def stop(self) -> None:
+        self._stop.set()
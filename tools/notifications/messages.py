@@ -19,6 +19,7 @@
 
 
 import logging
+import threading
 import time
 from datetime import datetime
 from functools import wraps
@@ -27,6 +28,11 @@ from typing import Dict, List, Optional
 from redis import BlockingConnectionPool, Redis
 
 from tools.configs.tg import CHECKS_STATE_EXPIRATION, TG_API_KEY, TG_CHAT_ID
+from tools.notifications.dispatcher import (
+    NotificationDispatcher,
+    NotificationEvent,
+    enqueue_notification
+)
 from tools.notifications.tasks import send_message_to_telegram
 
 
@@ -111,6 +117,20 @@ def notify_checks(
     *,
     client: Optional[Redis] = None
 ) -> None:
+    payload = {'schain_name': schain_name, 'node': node, 'checks': checks}
+    enqueue_notification(
+        NotificationEvent('checks', schain_name, payload),
+        client=client or redis_client
+    )
+
+
+def process_checks_notification(
+    schain_name: str,
+    node: Dict,
+    checks: Dict,
+    *,
+    client: Optional[Redis] = None
+) -> Optional[List[str]]:
     client = client or redis_client
     count_key = f'messages.checks.{schain_name}.count'
     state_key = f'messages.checks.{schain_name}.state'
@@ -123,12 +143,12 @@ def notify_checks(
 
     success = is_checks_passed(checks)
 
+    message = None
     if saved_state != state or (
         success and count < SUCCESS_MAX_ATTEMPS or
             not success and count < FAILED_MAX_ATTEMPS):
         message = compose_checks_message(schain_name, node, checks)
-        logger.info(f'Sending checks notification with state {state}')
-        send_message(message)
+        logger.info(f'Composed checks notification with state {state}')
 
     if saved_state != state:
         count = 1
@@ -142,6 +162,7 @@ def notify_checks(
         count += 1
         logger.info(f'Saving new checks count {count}')
         client.set(count_key, count)
+    return message
 
 
 def compose_balance_message(
@@ -169,6 +190,24 @@ def notify_balance(
     *,
     client: Optional[Redis] = None
 ) -> None:
+    payload = {
+        'node_info': node_info,
+        'balance': balance,
+        'required_balance': required_balance
+    }
+    enqueue_notification(
+        NotificationEvent('balance', 'node', payload),
+        client=client or redis_client
+    )
+
+
+def process_balance_notification(
+    node_info: Dict,
+    balance: float,
+    required_balance: float,
+    *,
+    client: Optional[Redis] = None
+) -> Optional[List[str]]:
     client = client or redis_client
     count_key = 'messages.balance.count'
     state_key = 'messages.balance.state'
@@ -177,17 +216,18 @@ def notify_balance(
     state = int(balance > required_balance)
     success = balance > required_balance
 
+    message = None
     if saved_state != state or (
         success and count < SUCCESS_MAX_ATTEMPS or
         not success and count < FAILED_MAX_ATTEMPS
     ):
         message = compose_balance_message(node_info, balance, required_balance)
-        logger.info(f'Sending balance notificaton {state}')
-        send_message(message)
+        logger.info(f'Composed balance notificaton {state}')
 
     count = 1 if saved_state != state else count + 1
     logger.info(f'Saving new balance state {count} {state}')
     client.mset({count_key: count, state_key: str(state)})
+    return message
 
 
 def compose_repair_mode_notification(
@@ -204,10 +244,20 @@ def compose_repair_mode_notification(
 
 
 @notifications_enabled
-def notify_repair_mode(node_info: Dict, schain_name: str) -> None:
-    message = compose_repair_mode_notification(node_info, schain_name)
-    logger.info('Sending repair mode notification')
-    send_message(message)
+def notify_repair_mode(
+    node_info: Dict,
+    schain_name: str,
+    *,
+    client: Optional[Redis] = None
+) -> None:
+    logger.info('Queueing repair mode notification')
+    enqueue_notification(
+        NotificationEvent('repair_mode', schain_name, {
+            'node_info': node_info,
+            'schain_name': schain_name
+        }),
+        client=client or redis_client
+    )
 
 
 def send_message(message: List, api_key: str = TG_API_KEY,
@@ -218,3 +268,34 @@ def send_message(message: List, api_key: str = TG_API_KEY,
     ])
     plain_message = '\n'.join(message)
     return send_message_to_telegram.delay(api_key, chat_id, plain_message)
+
+
+NOTIFICATION_HANDLERS = {
+    'checks': lambda payload, client: process_checks_notification(**payload, client=client),
+    'balance': lambda payload, client: process_balance_notification(**payload, client=client),
+    'repair_mode': lambda payload, client: compose_repair_mode_notification(**payload)
+}
+
+_dispatcher_thread: Optional[threading.Thread] = None
+
+
+def start_notification_dispatcher(
+    client: Optional[Redis] = None
+) -> Optional[threading.Thread]:
+    """ Delivers queued notifications in the background of the calling process """
+    global _dispatcher_thread
+    if not tg_notifications_enabled():
+        return None
+    if _dispatcher_thread is None or not _dispatcher_thread.is_alive():
+        dispatcher = NotificationDispatcher(
+            handlers=NOTIFICATION_HANDLERS,
+            sender=send_message,
+            client=client or redis_client
+        )
+        _dispatcher_thread = threading.Thread(
+            target=dispatcher.run,
+            name='notification-dispatcher',
+            daemon=True
+        )
+        _dispatcher_thread.start()
+    return _dispatcher_thread
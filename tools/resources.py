@@ -1,15 +1,22 @@
+from functools import wraps
+
 import redis
-import statsd
 
 from peewee import SqliteDatabase
 
 from tools.configs.db import DB_FILE, DB_PRAGMAS, REDIS_URI
-from tools.configs import STATSD_HOST, STATSD_PORT
+from tools.configs import STATSD_HOST, STATSD_MAX_UDP_SIZE, STATSD_PORT
+from tools.metrics import get_cycle_buffer, metrics_cycle, MetricsAggregator, StatsClient
 
 db = SqliteDatabase(DB_FILE, DB_PRAGMAS)
 cpool: redis.ConnectionPool = redis.ConnectionPool.from_url(REDIS_URI)
 rs: redis.Redis = redis.Redis(connection_pool=cpool)
-statsd_client = statsd.StatsClient(STATSD_HOST, STATSD_PORT)
+statsd_client = StatsClient(
+    STATSD_HOST,
+    STATSD_PORT,
+    maxudpsize=STATSD_MAX_UDP_SIZE,
+    aggregator=MetricsAggregator()
+)
 
 
 def get_database():
@@ -17,4 +24,13 @@ def get_database():
 
 
 def get_statsd_client():
-    return statsd_client
+    return get_cycle_buffer() or statsd_client
+
+
+def metrics_cycled(func):
+    """ Buffers metrics sent during the call and flushes them in batches """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with metrics_cycle(statsd_client):
+            return func(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,387 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE Admin
+#
+#   Copyright (C) 2024-Present SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from skale.utils.web3_utils import get_provider
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from tools.configs import METRICS_DIR_PATH
+from tools.configs.web3 import (
+    ENDPOINTS,
+    RPC_EWMA_ALPHA,
+    RPC_HEDGE_LATENCY_FACTOR,
+    RPC_HEDGE_MIN_DELAY,
+    RPC_MAX_BLOCK_LAG,
+    RPC_PROVIDER_TIMEOUT,
+    RPC_UNHEALTHY_ERROR_RATE
+)
+from tools.metrics import add_snapshot_section, get_aggregated_metrics
+from tools.resources import get_statsd_client
+
+logger = logging.getLogger(__name__)
+
+# Requests that must reach the node that accepted the transaction
+STICKY_METHODS = frozenset({
+    'eth_sendRawTransaction',
+    'eth_sendTransaction',
+    'eth_getTransactionCount',
+    'eth_getTransactionReceipt',
+    'eth_getTransactionByHash'
+})
+# Position of the block identifier in params, rewritten for pinned block reads
+BLOCK_PARAM_INDEX = {
+    'eth_call': 1,
+    'eth_getBalance': 1,
+    'eth_getCode': 1,
+    'eth_getStorageAt': 2
+}
+
+
+class NoEndpointsError(Exception):
+    pass
+
+
+def get_endpoint_label(endpoint: str) -> str:
+    """ Endpoint name without path and credentials, safe for logs and metrics """
+    parsed = urlparse(endpoint)
+    return f'{parsed.hostname}:{parsed.port}' if parsed.port else str(parsed.hostname)
+
+
+@dataclass
+class EndpointStats:
+    endpoint: str
+    provider: BaseProvider
+    latency: Optional[float] = None  # EWMA seconds
+    error_rate: float = 0  # EWMA of failed requests share
+    requests: int = 0
+    errors: int = 0
+    hedged: int = 0
+    head: Optional[int] = None
+    last_error: Optional[str] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def label(self) -> str:
+        return get_endpoint_label(self.endpoint)
+
+    def record_success(self, latency: float, alpha: float = RPC_EWMA_ALPHA) -> None:
+        with self.lock:
+            self.requests += 1
+            self.latency = latency if self.latency is None else \
+                alpha * latency + (1 - alpha) * self.latency
+            self.error_rate = (1 - alpha) * self.error_rate
+
+    def record_error(self, err: Exception, alpha: float = RPC_EWMA_ALPHA) -> None:
+        with self.lock:
+            self.requests += 1
+            self.errors += 1
+            self.error_rate = alpha + (1 - alpha) * self.error_rate
+            self.last_error = repr(err)
+
+    def score(self) -> float:
+        """ Lower is better, endpoints without measurements are tried first """
+        return (self.latency or 0) * (1 + 10 * self.error_rate)
+
+    def to_dict(self) -> Dict:
+        return {
+            'endpoint': self.label,
+            'latency': self.latency,
+            'error_rate': self.error_rate,
+            'requests': self.requests,
+            'errors': self.errors,
+            'hedged': self.hedged,
+            'head': self.head,
+            'last_error': self.last_error
+        }
+
+
+class EndpointRegistry:
+    """ Endpoint stats and request pool shared by all routers of the process """
+
+    def __init__(self, endpoints: List[str], timeout: int = RPC_PROVIDER_TIMEOUT) -> None:
+        if not endpoints:
+            raise NoEndpointsError('At least one endpoint is required')
+        self.endpoints = [
+            EndpointStats(endpoint, get_provider(endpoint, timeout=timeout))
+            for endpoint in endpoints
+        ]
+        self.executor = ThreadPoolExecutor(
+            max_workers=4 * len(endpoints),
+            thread_name_prefix='rpc-router'
+        )
+
+    def ranked(self) -> List[EndpointStats]:
+        """ Healthy endpoints ordered by score, all endpoints if none is healthy """
+        heads = [stats.head for stats in self.endpoints if stats.head is not None]
+        best_head = max(heads) if heads else None
+
+        def is_healthy(stats: EndpointStats) -> bool:
+            lagging = best_head is not None and stats.head is not None and \
+                best_head - stats.head > RPC_MAX_BLOCK_LAG
+            return stats.error_rate < RPC_UNHEALTHY_ERROR_RATE and not lagging
+
+        healthy = [stats for stats in self.endpoints if is_healthy(stats)]
+        return sorted(healthy or self.endpoints, key=EndpointStats.score)
+
+
+_registries: Dict[Tuple[int, Tuple[str, ...]], EndpointRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_endpoint_registry(endpoints: List[str]) -> EndpointRegistry:
+    # Each process gets its own registry, executor threads are not inherited on fork
+    key = (os.getpid(), tuple(endpoints))
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = EndpointRegistry(endpoints)
+        return _registries[key]
+
+
+class RpcRouter(BaseProvider):
+    """
+    Web3 provider that spreads requests over several endpoints.
+    Reads go to the endpoint with the best EWMA latency and error rate. A read
+    that is slower than usual is hedged to the next endpoint and the first
+    response wins. Transactions and related reads stick to one endpoint.
+    Inside pin() all requests go to one endpoint and optionally read state
+    at a single block.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        hedge_min_delay: float = RPC_HEDGE_MIN_DELAY,
+        hedge_latency_factor: float = RPC_HEDGE_LATENCY_FACTOR
+    ) -> None:
+        self.endpoint_urls = list(endpoints)
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_latency_factor = hedge_latency_factor
+        self.sticky: Optional[EndpointStats] = None
+        self.local = threading.local()
+        self._pid: Optional[int] = None
+        self._registry: Optional[EndpointRegistry] = None
+
+    @property
+    def registry(self) -> EndpointRegistry:
+        """ Router can be inherited by forked monitors, they use the registry of their process """
+        if self._pid != os.getpid() or self._registry is None:
+            self._registry = get_endpoint_registry(self.endpoint_urls)
+            self._pid = os.getpid()
+            self.sticky = None
+        return self._registry
+
+    @property
+    def endpoints(self) -> List[EndpointStats]:
+        return self.registry.endpoints
+
+    def stats(self) -> List[Dict]:
+        return [stats.to_dict() for stats in self.endpoints]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(
+            stats.provider.is_connected(show_traceback=show_traceback)
+            for stats in self.endpoints
+        )
+
+    def request(self, stats: EndpointStats, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start = time.monotonic()
+        try:
+            response = stats.provider.make_request(method, params)
+        except Exception as err:
+            stats.record_error(err)
+            get_statsd_client().incr(f'admin.rpc.errors.{metric_name(stats.label)}')
+            raise
+        latency = time.monotonic() - start
+        stats.record_success(latency)
+        get_statsd_client().timing(f'admin.rpc.request.{metric_name(stats.label)}', latency * 1000)
+        if method == 'eth_blockNumber' and isinstance(response.get('result'), str):
+            stats.head = int(response['result'], 16)
+        return response
+
+    def hedge_delay(self, stats: EndpointStats) -> float:
+        if stats.latency is None:
+            return max(self.hedge_min_delay, RPC_PROVIDER_TIMEOUT / 4)
+        return max(self.hedge_min_delay, self.hedge_latency_factor * stats.latency)
+
+    def read(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        ranked = self.registry.ranked()
+        primary = ranked[0]
+        if len(ranked) == 1:
+            return self.request(primary, method, params)
+
+        executor = self.registry.executor
+        futures = {executor.submit(self.request, primary, method, params): primary}
+        done, _ = wait(futures, timeout=self.hedge_delay(primary))
+        if not done:
+            hedge = ranked[1]
+            hedge.hedged += 1
+            logger.debug('Hedging %s from %s to %s', method, primary.label, hedge.label)
+            futures[executor.submit(self.request, hedge, method, params)] = hedge
+
+        error: Optional[Exception] = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=RPC_PROVIDER_TIMEOUT, return_when=FIRST_COMPLETED)
+            if not done:
+                error = TimeoutError(f'No response for {method} in {RPC_PROVIDER_TIMEOUT}s')
+                break
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+
+        # All attempted endpoints failed, the rest are tried one by one
+        for stats in ranked:
+            if stats in futures.values():
+                continue
+            try:
+                return self.request(stats, method, params)
+            except Exception as err:
+                error = err
+        raise error
+
+    def write(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        registry = self.registry
+        sticky = self.sticky
+        if sticky is None or sticky.error_rate >= RPC_UNHEALTHY_ERROR_RATE:
+            sticky = self.sticky = registry.ranked()[0]
+        try:
+            return self.request(sticky, method, params)
+        except Exception:
+            self.sticky = None
+            raise
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        pinned = getattr(self.local, 'pinned', None)
+        if pinned is not None:
+            stats, block = pinned
+            return self.request(stats, method, pin_block_param(method, params, block))
+        if method in STICKY_METHODS:
+            return self.write(method, params)
+        return self.read(method, params)
+
+    @contextlib.contextmanager
+    def pin(self, block: bool = True) -> Iterator[Optional[int]]:
+        """
+        Routes requests of the current thread to a single endpoint. If block
+        is True, reads of the latest state are done at the block that was the
+        head when the pin was taken.
+        """
+        if getattr(self.local, 'pinned', None) is not None:
+            yield self.local.pinned[1]
+            return
+        stats = self.registry.ranked()[0]
+        block_number = None
+        if block:
+            response = self.request(stats, RPCEndpoint('eth_blockNumber'), [])
+            block_number = int(response['result'], 16)
+        self.local.pinned = (stats, block_number)
+        try:
+            yield block_number
+        finally:
+            self.local.pinned = None
+
+
+def metric_name(label: str) -> str:
+    return label.replace('.', '_').replace(':', '_')
+
+
+def pin_block_param(method: RPCEndpoint, params: Any, block: Optional[int]) -> Any:
+    index = BLOCK_PARAM_INDEX.get(method)
+    if block is None or index is None or not isinstance(params, (list, tuple)):
+        return params
+    params = list(params)
+    if len(params) <= index:
+        params.extend([None] * (index + 1 - len(params)))
+    if params[index] in (None, 'latest'):
+        params[index] = hex(block)
+    return params
+
+
+def route_web3(web3: Web3, endpoints: List[str] = ENDPOINTS) -> Web3:
+    """ Replaces web3 provider with the router if several endpoints are configured """
+    if len(endpoints) > 1:
+        web3.provider = RpcRouter(endpoints)
+    return web3
+
+
+@contextlib.contextmanager
+def pinned_block(web3: Web3, block: bool = True) -> Iterator[Optional[int]]:
+    if isinstance(web3.provider, RpcRouter):
+        with web3.provider.pin(block=block) as block_number:
+            yield block_number
+    else:
+        yield None
+
+
+def get_rpc_stats() -> List[Dict]:
+    """ Returns stats of the endpoints routed by the current process """
+    pid = os.getpid()
+    with _registries_lock:
+        registries = [registry for (key_pid, _), registry in _registries.items() if key_pid == pid]
+    return [stats.to_dict() for registry in registries for stats in registry.endpoints]
+
+
+# Admin and monitor processes save their stats with the metrics snapshot of each cycle
+add_snapshot_section('rpc', get_rpc_stats)
+
+
+def get_saved_rpc_stats(metrics_dir: str = METRICS_DIR_PATH) -> Dict[str, List[Dict]]:
+    """ Returns endpoint stats saved by other processes, keyed by process name """
+    return {
+        name: snapshot['rpc']
+        for name, snapshot in get_aggregated_metrics(metrics_dir).items()
+        if snapshot.get('rpc')
+    }
+
+
+def aggregate_rpc_stats(stats_by_process: Dict[str, List[Dict]]) -> List[Dict]:
+    """ Sums endpoint stats of all processes, latency is weighted by the number of requests """
+    totals: Dict[str, Dict] = {}
+    for stats_list in stats_by_process.values():
+        for stats in stats_list:
+            total = totals.setdefault(stats['endpoint'], {
+                'endpoint': stats['endpoint'],
+                'latency': None,
+                'requests': 0,
+                'errors': 0,
+                'hedged': 0,
+                'head': None
+            })
+            succeeded = stats['requests'] - stats['errors']
+            if stats['latency'] is not None and succeeded > 0:
+                done = total['requests'] - total['errors']
+                total['latency'] = stats['latency'] if total['latency'] is None else \
+                    (total['latency'] * done + stats['latency'] * succeeded) / (done + succeeded)
+            for key in ('requests', 'errors', 'hedged'):
+                total[key] += stats[key]
+            if stats['head'] is not None:
+                total['head'] = max(total['head'] or 0, stats['head'])
+    return list(totals.values())
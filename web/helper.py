@@ -29,6 +29,7 @@ from skale.utils.web3_utils import init_web3
 
 from core.node_config import NodeConfig
 from tools.helper import init_skale
+from tools.rpc_router import route_web3
 from tools.wallet_utils import init_wallet
 from tools.configs.web3 import ENDPOINT
 
@@ -76,7 +77,7 @@ def init_skale_from_node_config(node_config: NodeConfig) -> Skale:
 def g_web3(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        g.web3 = init_web3(ENDPOINT)
+        g.web3 = route_web3(init_web3(ENDPOINT))
         return func(*args, **kwargs)
     return wrapper
 
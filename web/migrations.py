@@ -30,140 +30,147 @@ from tools.resources import get_database
 logger = logging.getLogger(__name__)
 
 
+SCHAIN_TABLE = 'SChainRecord'
+
+
 def migrate():
     """ This function will include all migrations for the SQLite database
         To add a new field create a new method named `add_FIELD_NAME_field`
-        to this file and run it from `run_migrations` method
+        to this file and append it to `MIGRATIONS`. Data migrations are plain
+        functions with the same signature that update rows instead of columns
     """
     db = get_database()
     migrator = SqliteMigrator(db)
     run_migrations(db, migrator)
 
 
-def run_migrations(db, migrator):
-    logging.info('Running migrations ...')
-    # 1.0 -> 1.2 update fields
-    add_new_schain_field(db, migrator)
-    add_repair_mode_field(db, migrator)
-    add_needs_reload_field(db, migrator)
-
-    # 1.2 -> 2.0 update fields
-    add_monitor_last_seen_field(db, migrator)
-    add_monitor_id_field(db, migrator)
-    add_config_version_field(db, migrator)
+def get_schema_version(db):
+    return db.execute_sql('PRAGMA user_version').fetchone()[0]
 
-    # 2.0 -> 2.1 update fields
-    add_restart_count_field(db, migrator)
-    add_failed_rpc_count_field(db, migrator)
 
-    # 2.1/2.2 -> 2.3/sync update fields
-    add_ssl_change_date_field(db, migrator)
-    # 2.3 -> 2.4 update fields
-    add_failed_snapshot_from(db, migrator)
+def set_schema_version(db, version):
+    db.execute_sql(f'PRAGMA user_version = {int(version)}')
 
-    # 2.4 -> 2.5 update fields
-    add_backup_run_field(db, migrator)
-    add_sync_config_run_field(db, migrator)
 
-    # 2.7 -> 2.8 update fields
-    add_repair_date_field(db, migrator)
+def get_column_names(db, table_name):
+    return {column.name for column in db.get_columns(table_name)}
 
 
-def add_new_schain_field(db, migrator):
+def run_migrations(db, migrator, migrations=None):
+    """ Applies migrations that are newer than the schema version stored
+        in the database. Once the database is current this costs a single
+        PRAGMA query. The table is introspected once and all pending
+        migrations are applied in one transaction together with the version bump
+    """
+    migrations = migrations if migrations is not None else MIGRATIONS
+    target = len(migrations)
+    current = get_schema_version(db)
+    if current >= target:
+        logger.info('Database schema is up to date (version %d)', current)
+        return
+    logger.info('Running migrations %d -> %d ...', current, target)
+    columns = {SCHAIN_TABLE: get_column_names(db, SCHAIN_TABLE)}
+    with db.atomic():
+        for migration in migrations[current:]:
+            migration(db, migrator, columns=columns)
+        set_schema_version(db, target)
+
+
+def add_new_schain_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'new_schain',
-        BooleanField(default=True)
+        db, migrator, SCHAIN_TABLE, 'new_schain',
+        BooleanField(default=True), columns=columns
     )
 
 
-def add_repair_mode_field(db, migrator):
+def add_repair_mode_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'repair_mode',
-        BooleanField(default=False)
+        db, migrator, SCHAIN_TABLE, 'repair_mode',
+        BooleanField(default=False), columns=columns
     )
 
 
-def add_needs_reload_field(db, migrator):
+def add_needs_reload_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'needs_reload',
-        BooleanField(default=False)
+        db, migrator, SCHAIN_TABLE, 'needs_reload',
+        BooleanField(default=False), columns=columns
     )
 
 
-def add_monitor_last_seen_field(db, migrator):
+def add_monitor_last_seen_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'monitor_last_seen',
-        DateTimeField(null=True)
+        db, migrator, SCHAIN_TABLE, 'monitor_last_seen',
+        DateTimeField(null=True), columns=columns
     )
 
 
-def add_monitor_id_field(db, migrator):
+def add_monitor_id_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'monitor_id',
-        IntegerField(default=0)
+        db, migrator, SCHAIN_TABLE, 'monitor_id',
+        IntegerField(default=0), columns=columns
     )
 
 
-def add_config_version_field(db, migrator):
+def add_config_version_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'config_version',
-        CharField(default=DEFAULT_CONFIG_VERSION)
+        db, migrator, SCHAIN_TABLE, 'config_version',
+        CharField(default=DEFAULT_CONFIG_VERSION), columns=columns
     )
 
 
-def add_restart_count_field(db, migrator):
+def add_restart_count_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'restart_count',
-        IntegerField(default=0)
+        db, migrator, SCHAIN_TABLE, 'restart_count',
+        IntegerField(default=0), columns=columns
     )
 
 
-def add_failed_rpc_count_field(db, migrator):
+def add_failed_rpc_count_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'failed_rpc_count',
-        IntegerField(default=0)
+        db, migrator, SCHAIN_TABLE, 'failed_rpc_count',
+        IntegerField(default=0), columns=columns
     )
 
 
-def add_ssl_change_date_field(db, migrator):
+def add_ssl_change_date_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'ssl_change_date',
-        DateTimeField(default=datetime.now())
+        db, migrator, SCHAIN_TABLE, 'ssl_change_date',
+        DateTimeField(default=datetime.now()), columns=columns
     )
 
 
-def add_failed_snapshot_from(db, migrator):
+def add_failed_snapshot_from(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'snapshot_from',
-        CharField(default='')
+        db, migrator, SCHAIN_TABLE, 'snapshot_from',
+        CharField(default=''), columns=columns
     )
 
 
-def add_backup_run_field(db, migrator):
+def add_backup_run_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'backup_run',
-        BooleanField(default=False)
+        db, migrator, SCHAIN_TABLE, 'backup_run',
+        BooleanField(default=False), columns=columns
     )
 
 
-def add_sync_config_run_field(db, migrator):
+def add_sync_config_run_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'sync_config_run',
-        BooleanField(default=False)
+        db, migrator, SCHAIN_TABLE, 'sync_config_run',
+        BooleanField(default=False), columns=columns
     )
 
 
-def add_dkg_step_field(db, migrator):
+def add_dkg_step_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'dkg_step',
-        IntegerField(default=0)
+        db, migrator, SCHAIN_TABLE, 'dkg_step',
+        IntegerField(default=0), columns=columns
     )
 
 
-def add_repair_date_field(db, migrator):
+def add_repair_date_field(db, migrator, columns=None):
     add_column(
-        db, migrator, 'SChainRecord', 'repair_date',
-        DateTimeField(default=datetime.now())
+        db, migrator, SCHAIN_TABLE, 'repair_date',
+        DateTimeField(default=datetime.now()), columns=columns
     )
 
 
@@ -172,10 +179,44 @@ def find_column(db, table_name, column_name):
     return next((x for x in columns if x.name == column_name), None)
 
 
-def add_column(db, migrator, table_name, column_name, field):
-    logging.info(f'Add column: {table_name}.{column_name}')
-    if not find_column(db, table_name, column_name):
-        logging.info(f'Going to add: {table_name}.{column_name}')
+def add_column(db, migrator, table_name, column_name, field, columns=None):
+    if columns is not None:
+        if table_name not in columns:
+            columns[table_name] = get_column_names(db, table_name)
+        table_columns = columns[table_name]
+        exists = column_name in table_columns
+    else:
+        table_columns = None
+        exists = find_column(db, table_name, column_name) is not None
+    if not exists:
+        logger.info(f'Going to add: {table_name}.{column_name}')
         playhouse_migrate(
             migrator.add_column(table_name, column_name, field)
         )
+        if table_columns is not None:
+            table_columns.add(column_name)
+
+
+# Append only: position in the list is the schema version
+MIGRATIONS = [
+    # 1.0 -> 1.2 update fields
+    add_new_schain_field,
+    add_repair_mode_field,
+    add_needs_reload_field,
+    # 1.2 -> 2.0 update fields
+    add_monitor_last_seen_field,
+    add_monitor_id_field,
+    add_config_version_field,
+    # 2.0 -> 2.1 update fields
+    add_restart_count_field,
+    add_failed_rpc_count_field,
+    # 2.1/2.2 -> 2.3/sync update fields
+    add_ssl_change_date_field,
+    # 2.3 -> 2.4 update fields
+    add_failed_snapshot_from,
+    # 2.4 -> 2.5 update fields
+    add_backup_run_field,
+    add_sync_config_run_field,
+    # 2.7 -> 2.8 update fields
+    add_repair_date_field
+]
@@ -32,8 +32,11 @@ from core.schains.firewall.utils import (
     get_default_rule_controller,
     get_sync_agent_ranges
 )
-from core.schains.ima import get_ima_log_checks
+from core.schains.heartbeat import get_heartbeats
+from core.schains.ima import get_cached_ima_log_checks
 from core.schains.external_config import ExternalState
+from tools.metrics import get_aggregated_metrics
+from tools.rpc_router import aggregate_rpc_stats, get_rpc_stats, get_saved_rpc_stats
 from tools.sgx_utils import SGX_CERTIFICATES_FOLDER, SGX_SERVER_URL
 from web.models.schain import SChainRecord
 from web.helper import (
@@ -121,7 +124,7 @@ def ima_log_checks():
     if node_id is None:
         return construct_err_response(status_code=HTTPStatus.BAD_REQUEST,
                                       msg='No node installed')
-    checks = get_ima_log_checks()
+    checks = get_cached_ima_log_checks()
     return construct_ok_response(checks)
 
 
@@ -165,3 +168,26 @@ def check_report():
     logger.debug(request)
     report = get_check_report()
     return construct_ok_response(data=report)
+
+
+@health_bp.route(get_api_url(BLUEPRINT_NAME, 'heartbeats'), methods=['GET'])
+def heartbeats():
+    logger.debug(request)
+    return construct_ok_response(data=get_heartbeats())
+
+
+@health_bp.route(get_api_url(BLUEPRINT_NAME, 'metrics'), methods=['GET'])
+def metrics():
+    logger.debug(request)
+    return construct_ok_response(data=get_aggregated_metrics())
+
+
+@health_bp.route(get_api_url(BLUEPRINT_NAME, 'rpc'), methods=['GET'])
+def rpc():
+    logger.debug(request)
+    processes = get_saved_rpc_stats()
+    processes['api'] = get_rpc_stats()
+    return construct_ok_response(data={
+        'endpoints': aggregate_rpc_stats(processes),
+        'processes': processes
+    })
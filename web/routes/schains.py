@@ -18,9 +18,12 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import time
+from dataclasses import asdict
 
 from flask import Blueprint, g, request
 
+from core.schains.check_history import get_check_history
 from core.schains.config.file_manager import ConfigFileManager
 from core.schains.config.helper import (
     get_base_port_from_config,
@@ -35,6 +38,7 @@ from core.schains.status import init_skaled_status
 from core.schains.ima import get_ima_version_after_migration
 from core.schains.info import get_schain_info_by_name, get_skaled_version
 from core.schains.cleaner import get_schains_on_node
+from tools.configs.schains import CHECK_HISTORY_WINDOW
 from web.models.schain import get_schains_statuses
 from web.helper import (
     construct_ok_response,
@@ -73,7 +77,7 @@ def schain_config():
     schain_name = request.args.get(key)
     if not schain_name:
         return construct_key_error_response([key])
-    config = ConfigFileManager(schain_name).skaled_config
+    config = ConfigFileManager(schain_name).skaled_config_view
     if config is None:
         return construct_err_response(
             msg=f'sChain config not found: {schain_name}'
@@ -115,7 +119,7 @@ def firewall_rules():
         return construct_err_response(
             msg=f'No schain with name {schain_name}'
         )
-    conf = cfm.skaled_config
+    conf = cfm.skaled_config_view
     base_port = get_base_port_from_config(conf)
     node_ips = get_node_ips_from_config(conf)
     own_ip = get_own_ip_from_config(conf)
@@ -153,3 +157,26 @@ def schain_containers_versions():
         'ima_version': get_ima_version_after_migration()
     }
     return construct_ok_response(version_data)
+
+
+@schains_bp.route(get_api_url(BLUEPRINT_NAME, 'check-history'), methods=['GET'])
+def schain_check_history():
+    logger.debug(request)
+    key = 'schain_name'
+    schain_name = request.args.get(key)
+    if not schain_name:
+        return construct_key_error_response([key])
+    try:
+        window = int(request.args.get('window', CHECK_HISTORY_WINDOW))
+    except ValueError:
+        return construct_err_response(msg='window should be a number of seconds')
+    history = get_check_history(schain_name)
+    summary = history.summary(window)
+    response = {
+        'window': window,
+        'summary': {name: check.to_dict() for name, check in summary.items()}
+    }
+    if request.args.get('records') == 'True':
+        since = time.time() - window
+        response['records'] = [asdict(record) for record in history.read(since=since)]
+    return construct_ok_response(response)
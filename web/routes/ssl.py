@@ -24,10 +24,12 @@ import logging
 from dateutil import parser
 from OpenSSL import crypto
 
-from flask import Blueprint, request
+from flask import Blueprint, g, request
 
 from core.nginx import reload_nginx
+from core.schains.cleaner import get_schains_with_containers
 from core.schains.ssl import is_ssl_folder_empty
+from core.schains.ssl_rollout import get_ssl_rollout_state, start_ssl_rollout
 from web.models.schain import set_schains_need_reload
 from web.helper import construct_ok_response, construct_err_response, get_api_url
 from tools.configs import SSL_CERTIFICATES_FILEPATH
@@ -117,7 +119,15 @@ def upload():
     if status == 'error':
         return construct_err_response(msg=CERTS_HAS_INVALID_FORMAT)
 
+    # Rollout goes first, otherwise monitors would see the new cert unscheduled
+    start_ssl_rollout(get_schains_with_containers(g.docker_utils))
     save_cert_key_pair(cert, key)
     set_schains_need_reload()
     reload_nginx()
     return construct_ok_response()
+
+
+@ssl_bp.route(get_api_url(BLUEPRINT_NAME, 'rollout'), methods=['GET'])
+def rollout():
+    logger.debug(request)
+    return construct_ok_response(data=get_ssl_rollout_state())